@@ -0,0 +1,68 @@
+"""
+Compare the throughput of Decimal and float backed measures.
+
+Usage::
+
+    python -m benchmarks.float_backend --number 100000
+"""
+import argparse
+import decimal
+import timeit
+
+from measurement.measures import Distance, Temperature
+
+SCENARIOS = {
+    "construction": (
+        lambda: Distance(decimal.Decimal("1.5"), "mi"),
+        lambda: Distance.float(1.5, "mi"),
+    ),
+    "construction from float": (
+        lambda: Distance(1.5, "mi"),
+        lambda: Distance.float(1.5, "mi"),
+    ),
+    "parsing": (
+        lambda: Distance("1,500.5mi"),
+        lambda: Distance.float("1,500.5mi"),
+    ),
+    "conversion": (
+        lambda d=Distance("1.5 mi"): d.km,
+        lambda d=Distance.float(1.5, "mi"): d.km,
+    ),
+    "converter": (
+        lambda c=Distance.converter("mi", "km"), v=decimal.Decimal("1.5"): c(v),
+        lambda c=Distance.converter("mi", "km"): c(1.5),
+    ),
+    "affine conversion": (
+        lambda t=Temperature("20 °C"): t.fahrenheit,
+        lambda t=Temperature.float(20, "°C"): t.fahrenheit,
+    ),
+    "addition": (
+        lambda a=Distance("1.5 mi"), b=Distance("2 km"): a + b,
+        lambda a=Distance.float(1.5, "mi"), b=Distance.float(2, "km"): a + b,
+    ),
+    "multiplication": (
+        lambda a=Distance("1.5 mi"): a * 3,
+        lambda a=Distance.float(1.5, "mi"): a * 3,
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<24} {'Decimal [µs]':>13} {'float [µs]':>11} {'speedup':>8}")
+    for name, (decimal_stmt, float_stmt) in SCENARIOS.items():
+        times = [
+            min(timeit.repeat(stmt, number=args.number, repeat=3)) / args.number * 1e6
+            for stmt in (decimal_stmt, float_stmt)
+        ]
+        print(
+            f"{name:<24} {times[0]:>13.3f} {times[1]:>11.3f}"
+            f" {times[0] / times[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
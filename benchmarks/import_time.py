@@ -0,0 +1,56 @@
+"""
+Measure the import time of :mod:`measurement.measures` in fresh interpreters.
+
+Usage::
+
+    python -m benchmarks.import_time --runs 20
+
+The import time of every ``measurement`` module is taken from Python's
+``-X importtime`` output and reported as the median over all runs.
+"""
+import argparse
+import collections
+import statistics
+import subprocess  # nosec
+import sys
+
+
+def import_times(module):
+    """Return self and cumulative import time in µs per module of a single run."""
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            times[name.strip()] = int(self_time), int(cumulative)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--module", default="measurement.measures")
+    args = parser.parse_args(argv)
+
+    samples = collections.defaultdict(list)
+    for _ in range(args.runs):
+        for name, times in import_times(args.module).items():
+            samples[name].append(times)
+
+    print(f"{'module':<40} {'self [µs]':>10} {'cumulative [µs]':>16}")
+    for name, times in samples.items():
+        if name.startswith("measurement"):
+            self_time = statistics.median(t[0] for t in times)
+            cumulative = statistics.median(t[1] for t in times)
+            print(f"{name:<40} {self_time:>10.0f} {cumulative:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measure the memory allocated per measure instance with :mod:`tracemalloc`.
+
+Usage::
+
+    python -m benchmarks.memory --count 100000
+
+The footprint of the unit registries is reported as well, after resolving
+all symbols of each measure and the compound symbols of Distance units.
+"""
+import argparse
+import decimal
+import gc
+import sys
+import tracemalloc
+
+from measurement import measures
+from measurement.measures import Distance, Speed, Temperature
+
+CASES = [
+    (Distance, "mi"),
+    (Temperature, "°C"),
+    (Speed, "km/h"),
+]
+
+
+def bytes_per_instance(measure, unit, count):
+    """Return average number of bytes allocated to keep `count` instances alive."""
+    values = [decimal.Decimal(i) for i in range(count)]
+    measure(values[0], unit)  # warm up unit caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [measure(value, unit) for value in values]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # subtract the list holding the instances
+    return (after - before) / len(instances) - 8
+
+
+def registry_symbols(measure):
+    """Return all symbols of the measure, including compound symbols of Distance."""
+    symbols = list(dict.fromkeys(measure.iter_symbols()))
+    if measure is measures.Area:
+        symbols += [f"{symbol}²" for symbol in Distance.iter_symbols()]
+    if measure is measures.Volume:
+        symbols += [f"{symbol}³" for symbol in Distance.iter_symbols()]
+    if measure is measures.Speed:
+        symbols += [
+            f"{numerator}/{denominator}"
+            for numerator in Distance.iter_symbols()
+            for denominator in ["s", "h", "hour"]
+        ]
+    return symbols
+
+
+def registry_footprint(measure):
+    """Return number of symbols, distinct units and bytes of the units of a measure."""
+    units = {}
+    for symbol in registry_symbols(measure):
+        unit = measure._units[symbol]
+        units[id(unit)] = unit
+    size = sum(sys.getsizeof(u) + sys.getsizeof(vars(u)) for u in units.values())
+    return len(registry_symbols(measure)), len(units), size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    print(f"{'measure':<12} {'unit':<6} {'bytes/instance':>15}")
+    for measure, unit in CASES:
+        size = bytes_per_instance(measure, unit, args.count)
+        print(f"{measure.__name__:<12} {unit:<6} {size:>15.1f}")
+
+    print()
+    print(f"{'registry':<20} {'symbols':>8} {'units':>8} {'bytes':>10}")
+    totals = [0, 0, 0]
+    for measure in measures._iter_measures():
+        footprint = registry_footprint(measure)
+        totals = [total + value for total, value in zip(totals, footprint)]
+        symbols, units, size = footprint
+        print(f"{measure.__name__:<20} {symbols:>8} {units:>8} {size:>10}")
+    print(f"{'total':<20} {totals[0]:>8} {totals[1]:>8} {totals[2]:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare the throughput of parallel conversions by number of workers.
+
+Usage::
+
+    python -m benchmarks.parallel --count 1000000 --chunksize 10000 --decimal
+
+Values are converted from miles to kilometres, serially by a converter and
+by :func:`measurement.parallel.convert` on process and thread pools of up to
+one worker per CPU. Pools are started before timing, so that only the
+conversion is measured. Float values are converted, unless ``--decimal``
+is given.
+"""
+import argparse
+import concurrent.futures
+import decimal
+import os
+import random
+import time
+
+from measurement import parallel
+from measurement.measures import Distance
+
+
+def workers(cpus):
+    """Return powers of two up to the number of CPUs, and the number of CPUs."""
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    return sorted({*counts, cpus})
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run_pool(pool, count, values, chunksize):
+    with pool(count) as executor:
+        # start all workers
+        list(executor.map(abs, range(count)))
+        return timed(
+            lambda: list(
+                parallel.convert(
+                    values, Distance, "mi", "km", chunksize=chunksize, executor=executor
+                )
+            )
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--chunksize", type=int, default=parallel.DEFAULT_CHUNKSIZE)
+    parser.add_argument("--decimal", action="store_true")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)  # nosec
+    values = [rng.uniform(0, 1000) for _ in range(args.count)]
+    if args.decimal:
+        values = [decimal.Decimal(f"{value:.3f}") for value in values]
+    converter = Distance.converter("mi", "km")
+    serial = timed(lambda: converter.convert_many(values))
+
+    print(
+        f"{'pool':<10} {'workers':>8} {'time [s]':>9} {'values/s':>12} {'speedup':>8}"
+    )
+    print(
+        f"{'serial':<10} {1:>8} {serial:>9.3f} {args.count / serial:>12.0f} {1:>7.1f}x"
+    )
+    for name, pool in [
+        ("process", concurrent.futures.ProcessPoolExecutor),
+        ("thread", concurrent.futures.ThreadPoolExecutor),
+    ]:
+        for count in workers(os.cpu_count() or 1):
+            duration = run_pool(pool, count, values, args.chunksize)
+            print(
+                f"{name:<10} {count:>8} {duration:>9.3f}"
+                f" {args.count / duration:>12.0f} {serial / duration:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Run benchmarks of the hot paths and compare the results to a baseline.
+
+Usage::
+
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite run --output current.json
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.1
+
+Micro benchmarks time single operations, like constructing a measure or
+converting it to another unit. Macro benchmarks time whole workloads, like
+parsing and summing thousands of measures. All inputs are fixed or drawn
+from a seeded random generator, so runs are reproducible.
+
+Results are stored as JSON, mapping each benchmark to its best time per
+call in seconds. ``compare`` exits with status 1 if any benchmark got
+slower than the baseline by more than the threshold.
+"""
+import argparse
+import dataclasses
+import decimal
+import fnmatch
+import json
+import pickle  # nosec
+import platform
+import random
+import statistics
+import sys
+import timeit
+from typing import Any, Callable, Dict
+
+import measurement
+from benchmarks.import_time import import_times
+from measurement import serialization
+from measurement.base import AbstractMeasure
+from measurement.measures import Area, Distance, Speed, Temperature, Time, Volume
+from measurement.utils import guess, guess_many
+
+
+@dataclasses.dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    """Return the statement to time, called once before timing."""
+
+    number: int
+    """Number of calls per repetition."""
+
+    repeat: int = 5
+
+    def run(self, scale: float = 1.0) -> float:
+        """Return the best time per call in seconds."""
+        stmt = self.setup()
+        number = max(1, int(self.number * scale))
+        return min(timeit.repeat(stmt, number=number, repeat=self.repeat)) / number
+
+
+@dataclasses.dataclass
+class ImportBenchmark(Benchmark):
+    """Time the import of a module in fresh interpreters, see :mod:`.import_time`."""
+
+    def run(self, scale: float = 1.0) -> float:
+        module = self.setup()
+        runs = max(1, int(self.number * scale))
+        cumulative = (import_times(module)[module][1] for _ in range(runs))
+        return statistics.median(cumulative) / 1e6
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name, number, repeat=5, cls=Benchmark):
+    """Register the decorated setup function as benchmark."""
+
+    def decorator(setup):
+        BENCHMARKS[name] = cls(name, setup, number, repeat)
+        return setup
+
+    return decorator
+
+
+@benchmark("micro.init", 100000)
+def init():
+    value = decimal.Decimal("1.5")
+    return lambda: Distance(value, "mi")
+
+
+@benchmark("micro.init.string", 100000)
+def init_string():
+    return lambda: Distance("1.5 mi")
+
+
+@benchmark("micro.init.prefixed", 100000)
+def init_prefixed():
+    value = decimal.Decimal("1.5")
+    return lambda: Distance(value, "km")
+
+
+@benchmark("micro.init.compound", 100000)
+def init_compound():
+    value = decimal.Decimal("1.5")
+    return lambda: Speed(value, "km/h")
+
+
+@benchmark("micro.getattr", 100000)
+def getattr_conversion():
+    distance = Distance("1.5 mi")
+    return lambda: distance.km
+
+
+@benchmark("micro.getattr.compound", 100000)
+def getattr_compound():
+    speed = Speed("10 m/s")
+    return lambda: speed.km__h
+
+
+@benchmark("micro.temperature.init", 100000)
+def temperature_init():
+    value = decimal.Decimal("20")
+    return lambda: Temperature(value, "°F")
+
+
+@benchmark("micro.temperature.getattr", 100000)
+def temperature_getattr():
+    temperature = Temperature("20 °C")
+    return lambda: temperature.fahrenheit
+
+
+@benchmark("micro.add", 100000)
+def add():
+    a, b = Distance("1.5 mi"), Distance("2 km")
+    return lambda: a + b
+
+
+@benchmark("micro.mul", 100000)
+def mul():
+    a, b = Distance("1.5 mi"), Distance("2 km")
+    return lambda: a * b
+
+
+@benchmark("micro.truediv.compound", 100000)
+def truediv_compound():
+    a, b = Distance("1.5 mi"), Time("2 min")
+    return lambda: a / b
+
+
+@benchmark("micro.guess", 100000)
+def guess_unit():
+    return lambda: guess(1, "km")
+
+
+@benchmark("micro.class.fraction", 100)
+def class_fraction():
+    def create():
+        class BenchmarkSpeed(AbstractMeasure, metaclass=type(Speed)):
+            __numerator__ = Distance
+            __denominator__ = Time
+
+    return create
+
+
+@benchmark("micro.class.area", 100)
+def class_area():
+    def create():
+        class BenchmarkArea(AbstractMeasure, metaclass=type(Area)):
+            __factors__ = Distance, Distance
+
+    return create
+
+
+@benchmark("micro.class.volume", 100)
+def class_volume():
+    def create():
+        class BenchmarkVolume(AbstractMeasure, metaclass=type(Volume)):
+            __factors__ = Distance, Distance, Distance
+
+    return create
+
+
+def _lines(count):
+    rng = random.Random(0)  # nosec
+    units = ["m", "km", "mi", "ft", "in", "nmi"]
+    return [f"{rng.uniform(0, 1000):.3f} {rng.choice(units)}" for _ in range(count)]
+
+
+@benchmark("macro.parse_sum", 10, repeat=3)
+def parse_sum():
+    lines = _lines(10000)
+    return lambda: measurement.sum(Distance.parse_many(lines), "m")
+
+
+@benchmark("macro.guess_many", 10, repeat=3)
+def guess_pairs():
+    rng = random.Random(0)  # nosec
+    units = ["m", "km", "g", "kg", "°C", "s", "km/h", "m²", "l"]
+    pairs = [(rng.randint(0, 1000), rng.choice(units)) for _ in range(10000)]
+    return lambda: guess_many(pairs)
+
+
+@benchmark("macro.convert", 10, repeat=3)
+def convert():
+    distances = list(Distance.parse_many(_lines(10000)))
+    return lambda: [d.km for d in distances]
+
+
+@benchmark("macro.accumulate", 10, repeat=3)
+def accumulate():
+    distances = list(Distance.parse_many(_lines(10000)))
+
+    def stmt():
+        total = Distance(m=0)
+        for distance in distances:
+            total += distance
+        return total
+
+    return stmt
+
+
+@benchmark("macro.pickle", 10, repeat=3)
+def pickle_many():
+    distances = list(Distance.parse_many(_lines(10000)))
+    return lambda: pickle.loads(pickle.dumps(distances))  # nosec
+
+
+@benchmark("macro.dumps_many", 10, repeat=3)
+def dumps_loads_many():
+    distances = list(Distance.parse_many(_lines(10000)))
+    return lambda: serialization.loads_many(serialization.dumps_many(distances))
+
+
+@benchmark("macro.import", 10, cls=ImportBenchmark)
+def import_measures():
+    return "measurement.measures"
+
+
+def run(pattern="*", scale=1.0) -> Dict[str, Any]:
+    """Return metadata and results of all benchmarks matching the pattern."""
+    results = {}
+    for name, bench in BENCHMARKS.items():
+        if fnmatch.fnmatch(name, pattern):
+            results[name] = bench.run(scale)
+            print(f"{name:<28} {results[name] * 1e6:>12.3f} µs", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "measurement": measurement.__version__,
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float], threshold: float):
+    """Return ratio of the current to the baseline time and its status per benchmark."""
+    comparison = {}
+    for name in baseline.keys() & current.keys():
+        ratio = current[name] / baseline[name]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = ""
+        comparison[name] = ratio, status
+    return dict(sorted(comparison.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("--output", "-o", type=argparse.FileType("w"))
+    run_parser.add_argument("--pattern", "-k", default="*")
+    run_parser.add_argument("--scale", type=float, default=1.0)
+    compare_parser = subparsers.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("baseline", type=argparse.FileType())
+    compare_parser.add_argument("current", type=argparse.FileType())
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.pattern, args.scale)
+        json.dump(report, args.output or sys.stdout, indent=2)
+        return 0
+
+    baseline = json.load(args.baseline)["results"]
+    current = json.load(args.current)["results"]
+    comparison = compare(baseline, current, args.threshold)
+    print(f"{'benchmark':<28} {'baseline [µs]':>14} {'current [µs]':>13} {'ratio':>6}")
+    for name, (ratio, status) in comparison.items():
+        print(
+            f"{name:<28} {baseline[name] * 1e6:>14.3f} {current[name] * 1e6:>13.3f}"
+            f" {ratio:>6.2f} {status}"
+        )
+    return int(any(status == "regression" for _, status in comparison.values()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
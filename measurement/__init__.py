@@ -1,6 +1,10 @@
 """Easily use and manipulate unit-aware measurements in Python."""
 
 from . import _version
+from .utils import max, mean, min, sum  # noqa: F401
+
+# sum, min and max would shadow the built-ins on star imports.
+__all__ = ["VERSION", "mean"]
 
 __version__ = _version.version
 VERSION = _version.version_tuple
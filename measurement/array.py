@@ -0,0 +1,294 @@
+"""
+Vectorized storage and conversion of measures backed by NumPy.
+
+This module requires NumPy, which can be installed via the ``numpy`` extra::
+
+    python3 -m pip install measurement[numpy]
+"""
+import decimal
+import numbers
+import operator
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "MeasureArray requires NumPy: python3 -m pip install measurement[numpy]"
+    ) from e
+
+from measurement.base import AbstractMeasure, measure_index, qualname
+
+__all__ = ["MeasureArray"]
+
+
+class MeasureArray:
+    """
+    Array of measures of the same type, backed by a NumPy array of SI values.
+
+    The values are given in the given unit, or the SI unit if no unit is given.
+    Conversions, arithmetic and comparisons are vectorized:
+
+        >>> from measurement.array import MeasureArray
+        >>> from measurement.measures import Distance
+        >>> distances = MeasureArray(Distance, [1, 2, 3], "km")
+        >>> distances.m
+        array([1000., 2000., 3000.])
+        >>> distances["mi"] > 1
+        array([False,  True,  True])
+        >>> distances * MeasureArray(Distance, [1, 2, 3], "m")
+        MeasureArray(Area, [1000.0, 4000.0, 9000.0], 'metre²')
+        >>> distances.sum()
+        Distance(metre="6000.0")
+
+    Unit factors are taken from the measure's registry, thus every unit
+    of the measure is supported. Single items are returned as float backed
+    measures, see :meth:`AbstractMeasure.float<measurement.base.AbstractMeasure.float>`.
+    Products and quotients of two measures have the same result measure as
+    their scalar counterparts, see
+    :meth:`MeasureIndex.product<measurement.base.MeasureIndex.product>`.
+    """
+
+    __slots__ = ("measure", "unit", "symbol", "si_values")
+
+    __array_ufunc__ = None
+    """Make NumPy defer binary operations with arrays to this class."""
+
+    __hash__ = None
+
+    def __init__(self, measure, values, unit=None):
+        self.measure = measure
+        if unit is None:
+            self.unit, self.symbol = _si_unit(measure)
+            self.si_values = np.asarray(values, dtype=float)
+        else:
+            self.symbol, self.unit = measure._units.find(unit)
+            self.si_values = _to_si(self.unit, np.asarray(values, dtype=float))
+
+    @classmethod
+    def from_measures(cls, measures, measure=None):
+        """Return array of the given measure instances, in the unit of the first one."""
+        measures = list(measures)
+        if measure is None:
+            measure = type(measures[0])
+        for m in measures:
+            if not isinstance(m, measure):
+                raise TypeError(
+                    f"expected type '{qualname(measure)}' not '{qualname(m)}'"
+                )
+        array = cls._from_si(
+            measure,
+            np.fromiter((float(m.si_value) for m in measures), float, len(measures)),
+        )
+        if measures:
+            array.unit, array.symbol = measures[0].unit, measures[0].symbol
+        return array
+
+    @classmethod
+    def _from_si(cls, measure, si_values, unit=None, symbol=None):
+        array = object.__new__(cls)
+        array.measure = measure
+        if unit is None:
+            unit, symbol = _si_unit(measure)
+        array.unit = unit
+        array.symbol = symbol
+        array.si_values = si_values
+        return array
+
+    def _replace(self, si_values):
+        return self._from_si(self.measure, si_values, self.unit, self.symbol)
+
+    def to(self, unit):
+        """Return :class:`numpy.ndarray` of all values in the given unit."""
+        _, unit = self.measure._units.find(unit)
+        return _from_si(unit, self.si_values)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.to(name)
+        except KeyError as e:
+            raise AttributeError(
+                f"{qualname(self)} of {qualname(self.measure)} has no attribute '{name}'"
+            ) from e
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return self.to(key)
+            except KeyError as e:
+                raise KeyError(
+                    f"{qualname(self)} of {qualname(self.measure)} has no key '{key}'"
+                ) from e
+        if isinstance(key, (numbers.Integral, np.integer)):
+            return self.measure._from_si(
+                float(self.si_values[key]), self.unit, self.symbol
+            )
+        return self._replace(self.si_values[key])
+
+    def __len__(self):
+        return len(self.si_values)
+
+    def __iter__(self):
+        for si_value in self.si_values.tolist():
+            yield self.measure._from_si(si_value, self.unit, self.symbol)
+
+    def __repr__(self):
+        values = _from_si(self.unit, self.si_values).tolist()
+        return f"{qualname(self)}({qualname(self.measure)}, {values}, {self.symbol!r})"
+
+    def _other_si(self, other):
+        """Return SI values of an operand of the same measure, or ``None``."""
+        if isinstance(other, MeasureArray) and issubclass(other.measure, self.measure):
+            return other.si_values
+        if isinstance(other, self.measure):
+            return float(other.si_value)
+        return None
+
+    def __add__(self, other):
+        return self._sum(operator.add, other)
+
+    def __sub__(self, other):
+        return self._sum(operator.sub, other)
+
+    def _sum(self, op, other):
+        """
+        Return ``op(self, other)`` for addition or subtraction.
+
+        The result has the measure and unit of the same operation of two single
+        measures, thus measures that override it, like adding a
+        :class:`~measurement.measures.TemperatureDifference` to a
+        :class:`~measurement.measures.Temperature`, behave the same way.
+        """
+        if isinstance(other, MeasureArray):
+            other_si = other.si_values
+            other = other.measure._from_si(0.0, other.unit, other.symbol)
+        elif isinstance(other, AbstractMeasure):
+            other_si = float(other.si_value)
+        else:
+            return NotImplemented
+        result = op(self.measure._from_si(0.0, self.unit, self.symbol), other)
+        si_values = op(self.si_values, other_si)
+        if type(result) is self.measure:
+            return self._replace(si_values)
+        return self._from_si(type(result), si_values, result.unit, result.symbol)
+
+    def __mul__(self, other):
+        return self._product(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._product(operator.mul, other)
+
+    def __truediv__(self, other):
+        si_values = self._other_si(other)
+        if si_values is not None:
+            return self.si_values / si_values
+        return self._product(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._product(operator.truediv, other, reflected=True)
+
+    def _product(self, op, other, reflected=False):
+        """Return ``op(self, other)``, or ``op(other, self)`` if reflected."""
+        if _is_scalar(other):
+            if reflected:
+                return NotImplemented
+            if isinstance(other, decimal.Decimal):
+                other = float(other)
+            return self._replace(op(self.si_values, other))
+        if isinstance(other, MeasureArray):
+            other_measure, other_si = other.measure, other.si_values
+        elif isinstance(other, AbstractMeasure):
+            other_measure, other_si = type(other), float(other.si_value)
+        else:
+            return NotImplemented
+        measures = [self.measure, other_measure]
+        operands = [self.si_values, other_si]
+        if reflected:
+            measures.reverse()
+            operands.reverse()
+        try:
+            result = measure_index.product(*measures, op)
+        except KeyError:
+            return NotImplemented
+        si_values = op(*operands)
+        if result is None:
+            return si_values
+        return self._from_si(result, si_values)
+
+    def _compare(self, op, other):
+        si_values = self._other_si(other)
+        if si_values is None:
+            return NotImplemented
+        return op(self.si_values, si_values)
+
+    def __eq__(self, other):
+        return self._compare(operator.eq, other)
+
+    def __ne__(self, other):
+        return self._compare(operator.ne, other)
+
+    def __lt__(self, other):
+        return self._compare(operator.lt, other)
+
+    def __le__(self, other):
+        return self._compare(operator.le, other)
+
+    def __gt__(self, other):
+        return self._compare(operator.gt, other)
+
+    def __ge__(self, other):
+        return self._compare(operator.ge, other)
+
+    def _reduce(self, func):
+        return self.measure._from_si(
+            float(func(self.si_values)), *_si_unit(self.measure)
+        )
+
+    def sum(self):
+        """Return sum of all values as a float backed measure."""
+        return self._reduce(np.sum)
+
+    def mean(self):
+        """Return arithmetic mean of all values as a float backed measure."""
+        return self._reduce(np.mean)
+
+    def min(self):
+        """Return smallest value as a float backed measure."""
+        return self._reduce(np.min)
+
+    def max(self):
+        """Return largest value as a float backed measure."""
+        return self._reduce(np.max)
+
+
+def _is_scalar(value):
+    return isinstance(value, (numbers.Number, np.ndarray)) and not isinstance(
+        value, bool
+    )
+
+
+def _si_unit(measure):
+    """Return unit and symbol of the measure's SI unit."""
+    symbol = measure._si_symbol()
+    return measure._units[symbol], symbol
+
+
+def _to_si(unit, values):
+    factor = getattr(unit, "float_factor", None)
+    if factor is not None:
+        if unit.float_offset:
+            return (values + unit.float_offset) * factor
+        return values * factor
+    return np.vectorize(lambda value: unit.to_si(float(value)), otypes=[float])(values)
+
+
+def _from_si(unit, si_values):
+    factor = getattr(unit, "float_factor", None)
+    if factor is not None:
+        if unit.float_offset:
+            return si_values / factor - unit.float_offset
+        return si_values / factor
+    return np.vectorize(lambda value: unit.from_si(float(value)), otypes=[float])(
+        si_values
+    )
@@ -1,9 +1,18 @@
 """Collection of helpers and base classes to build measure."""
 import abc
+import builtins
+import copy
 import dataclasses
 import decimal
+import fractions
+import functools
 import inspect
+import numbers
+import operator
+import re
+import typing
 import warnings
+import weakref
 from functools import total_ordering
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
@@ -12,6 +21,61 @@ def qualname(obj: Any) -> str:
     return obj.__qualname__ if inspect.isclass(obj) else type(obj).__qualname__
 
 
+MEASURE_PATTERN = re.compile(
+    r"""
+    \s*
+    (?P<value>
+        [+-]?
+        (?:
+            (?:\d{1,3}(?:,\d{3})+|\d[\d_]*)(?:\.\d*)?  # optional thousands separators
+            |\.\d+
+        )
+        (?:e[+-]?\d+)?
+        |[+-]?(?:nan|inf(?:inity)?)
+    )
+    \s*
+    (?P<unit>[^\d\s.,].*?)
+    \s*
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+"""Pattern of a measure string, like ``12.5 km``, ``1,200m`` or ``5e3 m/s``."""
+
+
+def parse_measure(string: str, to_number=decimal.Decimal) -> Tuple[Any, str]:
+    """
+    Return value and unit symbol of a measure string, like ``"1,234.5 km"``.
+
+    The space between value and unit is optional. Thousands separators are
+    removed before the value is converted via ``to_number``. Powers,
+    like ``m^2``, are returned as ``m²`` and spaces around a ``/`` are
+    removed, like ``m / s`` becomes ``m/s``.
+
+        >>> parse_measure("1,234.5km")
+        (Decimal('1234.5'), 'km')
+        >>> parse_measure("5 m / s^2", float)
+        (5.0, 'm/s²')
+
+    Raises:
+        ValueError: If the string is not a number followed by a unit.
+    """
+    parts = string.split(maxsplit=1)
+    try:
+        value, unit = parts
+        value, unit = to_number(value), unit.rstrip()
+    except (ArithmeticError, ValueError):
+        match = MEASURE_PATTERN.fullmatch(string)
+        if match is None:
+            raise ValueError(f"can't parse measure from '{string}'") from None
+        value, unit = match.group("value", "unit")
+        value = to_number(value.replace(",", ""))
+    if "^" in unit:
+        unit = unit.replace("^2", "²").replace("^3", "³")
+    if "/" in unit and " " in unit:
+        unit = re.sub(r"\s*/\s*", "/", unit)
+    return value, unit
+
+
 class ImmutableKeyDict(Dict):
     """Like :class:`.dict` but any key may only assigned to a value once."""
 
@@ -22,11 +86,110 @@ class ImmutableKeyDict(Dict):
         Raises:
             KeyError: If key has been already assigned to a different item.
         """
-        if key in self.keys() and value is not self[key]:
-            raise KeyError(f"Key '{key}' already exists with value '{self[key]}'.")
+        existing = dict.get(self, key, value)
+        if existing is not value:
+            raise KeyError(f"Key '{key}' already exists with value '{existing}'.")
         dict.__setitem__(self, key, value)
 
 
+class UnitRegistry(ImmutableKeyDict):
+    """
+    Like :class:`.ImmutableKeyDict` but resolves unknown symbols on demand.
+
+    Measures may define far more symbols than are practical to store,
+    e.g. ``km`` for metric prefixes or ``km/h`` for compound measures.
+    Only the measure's own units are stored, any other symbol is passed to
+    the ``resolver`` on lookup. The results are kept in a cache of up to
+    ``maxsize`` symbols.
+
+    Attribute names, like ``sq_ft`` or ``km__h``, are translated to symbols
+    by the ``normalizer`` and looked up via :meth:`find`. The outcome, found
+    or not, is kept in a separate cache of up to ``maxsize`` names.
+
+    Resolved units are frozen with the given decimal ``context``,
+    see :meth:`AbstractUnit.freeze`, and interned: a resolved :class:`.Unit`
+    is replaced by an equivalent one of the same name and factor, if any
+    is stored or has been resolved before. Thus, aliases like ``km`` and
+    ``kilometre`` share a single unit.
+    """
+
+    index: Optional["UnitIndex"] = None
+    """:class:`.UnitIndex` of the stored units, reset whenever a unit is added."""
+
+    measure: Optional["MeasureBase"] = None
+    """Measure the units belong to, if the registry is owned by a measure."""
+
+    def __init__(
+        self,
+        *args,
+        resolver=None,
+        normalizer=None,
+        context=None,
+        maxsize=1024,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.resolver = resolver
+        self.normalizer = normalizer
+        self.context = context
+        self._interned = {}
+        for unit in dict.values(self):
+            self.intern(unit)
+        self.resolve = functools.lru_cache(maxsize=maxsize)(self._resolve)
+        self.resolve_name = functools.lru_cache(maxsize=maxsize)(self._resolve_name)
+
+    def _resolve(self, key):
+        unit = self.resolver(key) if self.resolver is not None else None
+        return self.intern(unit.freeze(self.context)) if unit is not None else None
+
+    def intern(self, unit: "AbstractUnit") -> "AbstractUnit":
+        """Return the first given :class:`.Unit` of the same name and factor."""
+        if type(unit) is not Unit:
+            return unit
+        return self._interned.setdefault((unit.name, unit.factor), unit)
+
+    def _resolve_name(self, name):
+        symbol = self.normalizer(name) if self.normalizer is not None else name
+        return symbol, self.get(symbol)
+
+    def find(self, name: str) -> Tuple[str, "AbstractUnit"]:
+        """
+        Return symbol and unit for an attribute name or symbol.
+
+        Raises:
+            KeyError: If no unit matches the name.
+        """
+        symbol, unit = self.resolve_name(name)
+        if unit is None:
+            raise KeyError(symbol)
+        return symbol, unit
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.intern(value)
+        self.index = None
+        self.resolve_name.cache_clear()
+
+    def __missing__(self, key):
+        unit = self.resolve(key)
+        if unit is None:
+            raise KeyError(key)
+        return unit
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class AbstractUnit(abc.ABC):
     """
     Helper class to define units of measurement in relation to their SI definition.
@@ -37,6 +200,39 @@ class AbstractUnit(abc.ABC):
 
     name = None
 
+    context: Optional[decimal.Context] = None
+    """
+    Context of :class:`Decimal<decimal.Decimal>` conversions,
+    the current context is used if ``None``.
+    """
+
+    _frozen = False
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise dataclasses.FrozenInstanceError(f"cannot assign to field '{name}'")
+        super().__setattr__(name, value)
+
+    def freeze(self, context: Optional[decimal.Context] = None) -> "AbstractUnit":
+        """
+        Make the unit immutable and return it.
+
+        Units are frozen once they are registered by a measure,
+        since they are shared between all instances of the measure.
+        Measures register copies of the units they are defined with.
+        The measure's :attr:`~AbstractMeasure.decimal_context` is
+        passed as ``context``. Units that are already frozen keep theirs.
+        """
+        if not self._frozen:
+            if context is not None:
+                self.context = context
+            object.__setattr__(self, "_frozen", True)
+        return self
+
+    def get_context(self) -> decimal.Context:
+        """Return :attr:`context` or the current context if there is none."""
+        return self.context or decimal.getcontext()
+
     @abc.abstractmethod
     def to_si(self, value: decimal.Decimal) -> decimal.Decimal:
         """Return SI measure based on given value in the unit defined by this class."""
@@ -82,30 +278,72 @@ class Unit(AbstractUnit):
     MetricUnit, as demonstrated below, allowing it to use all of the metric prefixes.
     """
 
-    factor: Union[str, decimal.Decimal] = None
+    factor: Union[str, decimal.Decimal, fractions.Fraction] = None
     """
     Factor of given measure based on SI unit.
 
     The given value must be either a :class:`Decimal<decimal.Decimal>`
-    or a string that can be used to construct a decimal.
+    or a string that can be used to construct a decimal. It may also be
+    a :class:`~fractions.Fraction`, see :attr:`ratio`.
     """
 
     symbols: List[str] = dataclasses.field(default_factory=list)
     """Symbols used to describe this unit."""
 
+    offset = decimal.Decimal(0)
+    """Value of the SI unit's zero point in this unit, see :class:`.AffineUnit`."""
+
+    float_offset = 0.0
+
+    ratio = None
+    """
+    Factor given as :class:`~fractions.Fraction`, if any.
+
+    :class:`Decimal<decimal.Decimal>` values are then multiplied by its
+    numerator and divided by its denominator, so that factors like 5/9
+    convert back and forth without rounding errors.
+    """
+
     def __post_init__(self):
+        if isinstance(self.factor, fractions.Fraction):
+            self.ratio = self.factor
+            self.factor = decimal.Decimal(self.ratio.numerator) / self.ratio.denominator
         if self.factor is not None:
             self.factor = decimal.Decimal(self.factor)
+            self.float_factor = float(self.factor)
+
+    def freeze(self, context=None):
+        """Like :meth:`AbstractUnit.freeze` but round the factor to the context."""
+        if context is not None and not self._frozen and self.factor is not None:
+            self.factor = context.plus(self.factor)
+        return super().freeze(context)
 
     def to_si(self, value):
-        return value * self.factor
+        if isinstance(value, float):
+            return value * self.float_factor
+        if self.ratio is not None:
+            context = self.get_context()
+            value = context.multiply(value, self.ratio.numerator)
+            return context.divide(value, self.ratio.denominator)
+        if self.context is None:
+            return value * self.factor
+        return self.context.multiply(value, self.factor)
 
     def from_si(self, value):
-        return value / self.factor
+        if isinstance(value, float):
+            return value / self.float_factor
+        if self.ratio is not None:
+            context = self.get_context()
+            value = context.multiply(value, self.ratio.denominator)
+            return context.divide(value, self.ratio.numerator)
+        if self.context is None:
+            return value / self.factor
+        return self.context.divide(value, self.factor)
 
     def get_symbols(self):
-        yield self.name.replace("_", " "), Unit(self.factor)
-        yield from ((name, Unit(self.factor)) for name in self.symbols)
+        unit = Unit(self.ratio or self.factor)
+        yield self.name.replace("_", " "), unit
+        yield from ((name, unit) for name in self.symbols)
 
 
 @dataclasses.dataclass
@@ -136,6 +374,9 @@ class MetricUnit(Unit):
 
     The fourth argument is metric_prefix, a list of symbols that are used with full
     words metric prefixes, such as ``metre`` for ``kilometre``.
+
+    Metric prefixed symbols are not stored by the measure but resolved when
+    they are looked up, see :meth:`resolve_prefix`.
     """
 
     small_metric_symbol: List[str] = dataclasses.field(default_factory=list)
@@ -150,6 +391,7 @@ class MetricUnit(Unit):
         "n": decimal.Decimal("1e-9"),
         "u": decimal.Decimal("1e-6"),
         "μ": decimal.Decimal("1e-6"),
+        "µ": decimal.Decimal("1e-6"),
         "m": decimal.Decimal("1e-3"),
         "c": decimal.Decimal("1e-2"),
         "d": decimal.Decimal("1e-1"),
@@ -190,22 +432,457 @@ class MetricUnit(Unit):
 
     def get_symbols(self):
         yield from super().get_symbols()
+
+    def iter_prefixed_symbols(self) -> typing.Iterator[str]:
+        """Yield all metric prefixed symbols, without creating their units."""
+        yield from (
+            f"{prefix}{s}"
+            for prefix in self.SI_PREFIXE_SYMBOLS
+            for s in self.small_metric_symbol
+        )
         yield from (
-            (f"{prefix}{s}", Unit(factor=self.factor * factor))
+            f"{prefix}{s}" for prefix in self.SI_PREFIXES for s in self.metric_prefix
+        )
+        yield from (
+            f"{prefix}{s}".title()
+            for prefix in self.SI_PREFIXES
+            for s in self.metric_prefix
+        )
+
+    def get_prefixed_symbols(self):
+        """Return all metric prefixed symbols and their :class:`.Unit` representation."""
+        yield from (
+            (f"{prefix}{s}", self.prefixed(factor))
             for prefix, factor in self.SI_PREFIXE_SYMBOLS.items()
             for s in self.small_metric_symbol
         )
         yield from (
-            (f"{prefix}{s}", Unit(factor=self.factor * factor))
+            (f"{prefix}{s}", self.prefixed(factor))
             for prefix, factor in self.SI_PREFIXES.items()
             for s in self.metric_prefix
         )
         yield from (
-            (f"{prefix}{s}".title(), Unit(factor=self.factor * factor))
+            (f"{prefix}{s}".title(), self.prefixed(factor))
             for prefix, factor in self.SI_PREFIXES.items()
             for s in self.metric_prefix
         )
 
+    def resolve_prefix(self, symbol: str) -> Optional[Unit]:
+        """
+        Return :class:`.Unit` for a metric prefixed symbol, like ``km`` or ``Kilometre``.
+
+        The symbol is split into a metric prefix and a symbol of this unit,
+        ``None`` is returned if the symbol can not be split.
+        """
+        for length in (1, 2):
+            prefix, base = symbol[:length], symbol[length:]
+            if prefix in self.SI_PREFIXE_SYMBOLS and base in self.small_metric_symbol:
+                return self.prefixed(self.SI_PREFIXE_SYMBOLS[prefix])
+        for length in (3, 4, 5):
+            prefix, base = symbol[:length], symbol[length:]
+            if prefix in self.SI_PREFIXES and base in self.metric_prefix:
+                return self.prefixed(self.SI_PREFIXES[prefix])
+            prefix = prefix.lower()
+            if prefix in self.SI_PREFIXES and any(
+                f"{prefix}{s}".title() == symbol for s in self.metric_prefix
+            ):
+                return self.prefixed(self.SI_PREFIXES[prefix])
+        return None
+
+    def prefixed(self, factor: decimal.Decimal) -> Unit:
+        unit = Unit(factor=self.factor * factor)
+        unit.name = self.name
+        return unit
+
+
+@dataclasses.dataclass
+class AffineUnit(Unit):
+    """
+    Like :class:`.Unit` but with a zero point different from the SI unit's.
+
+    A value is converted to the SI unit as ``(value + offset) * factor``,
+    thus the offset is the value of the SI unit's zero point in this unit.
+
+    Usage::
+
+        from measurements.base import AbstractMeasure, AffineUnit, MetricUnit
+
+
+        class Temperature(AbstractMeasure):
+            kelvin = MetricUnit("1", ["K"], ["K"], ["kelvin"])
+            celsius = AffineUnit("1", ["°C"], offset="273.15")
+            fahrenheit = AffineUnit(fractions.Fraction(5, 9), ["°F"], offset="459.67")
+
+    Like for a :class:`.Unit`, the factor may also be given as a
+    :class:`~fractions.Fraction`, so that values like 212 °F convert back
+    and forth without rounding errors.
+
+    Unlike the factor, the offset is not rounded to the measure's
+    :attr:`~AbstractMeasure.decimal_context`, since zero points are exact
+    by definition.
+    """
+
+    offset: Union[str, decimal.Decimal] = decimal.Decimal(0)
+    """Value of the SI unit's zero point in this unit, like ``459.67`` for °F."""
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.offset = decimal.Decimal(self.offset)
+        self.float_offset = float(self.offset)
+
+    def to_si(self, value):
+        if isinstance(value, float):
+            return (value + self.float_offset) * self.float_factor
+        context = self.get_context()
+        value = context.add(value, self.offset)
+        if self.ratio is None:
+            return context.multiply(value, self.factor)
+        value = context.multiply(value, self.ratio.numerator)
+        return context.divide(value, self.ratio.denominator)
+
+    def from_si(self, value):
+        if isinstance(value, float):
+            return value / self.float_factor - self.float_offset
+        context = self.get_context()
+        if self.ratio is None:
+            value = context.divide(value, self.factor)
+        else:
+            value = context.multiply(value, self.ratio.denominator)
+            value = context.divide(value, self.ratio.numerator)
+        return context.subtract(value, self.offset)
+
+    def get_symbols(self):
+        unit = AffineUnit(self.ratio or self.factor, offset=self.offset)
+        yield self.name.replace("_", " "), unit
+        yield from ((name, unit) for name in self.symbols)
+
+
+@dataclasses.dataclass(frozen=True)
+class UnitIndex:
+    """Metadata of the units stored by a measure, computed once per measure class."""
+
+    base_unit_names: Optional[Tuple[str, ...]]
+    """Symbols of all units with a factor of 1 and no offset (base units)."""
+
+    @classmethod
+    def build(cls, units: Dict[str, AbstractUnit]) -> "UnitIndex":
+        base_unit_names = tuple(
+            symbol
+            for symbol, unit in units.items()
+            if getattr(unit, "factor", None) == 1 and not getattr(unit, "offset", None)
+        )
+        return cls(base_unit_names=base_unit_names or None)
+
+
+class Converter:
+    """
+    Convert plain values from one unit of a measure to another.
+
+    Both units are resolved once, when the converter is created via
+    :meth:`AbstractMeasure.converter`. Values are converted without
+    constructing a measure for each of them:
+
+        >>> from measurement import measures
+        >>> mi_to_km = measures.Distance.converter("mi", "km")
+        >>> mi_to_km(1)
+        Decimal('1.609344')
+        >>> mi_to_km.convert_many([1.0, 2.0])
+        [1.609344, 3.218688]
+
+    :class:`Decimal<decimal.Decimal>`, :class:`int` and :class:`str` values are
+    converted like they would be by a measure. :class:`float` values are
+    converted in floating point, like :meth:`AbstractMeasure.float` measures.
+
+    Conversions of floats between two :class:`.Unit` or :class:`.AffineUnit`
+    instances, like °F to °C, are folded into a single multiply-add.
+    """
+
+    __slots__ = (
+        "measure",
+        "from_symbol",
+        "to_symbol",
+        "from_unit",
+        "to_unit",
+        "_factor",
+        "_divisor",
+        "_float_factor",
+        "_float_offset",
+    )
+
+    def __init__(
+        self,
+        measure: Type["AbstractMeasure"],
+        from_symbol: str,
+        from_unit: AbstractUnit,
+        to_symbol: str,
+        to_unit: AbstractUnit,
+    ):
+        self.measure = measure
+        self.from_symbol = from_symbol
+        self.from_unit = from_unit
+        self.to_symbol = to_symbol
+        self.to_unit = to_unit
+        self._factor = self._divisor = self._float_factor = self._float_offset = None
+        if isinstance(from_unit, Unit) and isinstance(to_unit, Unit):
+            self._float_factor = from_unit.float_factor / to_unit.float_factor
+            # (value + a) * f1 / f2 - b == value * f1 / f2 + (a * f1 / f2 - b)
+            self._float_offset = (
+                from_unit.float_offset * self._float_factor - to_unit.float_offset
+            )
+            # Decimals of affine units and exact ratios are converted via the SI unit.
+            if not (from_unit.offset or to_unit.offset) and not (
+                from_unit.ratio or to_unit.ratio
+            ):
+                self._factor = from_unit.factor
+                self._divisor = to_unit.factor
+
+    def convert(self, value: Union[decimal.Decimal, float, int, str]):
+        """Return the given value converted to the target unit."""
+        if isinstance(value, float):
+            if self._float_factor is not None:
+                return value * self._float_factor + self._float_offset
+        else:
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(value)
+            if self._factor is not None:
+                context = self.measure.decimal_context
+                if context is None:
+                    return value * self._factor / self._divisor
+                value = context.multiply(value, self._factor)
+                return context.divide(value, self._divisor)
+        return self.to_unit.from_si(self.from_unit.to_si(value))
+
+    __call__ = convert
+
+    def convert_many(self, values: Iterable, out=None):
+        """
+        Return a list of all given values converted to the target unit.
+
+        If ``out`` is given, the converted values are written to it
+        instead and ``out`` is returned. This way a preallocated list,
+        :class:`array.array` or NumPy array can be reused for every batch.
+        """
+        convert = self.convert
+        if out is None:
+            return [convert(value) for value in values]
+        for i, value in enumerate(values):
+            out[i] = convert(value)
+        return out
+
+    def __repr__(self):
+        return (
+            f"{qualname(self)}({qualname(self.measure)},"
+            f" {self.from_symbol!r}, {self.to_symbol!r})"
+        )
+
+
+class Dimension(typing.NamedTuple):
+    """
+    Exponents of the SI base quantities of a measure.
+
+    Multiplying or dividing two measures adds or subtracts their exponents:
+
+        >>> Dimension(length=1) / Dimension(time=1) == Dimension(length=1, time=-1)
+        True
+    """
+
+    length: int = 0
+    mass: int = 0
+    time: int = 0
+    current: int = 0
+    temperature: int = 0
+    amount: int = 0
+    luminosity: int = 0
+
+    def __mul__(self, other):
+        return Dimension(*map(operator.add, self, other))
+
+    def __truediv__(self, other):
+        return Dimension(*map(operator.sub, self, other))
+
+    def __pow__(self, power):
+        return Dimension(*(exponent * power for exponent in self))
+
+
+DIMENSIONLESS = Dimension()
+"""Dimension of plain numbers, like the product of a frequency and a time."""
+
+
+def _dimensionless():
+    """Stand in for the reference to the measure of a dimensionless product."""
+    return None
+
+
+class MeasureIndex:
+    """
+    Index of all measures, to find the measures accepting a unit symbol.
+
+    Every measure is added by :class:`.MeasureBase` when it is created.
+    Like :meth:`type.__subclasses__`, the index only holds weak references,
+    so measures that are no longer used are removed. Lookups are cached per
+    symbol, including symbols no measure accepts. The cache of up to
+    ``maxsize`` symbols is cleared whenever a measure is added.
+
+    The index also resolves the measure of the product or quotient of two
+    measures by their :attr:`~AbstractMeasure.__dimension__`, see :meth:`product`.
+    """
+
+    def __init__(self, maxsize=1024):
+        self._refs: List[weakref.ref] = []
+        self._find = functools.lru_cache(maxsize=maxsize)(self._find_refs)
+        self._ambiguities: Optional[Dict[str, Tuple[weakref.ref, ...]]] = None
+        self._dimensions: Optional[Dict[Dimension, weakref.ref]] = None
+        self._products: Dict[
+            Tuple[int, int, typing.Callable], Optional[typing.Callable]
+        ] = {}
+
+    @property
+    def measures(self) -> List["MeasureBase"]:
+        """Return all measures in the order of their creation."""
+        return self._resolve(self._refs)
+
+    def add(self, measure: "MeasureBase"):
+        self._refs.append(weakref.ref(measure, self._remove))
+        self._find.cache_clear()
+        self._ambiguities = None
+        self._clear_products()
+
+    def product(
+        self, left: "MeasureBase", right: "MeasureBase", op: typing.Callable
+    ) -> Optional["MeasureBase"]:
+        """
+        Return measure of the product or quotient of two measures.
+
+        The ``op`` is either :func:`operator.mul` or :func:`operator.truediv`.
+        The result is the measure with the product or quotient of both
+        dimensions. Products without a dimension, like a frequency multiplied
+        with a time, are plain numbers and ``None`` is returned.
+        Built-in measures take precedence over other measures of the same
+        dimension. If multiple measures of the same standing have the same
+        dimension, like :class:`~measurement.measures.Frequency` and
+        :class:`~measurement.measures.Radioactivity`, they are not a result.
+        Subclasses of a measure and measures without an SI unit are not
+        considered either.
+
+        Results are resolved once per pair of measures and operator.
+        All built-in measures are loaded on the first lookup.
+
+        Raises:
+            KeyError: If no measure has the dimension of the result.
+        """
+        key = id(left), id(right), op
+        try:
+            ref = self._products[key]
+        except KeyError:
+            ref = self._products[key] = self._find_product(left, right, op)
+        if ref is None:
+            raise KeyError(
+                f"no measure of '{qualname(left)}' {op.__name__} '{qualname(right)}'"
+            )
+        return ref()
+
+    def _find_product(self, left, right, op):
+        if left.__dimension__ is None or right.__dimension__ is None:
+            return None
+        dimension = op(left.__dimension__, right.__dimension__)
+        if dimension == DIMENSIONLESS:
+            return _dimensionless
+        return self._get_dimensions().get(dimension)
+
+    def _get_dimensions(self):
+        if self._dimensions is None:
+            from measurement.utils import _builtin_order
+
+            builtin = _builtin_order()  # also loads all built-in measures
+            candidates = {}
+            for measure in self.measures:
+                # Results are returned in the SI unit, thus measures need one.
+                if (
+                    measure.__dimension__ is not None
+                    and measure.get_index().base_unit_names is not None
+                ):
+                    candidates.setdefault(measure.__dimension__, []).append(measure)
+            self._dimensions = {}
+            for dimension, found in candidates.items():
+                found = [
+                    measure
+                    for measure in found
+                    if not any(
+                        measure is not base and issubclass(measure, base)
+                        for base in found
+                    )
+                ]
+                found = [m for m in found if m in builtin] or found
+                if len(found) == 1:
+                    self._dimensions[dimension] = weakref.ref(found[0])
+        return self._dimensions
+
+    def _remove(self, ref):
+        self._refs.remove(ref)
+        self._clear_products()
+
+    def _clear_products(self):
+        # Products are keyed by ids, which are only unique while the measures exist.
+        self._dimensions = None
+        self._products = {}
+
+    def find(self, name: str) -> Tuple["MeasureBase", ...]:
+        """Return all measures accepting the given unit, in the order of creation."""
+        return tuple(self._resolve(self._find(name)))
+
+    def ambiguities(self) -> Dict[str, Tuple["MeasureBase", ...]]:
+        """
+        Return all symbols accepted by more than one measure and those measures.
+
+        The table includes all symbols stored by the measures as well as their
+        metric prefixed symbols, see :meth:`MeasureBase.iter_symbols`.
+        It is built on the first call after a measure has been added.
+        """
+        if self._ambiguities is None:
+            symbols = {}
+            for ref in list(self._refs):
+                measure = ref()
+                if measure is not None:
+                    for symbol in dict.fromkeys(measure.iter_symbols()):
+                        symbols.setdefault(symbol, []).append(ref)
+            self._ambiguities = {
+                symbol: tuple(refs) for symbol, refs in symbols.items() if len(refs) > 1
+            }
+        table = {}
+        for symbol, refs in self._ambiguities.items():
+            measures = tuple(self._resolve(refs))
+            if len(measures) > 1:
+                table[symbol] = measures
+        return table
+
+    def cache_info(self) -> "functools._CacheInfo":
+        """Return hit and miss statistics of the symbol cache."""
+        return self._find.cache_info()
+
+    def _find_refs(self, name):
+        refs = []
+        for ref in list(self._refs):
+            measure = ref()
+            if measure is not None and measure._units.resolve_name(name)[1]:
+                refs.append(ref)
+        return tuple(refs)
+
+    @staticmethod
+    def _resolve(refs):
+        return [measure for measure in (ref() for ref in refs) if measure is not None]
+
+
+measure_index = MeasureIndex()
+"""Index of all measures, used by :func:`measurement.utils.guess`."""
+
+
+def _slot_names(klass: type) -> Tuple[str, ...]:
+    """Return names of the slots the class defines, except for weak references."""
+    slots = vars(klass).get("__slots__", ())
+    if isinstance(slots, str):
+        slots = (slots,)
+    return tuple(name for name in slots if name != "__weakref__")
+
 
 class MeasureBase(type):
     """
@@ -216,6 +893,10 @@ class MeasureBase(type):
     creates a dictionary mapping all sympbols to their corresponding
     :class:`.AbstractUnit` implementation.
 
+    Metric prefixed symbols of :class:`.MetricUnit` instances are resolved on
+    demand. Other symbols, that are not defined by the measure's own units,
+    may be resolved by overriding :meth:`resolve_symbol`.
+
     Raises:
         KeyError: If the same symbol is used for multiple units.
 
@@ -223,26 +904,131 @@ class MeasureBase(type):
 
     def __new__(mcs, name, bases, attrs):
         mcs.freeze_org_units(attrs)
-        symbols = ImmutableKeyDict()
-        new_attr = {}
+        symbols = UnitRegistry()
+        new_attr = {"__slots__": ()}
         for attr_name, attr in attrs.items():
             if isinstance(attr, AbstractUnit):
                 attr.name = attr_name
                 for symbol, unit in attr.get_symbols():
                     unit.name = attr_name
                     symbols[symbol] = unit
+                attr.freeze()
             else:
                 new_attr[attr_name] = attr
+        mcs.check_prefixed_symbols(symbols, attrs)
 
         cls = super().__new__(mcs, name, bases, new_attr)
-        cls._units = symbols
+        context = getattr(cls, "decimal_context", None)
+        for unit in symbols.values():
+            unit.freeze(context)
+        cls._units = UnitRegistry(
+            symbols,
+            resolver=cls.resolve_symbol,
+            normalizer=cls._attr_to_unit,
+            context=context,
+        )
+        cls._units.measure = cls
+        # Slots of subclasses, that need to be pickled besides the measure's own.
+        cls._state_slots = tuple(
+            name
+            for klass in cls.__mro__
+            for name in _slot_names(klass)
+            if name not in ("unit", "symbol", "si_value")
+        )
+        cls.get_index()
+        measure_index.add(cls)
         return cls
 
+    def cache_info(cls) -> "functools._CacheInfo":
+        """
+        Return hit and miss statistics of the measure's attribute name cache.
+
+        Attribute and item access, like ``distance.km`` or ``speed["km__h"]``,
+        translates the name to a unit once, successful or not, and caches
+        the result per measure class.
+        """
+        return cls._units.resolve_name.cache_info()
+
+    def get_index(cls) -> UnitIndex:
+        """Return :class:`.UnitIndex` of the measure, rebuilding it if units changed."""
+        index = cls._units.index
+        if index is None:
+            index = cls._units.index = UnitIndex.build(cls._units)
+        return index
+
+    def _si_symbol(cls) -> str:
+        """
+        Return symbol of the measure's SI unit, its first unit with a factor of 1.
+
+        Raises:
+            KeyError: If the measure has no SI unit.
+        """
+        names = cls.get_index().base_unit_names
+        if names is None:
+            raise KeyError(f"'{qualname(cls)}' has no SI unit, a unit must be given")
+        return names[0]
+
+    def iter_symbols(cls) -> typing.Iterator[str]:
+        """
+        Yield all symbols stored by the measure and all metric prefixed symbols.
+
+        Other symbols resolved on demand, like ``km/h`` or ``km²``,
+        are not included.
+        """
+        yield from cls._units
+        for unit in cls._org_units.values():
+            if isinstance(unit, MetricUnit):
+                yield from unit.iter_prefixed_symbols()
+
+    def resolve_symbol(cls, symbol: str) -> Optional[AbstractUnit]:
+        """Return unit for a symbol that is not stored in the registry, or ``None``."""
+        for unit in cls._org_units.values():
+            if isinstance(unit, MetricUnit):
+                prefixed_unit = unit.resolve_prefix(symbol)
+                if prefixed_unit is not None:
+                    return prefixed_unit
+        return None
+
+    @staticmethod
+    def lookup(measure: Type["AbstractMeasure"], symbol: str) -> Tuple[str, Unit]:
+        """
+        Return symbol and unit of the given measure.
+
+        Unlike a plain lookup, this also matches symbols containing underscores,
+        if the given symbol contains white spaces instead.
+        """
+        try:
+            return symbol, measure._units[symbol]
+        except KeyError:
+            symbol = symbol.replace(" ", "_")
+            return symbol, measure._units[symbol]
+
+    @staticmethod
+    def check_prefixed_symbols(symbols: Dict[str, AbstractUnit], attrs: Dict[str, Any]):
+        """
+        Check that metric prefixed symbols are unique, although they are not stored.
+
+        Raises:
+            KeyError: If a prefixed symbol is used by another unit.
+        """
+        prefixed = ImmutableKeyDict(symbols)
+        for attr in attrs.values():
+            if isinstance(attr, MetricUnit):
+                for symbol in attr.iter_prefixed_symbols():
+                    prefixed[symbol] = attr
+
     @staticmethod
     def freeze_org_units(attrs: Dict[str, Any]):
         if "_org_units" in attrs:
             return
 
+        # Units are named and frozen once registered, thus register copies
+        # to keep the given units unchanged, even if shared by other measures.
+        for attr_name, attr in attrs.items():
+            if isinstance(attr, AbstractUnit):
+                attr = copy.copy(attr)
+                vars(attr).pop("_frozen", None)
+                attrs[attr_name] = attr
         attrs["_org_units"] = {
             attr_name: attr
             for attr_name, attr in attrs.items()
@@ -252,7 +1038,49 @@ class MeasureBase(type):
 
 @total_ordering
 class AbstractMeasure(metaclass=MeasureBase):
-    """Abstract super class to all measures."""
+    """
+    Abstract super class to all measures.
+
+    Measure instances do not have a ``__dict__``, but may be weakly referenced.
+    All subclasses get empty :obj:`__slots__` by default, unless they define
+    their own.
+
+    Measures are immutable and hashable. Equal measures have the same hash,
+    regardless of their unit, thus ``Distance(km=1)`` and ``Distance(m=1000)``
+    may be used interchangeably as dictionary keys or in sets.
+    """
+
+    __slots__ = {
+        "unit": "Return :class:`~Unit` initially given to construct the measure.",
+        "symbol": "Return symbol initially given to construct the measure.",
+        "si_value": "Return :class:`~Decimal` value of the measure in the SI unit.",
+        "__weakref__": None,
+    }
+
+    decimal_context: Optional[decimal.Context] = None
+    """
+    Context of all :class:`Decimal<decimal.Decimal>` conversions and arithmetic
+    of the measure, like ``decimal.Context(prec=12)``.
+
+    Unit factors are rounded to the context's precision once, when the measure
+    is created. If ``None``, the current context is used, which can be changed
+    per call via :func:`decimal.localcontext`.
+    """
+
+    si_quantum: Optional[decimal.Decimal] = None
+    """
+    Exponent every :class:`Decimal<decimal.Decimal>` :attr:`si_value` is
+    quantized to, like ``Decimal("1e-9")``, or ``None`` to keep all digits.
+    """
+
+    __dimension__: Optional[Dimension] = None
+    """
+    :class:`.Dimension` of the measure's SI unit, like ``Dimension(length=1)``.
+
+    Measures with a dimension can be multiplied and divided by each other,
+    if a measure of the resulting dimension exists, see :meth:`MeasureIndex.product`.
+    Measures without a dimension, the default, can only be scaled by numbers.
+    """
 
     def __init__(
         self,
@@ -263,8 +1091,7 @@ class AbstractMeasure(metaclass=MeasureBase):
         if kwargs:
             unit, value = kwargs.popitem()
         if unit is None:
-            value, unit = value.split(maxsplit=1)
-            value = decimal.Decimal(value)
+            value, unit = parse_measure(value)
 
         if isinstance(value, int):
             value = decimal.Decimal(str(value))
@@ -273,27 +1100,158 @@ class AbstractMeasure(metaclass=MeasureBase):
             warnings.warn(f"'value' expects type Decimal not {qualname(value)}")
         value = decimal.Decimal(value)
 
-        unit = self._attr_to_unit(unit)
-        self.unit = self._units[unit]
-        self.unit.org_name = unit
-        self.si_value = self.unit.to_si(value)
-        self.base_unit_names = self.get_base_unit_names()
+        symbol, unit = self._units.find(unit)
+        si_value = unit.to_si(value)
+        if self.si_quantum is not None:
+            si_value = si_value.quantize(self.si_quantum, context=self.decimal_context)
+        _set_symbol(self, symbol)
+        _set_unit(self, unit)
+        _set_si_value(self, si_value)
+
+    @classmethod
+    def float(
+        cls,
+        value: Union[str, float, int, None] = None,
+        unit: Optional[str] = None,
+        **kwargs: Union[str, float, int, None],
+    ):
+        """
+        Return a measure backed by a :class:`float` instead of a Decimal.
+
+        Arguments are the same as for the default constructor. Conversions and
+        arithmetic of float backed measures are done in floating point,
+        trading precision for speed.
+
+            >>> from measurement import measures
+            >>> measures.Distance.float(1.5, "km").m
+            1500.0
+        """
+        if kwargs:
+            unit, value = kwargs.popitem()
+        if unit is None:
+            value, unit = parse_measure(value, builtins.float)
+        symbol, unit = cls._units.find(unit)
+        return cls._from_si(unit.to_si(builtins.float(value)), unit, symbol)
+
+    @classmethod
+    def parse_many(
+        cls, lines: Iterable[str], float: bool = False
+    ) -> typing.Iterator["AbstractMeasure"]:
+        """
+        Yield a measure for each string, like ``"12.5 km"``, skipping blank lines.
+
+        Measures are parsed lazily, thus ``lines`` may be any iterable,
+        like an open file. If ``float`` is true, float backed measures
+        are returned, see :meth:`float`.
+
+            >>> from measurement import measures
+            >>> list(measures.Distance.parse_many(["1 m", "", "2.5mi"]))
+            [Distance(metre="1"), Distance(mile="2.5")]
+
+        Raises:
+            ValueError: If a line is not a number followed by a unit.
+            KeyError: If the measure has no such unit.
+        """
+        to_number = builtins.float if float else decimal.Decimal
+        find = cls._units.find
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            value, symbol = parse_measure(line, to_number)
+            symbol, unit = find(symbol)
+            yield cls._from_si(unit.to_si(value), unit, symbol)
+
+    @classmethod
+    def converter(cls, from_unit: str, to_unit: str) -> Converter:
+        """
+        Return a reusable :class:`.Converter` from one unit of the measure to another.
+
+        Raises:
+            KeyError: If the measure has no such unit.
+        """
+        units = []
+        for name in (from_unit, to_unit):
+            try:
+                units += cls._units.find(name)
+            except KeyError as e:
+                raise KeyError(f"{qualname(cls)} has no unit '{name}'") from e
+        return Converter(cls, *units)
+
+    @classmethod
+    def from_si(cls, si_value, unit: Optional[str] = None):
+        """
+        Return measure of a value in the SI unit, to be displayed in the given unit.
+
+        Unlike the default constructor, the value is used as is, without any
+        type checks, conversions or warnings. Thus, a :class:`float` value
+        returns a float backed measure. Without a unit, the SI unit is used.
+
+            >>> from measurement import measures
+            >>> measures.Distance.from_si(decimal.Decimal(1500), "km")
+            Distance(metre="1500")
+
+        Raises:
+            KeyError: If the measure has no such unit, or no SI unit if
+                no unit is given.
+        """
+        if unit is None:
+            unit = cls._si_symbol()
+        symbol, unit = cls._units.find(unit)
+        return cls._from_si(si_value, unit, symbol)
+
+    @classmethod
+    def from_value(cls, value, unit: str):
+        """
+        Return measure of a value in the given unit.
+
+        Like :meth:`from_si`, the value is used as is, without any type
+        checks, conversions or warnings.
+
+            >>> from measurement import measures
+            >>> print(measures.Distance.from_value(decimal.Decimal("1.5"), "km"))
+            1.5 km
+
+        Raises:
+            KeyError: If the measure has no such unit.
+        """
+        symbol, unit = cls._units.find(unit)
+        return cls._from_si(unit.to_si(value), unit, symbol)
+
+    @classmethod
+    def _from_si(cls, si_value, unit: AbstractUnit, symbol: str):
+        """Return measure of the given SI value and an already resolved unit."""
+        if cls.si_quantum is not None and isinstance(si_value, decimal.Decimal):
+            si_value = si_value.quantize(cls.si_quantum, context=cls.decimal_context)
+        measure = object.__new__(cls)
+        _set_unit(measure, unit)
+        _set_symbol(measure, symbol)
+        _set_si_value(measure, si_value)
+        return measure
+
+    @classmethod
+    def _get_context(cls) -> decimal.Context:
+        """Return :attr:`decimal_context` or the current context if there is none."""
+        return cls.decimal_context or decimal.getcontext()
+
+    def _canonical_unit(self) -> Tuple[str, AbstractUnit]:
+        """Return symbol and unit of the unit named like the measure's unit."""
+        return self._units.find(self.unit.name)
+
+    @property
+    def base_unit_names(self) -> Optional[Tuple[str, ...]]:
+        """Return unit names for units with a factor of 1 (base units)."""
+        return (self._units.index or type(self).get_index()).base_unit_names
 
     @classmethod
     def get_base_unit_names(cls):
         """Return a list of unit names for units with a factor of 1 (base units)."""
-        names_list = [
-            unit_name
-            for unit_name, unit in cls._units.items()
-            if getattr(unit, "factor", None) is not None
-            and unit.factor == decimal.Decimal("1")
-        ]
-        if names_list:
-            return names_list
+        names = cls.get_index().base_unit_names
+        if names:
+            return list(names)
 
     def __getattr__(self, name):
         try:
-            unit = self._units[self._attr_to_unit(name)]
+            _, unit = self._units.find(name)
         except KeyError as e:
             raise AttributeError(
                 f"{qualname(self)} object has no attribute '{name}'"
@@ -303,7 +1261,7 @@ class AbstractMeasure(metaclass=MeasureBase):
 
     def __getitem__(self, item):
         try:
-            unit = self._units[self._attr_to_unit(item)]
+            _, unit = self._units.find(item)
         except KeyError as e:
             raise KeyError(f"{qualname(self)} object has no key '{item}'") from e
         else:
@@ -313,23 +1271,68 @@ class AbstractMeasure(metaclass=MeasureBase):
     def _attr_to_unit(cls, name: str) -> str:
         return name.replace("_", " ")
 
-    unit = None
-    """Return :class:`~Unit` initially given to construct the measure."""
-
     @property
     def _value(self) -> decimal.Decimal:
         """Return :class:`~Decimal` value of measure in the given :attr:`.unit`."""
-        return getattr(self, self.unit.name)
+        _, unit = self._canonical_unit()
+        return unit.from_si(self.si_value)
 
     def __repr__(self):
-        return f'{qualname(self)}({self.unit.name}="{getattr(self, self.unit.name)}")'
+        return f'{qualname(self)}({self.unit.name}="{self._value}")'
 
     def __str__(self):
-        return f"{getattr(self, self.unit.org_name)} {self.unit.org_name}"
+        return f"{self.unit.from_si(self.si_value)} {self.symbol}"
 
     def __format__(self, format_spec):
-        decimal_format = getattr(self, self.unit.org_name).__format__(format_spec)
-        return f"{decimal_format} {self.unit.org_name}"
+        decimal_format = self.unit.from_si(self.si_value).__format__(format_spec)
+        return f"{decimal_format} {self.symbol}"
+
+    def __setattr__(self, name, value):
+        if name in AbstractMeasure.__slots__:
+            raise dataclasses.FrozenInstanceError(f"cannot assign to field '{name}'")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if name in AbstractMeasure.__slots__:
+            raise dataclasses.FrozenInstanceError(f"cannot delete field '{name}'")
+        super().__delattr__(name)
+
+    def __reduce__(self):
+        """
+        Return how to copy or pickle the measure, by its class, symbol and SI value.
+
+        The unit is not pickled but looked up by its symbol on unpickling.
+        Slots of subclasses are restored by :meth:`__setstate__`.
+        """
+        args = type(self), self.symbol, self.si_value
+        if not self._state_slots:
+            return _restore, args
+        state = {
+            name: getattr(self, name)
+            for name in self._state_slots
+            if hasattr(self, name)
+        }
+        return _restore, args, (None, state)
+
+    def __setstate__(self, state):
+        """Restore slots of a copied or unpickled measure, despite being immutable."""
+        if isinstance(state, dict):
+            # Pickled by versions before measures had slots, with a pickled unit.
+            unit = state["unit"]
+            symbol, unit = self._units.find(
+                getattr(unit, "org_name", None) or unit.name
+            )
+            object.__setattr__(self, "unit", unit)
+            object.__setattr__(self, "symbol", symbol)
+            object.__setattr__(self, "si_value", state["si_value"])
+            return
+        _, slots = state
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+    def __hash__(self):
+        # Not hashing the type, since measures equal instances of their subclasses.
+        return hash(self.si_value)
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -349,9 +1352,15 @@ class AbstractMeasure(metaclass=MeasureBase):
     def __add__(self, other):
         if not isinstance(other, type(self)):
             raise TypeError(f"can't add type '{qualname(self)}' to '{qualname(other)}'")
-        return type(self)(
-            value=self._value + getattr(other, self.unit.name), unit=self.unit.name
+        symbol, unit = self._canonical_unit()
+        if isinstance(self.si_value, float) or isinstance(other.si_value, float):
+            return self._from_si(
+                float(self.si_value) + float(other.si_value), unit, symbol
+            )
+        value = self._get_context().add(
+            unit.from_si(self.si_value), unit.from_si(other.si_value)
         )
+        return self._from_si(unit.to_si(value), unit, symbol)
 
     def __iadd__(self, other):
         return self + other
@@ -361,18 +1370,41 @@ class AbstractMeasure(metaclass=MeasureBase):
             raise TypeError(
                 f"can't subtract type '{qualname(other)}' from '{qualname(self)}'"
             )
-
-        return type(self)(
-            value=self._value - getattr(other, self.unit.name), unit=self.unit.name
+        symbol, unit = self._canonical_unit()
+        if isinstance(self.si_value, float) or isinstance(other.si_value, float):
+            return self._from_si(
+                float(self.si_value) - float(other.si_value), unit, symbol
+            )
+        value = self._get_context().subtract(
+            unit.from_si(self.si_value), unit.from_si(other.si_value)
         )
+        return self._from_si(unit.to_si(value), unit, symbol)
 
     def __isub__(self, other):
         return self - other
 
     def __mul__(self, other):
+        if isinstance(other, AbstractMeasure):
+            return self._product(operator.mul, other)
+        if not isinstance(other, numbers.Number):
+            return self._reflected(
+                "__rmul__",
+                other,
+                f"can't multiply type '{qualname(self)}' and '{qualname(other)}'",
+            )
+        if isinstance(self.si_value, float):
+            if not isinstance(other, (int, float, decimal.Decimal)):
+                raise TypeError(
+                    f"can't multiply type '{qualname(self)}' and '{qualname(other)}'"
+                )
+            return self._from_si(self.si_value * float(other), self.unit, self.symbol)
         try:
-            value = getattr(self, self.unit.org_name) * other
-            return type(self)(value=value, unit=self.unit.org_name)
+            value = self.unit.from_si(self.si_value)
+            if self.decimal_context is not None and _is_decimal(other):
+                value = self.decimal_context.multiply(value, other)
+            else:
+                value = value * other
+            return self._scaled(value)
         except TypeError as e:
             raise TypeError(
                 f"can't multiply type '{qualname(self)}' and '{qualname(other)}'"
@@ -386,15 +1418,81 @@ class AbstractMeasure(metaclass=MeasureBase):
 
     def __truediv__(self, other):
         if isinstance(other, type(self)):
-            return self.si_value / other.si_value
+            if isinstance(self.si_value, float) or isinstance(other.si_value, float):
+                return float(self.si_value) / float(other.si_value)
+            return self._get_context().divide(self.si_value, other.si_value)
+        if isinstance(other, AbstractMeasure):
+            return self._product(operator.truediv, other)
+        if not isinstance(other, numbers.Number):
+            return self._reflected(
+                "__rtruediv__",
+                other,
+                f"can't divide type '{qualname(self)}' by '{qualname(other)}'",
+            )
+        if isinstance(self.si_value, float):
+            if not isinstance(other, (int, float, decimal.Decimal)):
+                raise TypeError(
+                    f"can't divide type '{qualname(self)}' by '{qualname(other)}'"
+                )
+            return self._from_si(self.si_value / float(other), self.unit, self.symbol)
         try:
-            value = getattr(self, self.unit.org_name) / other
+            value = self.unit.from_si(self.si_value)
+            if self.decimal_context is not None and _is_decimal(other):
+                value = self.decimal_context.divide(value, other)
+            else:
+                value = value / other
+            return self._scaled(value)
         except TypeError as e:
             raise TypeError(
                 f"can't divide type '{qualname(self)}' by '{qualname(other)}'"
             ) from e
+
+    def _reflected(self, name, other, message):
+        """
+        Return result of the reflected operator of a non-numeric operand.
+
+        Like returning ``NotImplemented``, this lets operands such as
+        :class:`.MeasureArray` implement ``measure * other``, but keeps the
+        error message for operands that don't.
+        """
+        method = getattr(type(other), name, None)
+        try:
+            result = NotImplemented if method is None else method(other, self)
+        except TypeError as e:
+            raise TypeError(message) from e
+        if result is NotImplemented:
+            raise TypeError(message)
+        return result
+
+    def _product(self, op, other):
+        """Return product or quotient of two measures in the SI unit of the result."""
+        try:
+            measure = measure_index.product(type(self), type(other), op)
+        except KeyError as e:
+            if op is operator.mul:
+                message = (
+                    f"can't multiply type '{qualname(self)}' and '{qualname(other)}'"
+                )
+            else:
+                message = f"can't divide type '{qualname(self)}' by '{qualname(other)}'"
+            raise TypeError(message) from e
+        context = (measure or self).decimal_context
+        if isinstance(self.si_value, float) or isinstance(other.si_value, float):
+            si_value = op(float(self.si_value), float(other.si_value))
+        elif context is not None:
+            si_value = _CONTEXT_OPERATORS[op](context, self.si_value, other.si_value)
         else:
-            return type(self)(value=value, unit=self.unit.org_name)
+            si_value = op(self.si_value, other.si_value)
+        if measure is None:
+            return si_value
+        symbol = measure._si_symbol()
+        return measure._from_si(si_value, measure._units[symbol], symbol)
+
+    def _scaled(self, value):
+        """Return measure of the same unit and symbol for a multiplied value."""
+        if not isinstance(value, decimal.Decimal):
+            raise TypeError(f"expected type 'Decimal' not '{qualname(value)}'")
+        return self._from_si(self.unit.to_si(value), self.unit, self.symbol)
 
     def __itruediv__(self, other):
         return self / other
@@ -404,3 +1502,26 @@ class AbstractMeasure(metaclass=MeasureBase):
 
     def __bool__(self):
         return bool(self.si_value)
+
+
+# Measures are immutable, their slots are only set via the slot descriptors.
+_set_unit = AbstractMeasure.unit.__set__
+_set_symbol = AbstractMeasure.symbol.__set__
+_set_si_value = AbstractMeasure.si_value.__set__
+
+
+def _restore(measure: Type[AbstractMeasure], symbol: str, si_value):
+    """Return unpickled measure, see :meth:`AbstractMeasure.__reduce__`."""
+    symbol, unit = measure._units.find(symbol)
+    return measure._from_si(si_value, unit, symbol)
+
+
+_CONTEXT_OPERATORS = {
+    operator.mul: decimal.Context.multiply,
+    operator.truediv: decimal.Context.divide,
+}
+
+
+def _is_decimal(value) -> bool:
+    """Return whether the value is a number :class:`decimal.Context` operates on."""
+    return isinstance(value, (int, decimal.Decimal))
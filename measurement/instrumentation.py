@@ -0,0 +1,218 @@
+"""
+Opt-in instrumentation of the hot paths of measures.
+
+Instrumentation is disabled by default and does not cost anything then.
+:func:`enable` wraps the instrumented methods and :func:`disable` restores
+the original ones. While enabled, the number of calls and their cumulative
+time is recorded per event and measure:
+
+    >>> from measurement import instrumentation
+    >>> from measurement.measures import Distance
+    >>> instrumentation.enable()
+    >>> Distance("1 km").m
+    Decimal('1E+3')
+    >>> instrumentation.snapshot()["init", Distance].count
+    1
+    >>> instrumentation.disable()
+    >>> instrumentation.reset()
+
+The events are:
+
+``init``
+    Construction of a measure via its default constructor.
+``from_si``
+    Construction of a measure without the default constructor, like float
+    backed measures, parsed measures or the results of arithmetic.
+``getattr`` and ``getitem``
+    Conversion to a unit, like ``distance.km`` or ``distance["km"]``.
+``registry_miss``
+    Lookup of a symbol that is not stored by the measure and thus is resolved
+    on demand, like metric prefixed or compound symbols, or is unknown.
+``add``, ``sub``, ``mul`` and ``truediv``
+    Arithmetic of measures.
+``guess``
+    Lookup of a unit by :func:`.guess` or :func:`.guess_many`, recorded for
+    the guessed measure, or by :func:`.guess_report`, recorded for each
+    measure accepting the unit. Units no measure accepts are recorded with
+    ``None`` as measure.
+
+Methods overridden by measures, like :meth:`Temperature.__add__
+<measurement.measures.Temperature.__add__>`, are instrumented as well,
+including those of measures created while instrumentation is enabled.
+Overrides calling the method they override are recorded once.
+
+Instrumentation should be enabled or disabled while no other threads
+use measures, e.g. on startup.
+"""
+import dataclasses
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from measurement import utils
+from measurement.base import AbstractMeasure, MeasureIndex, UnitRegistry, measure_index
+
+__all__ = ["Stats", "enable", "disable", "is_enabled", "snapshot", "reset"]
+
+Hook = Callable[[str, Optional[type], float], Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class Stats:
+    """Statistics of an event of a measure, see :func:`snapshot`."""
+
+    count: int
+    """Number of times the event was recorded."""
+
+    time: float
+    """Cumulative time of the event in seconds."""
+
+
+_METHODS = [
+    ("__init__", "init"),
+    ("__getattr__", "getattr"),
+    ("__getitem__", "getitem"),
+    ("__add__", "add"),
+    ("__sub__", "sub"),
+    ("__mul__", "mul"),
+    ("__truediv__", "truediv"),
+]
+
+_lock = threading.Lock()
+_stats: Dict[Tuple[str, Optional[type]], List] = {}
+_originals: Dict[Tuple[Any, str], Any] = {}
+_hook: Optional[Hook] = None
+_local = threading.local()
+
+
+def enable(hook: Optional[Hook] = None):
+    """
+    Start recording events, calling the ``hook`` for each event, if given.
+
+    The hook is called with the event, the measure and the duration in
+    seconds, e.g. to export events to a metrics system.
+    """
+    global _hook
+    _hook = hook
+    if _originals:
+        return
+    for measure in measure_index.measures:
+        _instrument_measure(measure)
+    _patch(MeasureIndex, "add", _instrument_add(MeasureIndex.add))
+    _patch(
+        AbstractMeasure,
+        "_from_si",
+        classmethod(_instrument("from_si", AbstractMeasure._from_si.__func__, None)),
+    )
+    _patch(
+        UnitRegistry,
+        "__missing__",
+        _instrument("registry_miss", UnitRegistry.__missing__, _registry_measure),
+    )
+    _patch(utils, "_guess_measure", _instrument_guess(utils._guess_measure))
+    _patch(utils, "_candidates", _instrument_guess(utils._candidates))
+
+
+def disable():
+    """Stop recording events and restore the original methods."""
+    global _hook
+    while _originals:
+        (owner, name), original = _originals.popitem()
+        setattr(owner, name, original)
+    _hook = None
+
+
+def is_enabled() -> bool:
+    """Return whether events are recorded."""
+    return bool(_originals)
+
+
+def snapshot() -> Dict[Tuple[str, Optional[type]], Stats]:
+    """Return :class:`.Stats` of all recorded events by event and measure."""
+    with _lock:
+        return {key: Stats(*values) for key, values in _stats.items()}
+
+
+def reset():
+    """Clear all recorded events."""
+    with _lock:
+        _stats.clear()
+
+
+def record(event: str, measure: Optional[type], duration: float):
+    """Record an event of the measure, that took ``duration`` seconds."""
+    with _lock:
+        try:
+            values = _stats[event, measure]
+        except KeyError:
+            _stats[event, measure] = [1, duration]
+        else:
+            values[0] += 1
+            values[1] += duration
+    if _hook is not None:
+        _hook(event, measure, duration)
+
+
+def _patch(owner, name, value):
+    _originals[owner, name] = vars(owner)[name]
+    setattr(owner, name, value)
+
+
+def _registry_measure(registry):
+    return registry.measure
+
+
+def _instrument_measure(measure):
+    """Patch the instrumented methods the measure defines itself."""
+    for name, event in _METHODS:
+        if name in vars(measure) and (measure, name) not in _originals:
+            _patch(measure, name, _instrument(event, vars(measure)[name]))
+
+
+def _instrument_add(function):
+    """Return wrapper of :meth:`.MeasureIndex.add`, instrumenting new measures."""
+
+    @functools.wraps(function)
+    def wrapper(index, measure):
+        function(index, measure)
+        _instrument_measure(measure)
+
+    return wrapper
+
+
+def _instrument(event, function, get_measure=type):
+    """Return wrapper of a method recording the event for the measure of its object."""
+
+    @functools.wraps(function)
+    def wrapper(obj, *args, **kwargs):
+        measure = obj if get_measure is None else get_measure(obj)
+        active = _local.__dict__.setdefault("active", set())
+        key = event, measure
+        if key in active:  # an override calling the method it overrides
+            return function(obj, *args, **kwargs)
+        active.add(key)
+        start = time.perf_counter()
+        try:
+            return function(obj, *args, **kwargs)
+        finally:
+            record(event, measure, time.perf_counter() - start)
+            active.discard(key)
+
+    return wrapper
+
+
+def _instrument_guess(function):
+    """Return wrapper of a lookup of one measure or a tuple of candidates of a unit."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        duration = time.perf_counter() - start
+        measures = result if isinstance(result, tuple) else (result,)
+        for measure in measures or (None,):
+            record("guess", measure, duration)
+        return result
+
+    return wrapper
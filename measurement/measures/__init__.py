@@ -1,7 +1,65 @@
-from .electromagnetism import *  # NoQA
-from .energy import *  # NoQA
-from .geometry import *  # NoQA
-from .mechanics import *  # NoQA
-from .radioactivity import *  # NoQA
-from .temperature import *  # NoQA
-from .time import *  # NoQA
+"""
+Collection of all built-in measures.
+
+Measures are loaded lazily, the first time they are accessed.
+Thus, importing a single measure only builds the measures of its own module
+and the measures it depends on.
+"""
+import importlib
+
+from measurement.base import MeasureBase
+
+_MODULES = {
+    "electromagnetism": [
+        "Capacitance",
+        "Current",
+        "ElectricPower",
+        "Inductance",
+        "Resistance",
+        "Voltage",
+    ],
+    "energy": ["Energy", "Heat"],
+    "geometry": ["Distance", "Area", "Volume"],
+    "time": ["Time", "Frequency"],
+    "mechanics": ["Mass", "Pressure", "VolumetricFlowRate", "Speed"],
+    "radioactivity": ["Radioactivity"],
+    "temperature": ["Temperature", "TemperatureDifference"],
+}
+"""Modules and the measures they export."""
+
+__all__ = [name for names in _MODULES.values() for name in names]
+
+_LOCATIONS = {name: module for module, names in _MODULES.items() for name in names}
+
+
+def __getattr__(name):
+    try:
+        module = _LOCATIONS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+def _iter_measures():
+    """
+    Yield all built-in measures in the order of their definition.
+
+    Modules are only imported once their measures are reached.
+    """
+    seen = set()
+    for module_name in _MODULES:
+        module = importlib.import_module(f".{module_name}", __name__)
+        for obj in vars(module).values():
+            if (
+                isinstance(obj, MeasureBase)
+                and obj.__module__ == module.__name__
+                and obj not in seen
+            ):
+                seen.add(obj)
+                yield obj
@@ -1,4 +1,4 @@
-from measurement.base import AbstractMeasure, MetricUnit
+from measurement.base import AbstractMeasure, Dimension, MetricUnit
 
 __all__ = [
     "Capacitance",
@@ -11,32 +11,32 @@ __all__ = [
 
 
 class Capacitance(AbstractMeasure):
+    __dimension__ = Dimension(length=-2, mass=-1, time=4, current=2)
+
     farad = MetricUnit("1", ["F", "Farad"], ["F"], ["farad"])
 
 
 class Current(AbstractMeasure):
-    ampere = MetricUnit("1", ["A", "amp", "Ampere"], ["A"], ["ampere", "amp"])
+    __dimension__ = Dimension(current=1)
 
-    def __mul__(self, other):
-        if isinstance(other, Voltage):
-            return ElectricPower(self.si_value * other.si_value, "W")
-        return super().__mul__(other)
+    ampere = MetricUnit("1", ["A", "amp", "Ampere"], ["A"], ["ampere", "amp"])
 
 
 class Resistance(AbstractMeasure):
+    __dimension__ = Dimension(length=2, mass=1, time=-3, current=-2)
+
     ohm = MetricUnit("1", ["Ohm", "Ω"], ["Ω"], ["ohm"])
 
 
 class Voltage(AbstractMeasure):
-    volt = MetricUnit("1", ["V", "Volt"], ["V"], ["volt"])
+    __dimension__ = Dimension(length=2, mass=1, time=-3, current=-1)
 
-    def __mul__(self, other):
-        if isinstance(other, Current):
-            return ElectricPower(self.si_value * other.si_value, "W")
-        return super().__mul__(other)
+    volt = MetricUnit("1", ["V", "Volt"], ["V"], ["volt"])
 
 
 class Inductance(AbstractMeasure):
+    __dimension__ = Dimension(length=2, mass=1, time=-2, current=-2)
+
     henry = MetricUnit("1", ["H", "Henry"], ["H"], ["henry"])
 
 
@@ -64,15 +64,8 @@ class ElectricPower(AbstractMeasure):
 
     """
 
+    __dimension__ = Dimension(length=2, mass=1, time=-3)
+
     watt = MetricUnit(
         "1", ["W", "VA", "Watt", "Voltampere"], ["W", "VA"], ["watt", "voltampere"]
     )
-
-    def __truediv__(self, other):
-        if isinstance(other, Current):
-            return Voltage(volt=self.si_value / other.si_value)
-
-        if isinstance(other, Voltage):
-            return Current(ampere=self.si_value / other.si_value)
-
-        return super().__truediv__(other)
@@ -1,9 +1,11 @@
-from measurement.base import AbstractMeasure, MetricUnit, Unit
+from measurement.base import AbstractMeasure, Dimension, MetricUnit, Unit
 
 __all__ = ["Energy", "Heat"]
 
 
 class Energy(AbstractMeasure):
+    __dimension__ = Dimension(length=2, mass=1, time=-2)
+
     joule = MetricUnit("1", ["J", "Joule"], ["J"], ["joule"])
     calorie = MetricUnit(
         "4184.0", ["c", "cal", "Cal", "Calorie", "C"], ["cal"], ["calorie"]
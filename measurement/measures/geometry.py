@@ -1,6 +1,6 @@
 import decimal
 
-from measurement.base import AbstractMeasure, MeasureBase, MetricUnit, Unit
+from measurement.base import AbstractMeasure, Dimension, MeasureBase, MetricUnit, Unit
 
 __all__ = ["Distance", "Area", "Volume"]
 
@@ -34,6 +34,8 @@ class Distance(AbstractMeasure):
 
     """
 
+    __dimension__ = Dimension(length=1)
+
     metre = MetricUnit("1", ["m", "meter", "Meter", "Metre"], ["m"], ["metre", "meter"])
     parsec = MetricUnit("3.0857E+16", ["Parsec", "pc"], ["pc"], ["parsec"])
     astronomical_unit = MetricUnit(
@@ -73,15 +75,6 @@ class Distance(AbstractMeasure):
     yard = Unit("0.9144", ["yd"])
     point = Unit(decimal.Decimal("25.4e-3") / 72, ["pt"])
 
-    def __mul__(self, other):
-        if isinstance(other, Distance):
-            return Area(sq_metre=self.si_value * other.si_value)
-
-        if isinstance(other, Area):
-            return Volume(cubic_metre=self.si_value * other.si_value)
-
-        return super().__mul__(other)
-
     def __pow__(self, power, modulo=None):
         if power == 2:
             return self * self
@@ -91,21 +84,45 @@ class Distance(AbstractMeasure):
 
 
 class AreaBase(MeasureBase):
+    """
+    Create a measure defined as the square of another measure.
+
+    Only the squares of the factor's base units, like ``m²``, are stored.
+    Any other squared symbol, like ``km²``, is resolved on lookup.
+    """
+
     def __new__(mcs, name, bases, attrs):
         mcs.freeze_org_units(attrs)
         x, y = attrs["__factors__"]
         if x is y:
             attrs.update(mcs.square(x))
+        if x.__dimension__ is not None and y.__dimension__ is not None:
+            attrs.setdefault("__dimension__", x.__dimension__ * y.__dimension__)
 
         cls = super().__new__(mcs, name, bases, attrs)
         return cls
 
+    def resolve_symbol(cls, symbol):
+        x, y = cls.__factors__
+        if x is y and symbol.endswith("²"):
+            try:
+                name, unit = type(cls).lookup(x, symbol[:-1])
+            except KeyError:
+                pass
+            else:
+                return type(cls).square_unit(name, unit)
+        return super().resolve_symbol(symbol)
+
+    @classmethod
+    def square(mcs, klass):
+        for name in klass.get_base_unit_names() or []:
+            yield f"{name}²", mcs.square_unit(name, klass._units[name])
+
     @staticmethod
-    def square(klass):
-        for name, unit in klass._units.items():
-            qs_unit = Unit(factor=unit.factor**2)
-            qs_unit.name = f"{qs_unit.name}²"
-            yield f"{name}²", qs_unit
+    def square_unit(name, unit):
+        qs_unit = Unit(factor=unit.factor**2)
+        qs_unit.name = f"{name}²"
+        return qs_unit
 
 
 class Area(AbstractMeasure, metaclass=AreaBase):
@@ -145,34 +162,49 @@ class Area(AbstractMeasure, metaclass=AreaBase):
             name = f"{name[7:]}²"
         return super()._attr_to_unit(name)
 
-    def __truediv__(self, other):
-        if isinstance(other, Distance):
-            return Distance(metre=self.si_value / other.si_value)
-
-        return super().__truediv__(other)
 
-    def __mul__(self, other):
-        if isinstance(other, Distance):
-            return Volume(cubic_metre=self.si_value * other.si_value)
-
-        return super().__mul__(other)
+class VolumeBase(MeasureBase):
+    """
+    Create a measure defined as the cube of another measure.
 
+    Only the cubes of the factor's base units, like ``m³``, are stored.
+    Any other cubed symbol, like ``km³``, is resolved on lookup.
+    """
 
-class VolumeBase(MeasureBase):
     def __new__(mcs, name, bases, attrs):
         mcs.freeze_org_units(attrs)
         if "__factors__" in attrs:
             x, y, z = attrs["__factors__"]
             attrs.update(mcs.cubic(x))
+            if all(factor.__dimension__ is not None for factor in (x, y, z)):
+                attrs.setdefault(
+                    "__dimension__",
+                    x.__dimension__ * y.__dimension__ * z.__dimension__,
+                )
         cls = super().__new__(mcs, name, bases, attrs)
         return cls
 
+    def resolve_symbol(cls, symbol):
+        factors = getattr(cls, "__factors__", None)
+        if factors and symbol.endswith("³"):
+            try:
+                name, unit = type(cls).lookup(factors[0], symbol[:-1])
+            except KeyError:
+                pass
+            else:
+                return type(cls).cubic_unit(name, unit)
+        return super().resolve_symbol(symbol)
+
+    @classmethod
+    def cubic(mcs, klass):
+        for name in klass.get_base_unit_names() or []:
+            yield f"{name}³", mcs.cubic_unit(name, klass._units[name])
+
     @staticmethod
-    def cubic(klass):
-        for name, unit in klass._units.items():
-            qs_unit = Unit(factor=unit.factor**3)
-            qs_unit.name = f"{qs_unit.name}³"
-            yield f"{name}³", qs_unit
+    def cubic_unit(name, unit):
+        qs_unit = Unit(factor=unit.factor**3)
+        qs_unit.name = f"{name}³"
+        return qs_unit
 
 
 class Volume(AbstractMeasure, metaclass=VolumeBase):
@@ -260,12 +292,3 @@ class Volume(AbstractMeasure, metaclass=VolumeBase):
         if name[:6] in ["cubic_", "cubic "]:
             name = f"{name[6:]}³"
         return super()._attr_to_unit(name)
-
-    def __truediv__(self, other):
-        if isinstance(other, Distance):
-            return Area(sq_metre=self.si_value / other.si_value)
-
-        if isinstance(other, Area):
-            return Distance(metre=self.si_value / other.si_value)
-
-        return super().__truediv__(other)
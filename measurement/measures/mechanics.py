@@ -1,6 +1,6 @@
 import decimal
 
-from measurement.base import AbstractMeasure, MeasureBase, MetricUnit, Unit
+from measurement.base import AbstractMeasure, Dimension, MeasureBase, MetricUnit, Unit
 
 from .geometry import Distance, Volume
 from .time import Time
@@ -9,27 +9,65 @@ __all__ = ["Mass", "Pressure", "VolumetricFlowRate", "Speed"]
 
 
 class FractionMeasureBase(MeasureBase):
+    """
+    Create a measure defined as a fraction of two other measures.
+
+    Only compound symbols of the numerator's and denominator's base units,
+    like ``m/s``, are stored. Any other compound symbol, like ``km/h``,
+    is resolved against ``__numerator__`` and ``__denominator__`` on lookup.
+    """
+
     def __new__(mcs, name, bases, attrs):
         mcs.freeze_org_units(attrs)
         numerator = attrs["__numerator__"]
         denominator = attrs["__denominator__"]
         attrs.update(mcs.div(numerator, denominator))
+        if (
+            numerator.__dimension__ is not None
+            and denominator.__dimension__ is not None
+        ):
+            attrs.setdefault(
+                "__dimension__", numerator.__dimension__ / denominator.__dimension__
+            )
 
         cls = super().__new__(mcs, name, bases, attrs)
         return cls
 
-    @staticmethod
-    def div(numerator, denominator):
-        for numerator_name, numerator_unit in numerator._units.items():
-            for (
-                denominator_name,
+    def resolve_symbol(cls, symbol):
+        parts = symbol.split("/")
+        for i in range(1, len(parts)):
+            try:
+                numerator_name, numerator_unit = type(cls).lookup(
+                    cls.__numerator__, "/".join(parts[:i])
+                )
+                denominator_name, denominator_unit = type(cls).lookup(
+                    cls.__denominator__, "/".join(parts[i:])
+                )
+            except KeyError:
+                continue
+            return type(cls).div_unit(
+                f"{numerator_name}/{denominator_name}",
+                numerator_unit,
                 denominator_unit,
-            ) in denominator._units.items():
+            )
+        return super().resolve_symbol(symbol)
+
+    @classmethod
+    def div(mcs, numerator, denominator):
+        for numerator_name in numerator.get_base_unit_names() or []:
+            for denominator_name in denominator.get_base_unit_names() or []:
                 name = f"{numerator_name}/{denominator_name}"
-                factor = numerator_unit.factor / denominator_unit.factor
-                unit = Unit(factor=factor)
-                unit.name = name
-                yield name, unit
+                yield name, mcs.div_unit(
+                    name,
+                    numerator._units[numerator_name],
+                    denominator._units[denominator_name],
+                )
+
+    @staticmethod
+    def div_unit(name, numerator_unit, denominator_unit):
+        unit = Unit(factor=numerator_unit.factor / denominator_unit.factor)
+        unit.name = name
+        return unit
 
 
 class VolumetricFlowRate(AbstractMeasure, metaclass=FractionMeasureBase):
@@ -63,6 +101,7 @@ class Speed(AbstractMeasure, metaclass=FractionMeasureBase):
 
 
 class Mass(AbstractMeasure):
+    # Mass has no __dimension__, its SI value is given in grams, not kilograms.
     gram = MetricUnit("1", ["g", "Gram"], ["g"], ["gram"])
     tonne = Unit("1000000", ["t", "metric ton", "metric tonne"])
     ounce = Unit("28.34952", ["oz"])
@@ -73,6 +112,8 @@ class Mass(AbstractMeasure):
 
 
 class Pressure(AbstractMeasure):
+    __dimension__ = Dimension(length=-1, mass=1, time=-2)
+
     pascal = MetricUnit("1", ["pa"], ["pa"], ["pascal"])
     bar = Unit("100000")
     atmosphere = Unit("101325", ["atm"])
@@ -1,4 +1,4 @@
-from measurement.base import AbstractMeasure, MetricUnit
+from measurement.base import AbstractMeasure, Dimension, MetricUnit
 
 __all__ = ["Radioactivity"]
 
@@ -6,6 +6,8 @@ __all__ = ["Radioactivity"]
 class Radioactivity(AbstractMeasure):
     """Radioactivity measurements."""
 
+    __dimension__ = Dimension(time=-1)
+
     becquerel = MetricUnit("1", ["Bq"], ["Bq"])
     curie = MetricUnit("37000000000", ["Ci"], ["Ci"])
     rutherford = MetricUnit("1000000", ["Rd"], ["Rd"])
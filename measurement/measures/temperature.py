@@ -1,41 +1,87 @@
-import dataclasses
 import decimal
-from typing import List
+import fractions
 
-from ..base import AbstractMeasure, AbstractUnit, MetricUnit
+from ..base import AbstractMeasure, AffineUnit, Dimension, MetricUnit, Unit, qualname
 
-__all__ = ["Temperature"]
+__all__ = ["Temperature", "TemperatureDifference"]
 
 
-@dataclasses.dataclass
-class DegreeUnit(AbstractUnit):
-    symbols: List[str] = dataclasses.field(default_factory=list)
-    """Symbols used to describe this unit."""
+ZERO_CELSIUS = decimal.Decimal("273.15")
+ZERO_FAHRENHEIT = decimal.Decimal("459.67")
 
-    def get_symbols(self):
-        yield self.name.replace("_", " "), type(self)()
-        yield from ((name, type(self)()) for name in self.symbols)
 
+class DegreeCelcius(AffineUnit):
+    def __init__(self, symbols=None):
+        super().__init__("1", symbols or [], ZERO_CELSIUS)
 
-class DegreeCelcius(DegreeUnit):
-    def to_si(self, value):
-        return value + decimal.Decimal("273.15")
 
-    def from_si(self, value):
-        return value - decimal.Decimal("273.15")
+class DegreeFahrenheit(AffineUnit):
+    def __init__(self, symbols=None):
+        super().__init__(fractions.Fraction(5, 9), symbols or [], ZERO_FAHRENHEIT)
 
 
-class DegreeFahrenheit(DegreeUnit):
-    def to_si(self, value):
-        celsius = (value - 32) * 5 / 9
-        return celsius + decimal.Decimal("273.15")
+class Temperature(AbstractMeasure):
+    """
+    An absolute temperature, like the temperature of a room.
 
-    def from_si(self, value):
-        celsius = value - decimal.Decimal("273.15")
-        return celsius * 9 / 5 + 32
+    Subtracting two temperatures returns a :class:`TemperatureDifference`,
+    which in turn can be added to or subtracted from a temperature:
 
+        >>> from measurement import measures
+        >>> measures.Temperature("20 °C") - measures.Temperature("15 °C")
+        TemperatureDifference(delta_celsius="5.00")
+        >>> measures.Temperature("20 °C") + measures.TemperatureDifference("5 ΔK")
+        Temperature(celsius="25.00")
+
+    A difference can also be added to a temperature the other way round.
+    Two temperatures can not be added, since the result would depend
+    on the zero point of their units.
+    """
+
+    __dimension__ = Dimension(temperature=1)
 
-class Temperature(AbstractMeasure):
     kelvin = MetricUnit("1", ["K", "Kelvin"], ["K"], ["kelvin"])
     celsius = DegreeCelcius(["°C"])
     fahrenheit = DegreeFahrenheit(["°F"])
+
+    def __add__(self, other):
+        if not isinstance(other, TemperatureDifference):
+            raise TypeError(f"can't add type '{qualname(self)}' to '{qualname(other)}'")
+        return self._from_si(self._si_add(other), self.unit, self.symbol)
+
+    def __sub__(self, other):
+        if isinstance(other, TemperatureDifference):
+            return self._from_si(self._si_sub(other), self.unit, self.symbol)
+        if isinstance(other, Temperature):
+            units = TemperatureDifference._org_units
+            # Prefixed units of kelvin are named like kelvin itself.
+            unit = units.get(f"delta_{self.unit.name}", units["delta_kelvin"])
+            return TemperatureDifference.from_si(self._si_sub(other), unit.symbols[0])
+        raise TypeError(
+            f"can't subtract type '{qualname(other)}' from '{qualname(self)}'"
+        )
+
+    def _si_add(self, other):
+        if isinstance(self.si_value, float) or isinstance(other.si_value, float):
+            return float(self.si_value) + float(other.si_value)
+        return self._get_context().add(self.si_value, other.si_value)
+
+    def _si_sub(self, other):
+        if isinstance(self.si_value, float) or isinstance(other.si_value, float):
+            return float(self.si_value) - float(other.si_value)
+        return self._get_context().subtract(self.si_value, other.si_value)
+
+
+class TemperatureDifference(AbstractMeasure):
+    """The difference of two :class:`Temperatures<Temperature>`."""
+
+    __dimension__ = Dimension(temperature=1)
+
+    delta_kelvin = Unit("1", ["ΔK"])
+    delta_celsius = Unit("1", ["Δ°C"])
+    delta_fahrenheit = Unit(fractions.Fraction(5, 9), ["Δ°F"])
+
+    def __add__(self, other):
+        if isinstance(other, Temperature):
+            return other + self
+        return super().__add__(other)
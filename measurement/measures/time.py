@@ -1,6 +1,6 @@
 import decimal
 
-from measurement.base import AbstractMeasure, MetricUnit, Unit
+from measurement.base import AbstractMeasure, Dimension, MetricUnit, Unit
 
 __all__ = ["Time", "Frequency"]
 
@@ -14,6 +14,8 @@ class Time(AbstractMeasure):
     functionality for handling intervals of time than this class provides.
     """
 
+    __dimension__ = Dimension(time=1)
+
     second = MetricUnit("1", ["s", "sec", "seconds"], ["s"], ["sec"])
     minute = Unit("60", ["min", "minutes"])
     hour = Unit("3600", ["hr", "h", "hours"])
@@ -27,10 +29,7 @@ class Time(AbstractMeasure):
 
 
 class Frequency(AbstractMeasure):
+    __dimension__ = Dimension(time=-1)
+
     hertz = MetricUnit("1", ["Hz", "Hertz"], ["Hz"], ["hertz"])
     rpm = Unit(decimal.Decimal("1.0") / decimal.Decimal("60"), ["RPM", "bpm", "BPM"])
-
-    def __mul__(self, other):
-        if isinstance(other, Time):
-            return self.si_value * other.si_value
-        return super().__mul__(other)
@@ -0,0 +1,166 @@
+"""
+Convert large amounts of values in parallel, on a pool of processes or threads.
+
+Values are split into chunks, which are converted by a
+:class:`Converter<measurement.base.Converter>` in the workers of a
+:mod:`concurrent.futures` executor. Only the unit symbols and the raw values
+of each chunk are sent to the workers, no measures:
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from measurement import parallel
+    >>> from measurement.measures import Distance
+    >>> with ThreadPoolExecutor(2) as executor:
+    ...     list(parallel.convert([1.0, 2.0], Distance, "mi", "km", executor=executor))
+    [1.609344, 3.218688]
+
+By default, a :class:`~concurrent.futures.ProcessPoolExecutor` with one
+process per CPU is used. Its workers import the measure by name, thus the
+measure needs to be defined at the top level of a module. Threads only
+speed up conversions on Python builds without a global interpreter lock.
+
+Sending values to another process and back costs time, too. Floats and
+NumPy arrays are cheap to send, whereas sending a
+:class:`Decimal<decimal.Decimal>` costs about as much as a simple
+conversion of it. Run ``python -m benchmarks.parallel`` to compare the
+throughput of both kinds of pools on your machine.
+"""
+import collections
+import collections.abc
+import concurrent.futures
+import functools
+import itertools
+import os
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from measurement.base import Converter, MeasureBase
+
+__all__ = ["convert", "convert_chunks"]
+
+DEFAULT_CHUNKSIZE = 10000
+"""Number of values converted per task."""
+
+
+def convert(
+    values: Iterable,
+    measure: MeasureBase,
+    from_unit: str,
+    to_units: Union[str, Iterable[str]],
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Iterator:
+    """
+    Yield all values converted to the target units, in order of the values.
+
+    If ``to_units`` is a single unit, the converted values are yielded.
+    Otherwise, a tuple of each value in all target units is yielded.
+    See :func:`convert_chunks` for the other arguments.
+
+    Raises:
+        KeyError: If the measure has no such unit.
+    """
+    chunks = convert_chunks(
+        values, measure, from_unit, to_units, chunksize=chunksize, executor=executor
+    )
+    for _, converted in chunks:
+        yield from converted
+
+
+def convert_chunks(
+    values: Iterable,
+    measure: MeasureBase,
+    from_unit: str,
+    to_units: Union[str, Iterable[str]],
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: Optional[concurrent.futures.Executor] = None,
+    ordered: bool = True,
+) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Yield the offset of each chunk of values and the chunk's converted values.
+
+    The values may be any iterable, like a generator reading a file.
+    Sequences, like lists or NumPy arrays, are sliced instead of iterated.
+    Values are consumed lazily, at most two chunks per worker are queued
+    or being converted at any time.
+
+    If ``ordered`` is false, chunks are yielded as soon as they are
+    converted, rather than in the order of their offsets.
+
+    A given executor is used as is. Otherwise, a process pool is created
+    and shut down once all chunks are yielded or the iterator is closed.
+
+    Raises:
+        KeyError: If the measure has no such unit.
+        ValueError: If the chunk size is not positive.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive, not {chunksize}")
+    single = isinstance(to_units, str)
+    to_units = (to_units,) if single else tuple(to_units)
+    for to_unit in to_units:
+        measure.converter(from_unit, to_unit)  # fail before any work is submitted
+    task = functools.partial(_convert_chunk, measure, from_unit, to_units, single)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ProcessPoolExecutor()
+    workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    pending: Deque[Tuple[int, concurrent.futures.Future]] = collections.deque()
+    try:
+        for offset, chunk in _chunks(values, chunksize):
+            pending.append((offset, executor.submit(task, chunk)))
+            if len(pending) >= 2 * workers:
+                yield from _pop_done(pending, ordered)
+        while pending:
+            yield from _pop_done(pending, ordered)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def _chunks(values, chunksize):
+    """Yield offset and values of each chunk."""
+    if isinstance(values, collections.abc.Sequence) or hasattr(values, "__array__"):
+        for offset in range(0, len(values), chunksize):
+            yield offset, values[offset : offset + chunksize]
+        return
+    iterator = iter(values)
+    for offset in itertools.count(0, chunksize):
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield offset, chunk
+
+
+def _pop_done(pending, ordered):
+    """Remove and yield offset and result of the next or all completed chunks."""
+    if ordered:
+        offset, future = pending.popleft()
+        yield offset, future.result()
+        return
+    done, _ = concurrent.futures.wait(
+        [future for _, future in pending],
+        return_when=concurrent.futures.FIRST_COMPLETED,
+    )
+    for item in [item for item in pending if item[1] in done]:
+        pending.remove(item)
+        yield item[0], item[1].result()
+
+
+def _convert_chunk(measure, from_unit, to_units, single, values):
+    """Return values converted to all units, run by the workers."""
+    converted = [
+        _converter(measure, from_unit, to_unit).convert_many(values)
+        for to_unit in to_units
+    ]
+    if single:
+        return converted[0]
+    return list(zip(*converted))
+
+
+@functools.lru_cache(maxsize=128)
+def _converter(measure, from_unit, to_unit) -> Converter:
+    return measure.converter(from_unit, to_unit)
@@ -0,0 +1,186 @@
+"""
+Compact binary serialization of many measures of the same type.
+
+Pickling a list of measures stores the class, symbol and SI value of every
+single measure. :func:`dumps_many` stores the class and each distinct symbol
+only once, followed by packed columns of the symbols and SI values:
+
+    >>> from measurement import serialization
+    >>> from measurement.measures import Distance
+    >>> data = serialization.dumps_many([Distance("1 km"), Distance("2.5 mi")])
+    >>> serialization.loads_many(data)
+    [Distance(metre="1E+3"), Distance(mile="2.5")]
+
+:class:`Decimal<decimal.Decimal>` values round-trip exactly, including their
+exponent. Float backed measures are packed as 8 byte doubles.
+
+The format is, with all integers little-endian:
+
+- the magic bytes ``MEAS``, the format version (1 byte), the type of the
+  values, ``d`` for Decimals and ``f`` for floats (1 byte), and the number
+  of measures (4 bytes),
+- the measure class as ``module:qualname`` and the number of distinct
+  symbols (2 bytes), followed by the symbols, each as UTF-8 string,
+  prefixed by its length (2 bytes),
+- the index of each measure's symbol in the symbols, as 1 byte if there
+  are at most 256 symbols, otherwise 2 bytes,
+- the SI value of each measure, as double or as Decimal string
+  separated by spaces.
+
+Like :mod:`pickle`, only load data from trusted sources, since the module
+of the measure class is imported.
+"""
+import array
+import decimal
+import importlib
+import struct
+import sys
+from typing import Iterable, List
+
+from measurement.base import AbstractMeasure, MeasureBase, qualname
+
+__all__ = ["dumps_many", "loads_many"]
+
+MAGIC = b"MEAS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBcI")
+_LENGTH = struct.Struct("<H")
+
+
+def dumps_many(measures: Iterable[AbstractMeasure]) -> bytes:
+    """
+    Return measures of the same type packed into bytes, see :func:`loads_many`.
+
+    Raises:
+        TypeError: If the measures are not of the same type or their SI values
+            are not all Decimals or all floats.
+        ValueError: If the measure class can't be imported by its name.
+    """
+    measures = list(measures)
+    if not measures:
+        return _HEADER.pack(MAGIC, VERSION, b"d", 0) + _string("") + _LENGTH.pack(0)
+    measure = type(measures[0])
+    for other in measures:
+        if type(other) is not measure:
+            raise TypeError(
+                f"expected type '{qualname(measure)}' not '{qualname(other)}'"
+            )
+    name = f"{measure.__module__}:{measure.__qualname__}"
+    if _import(name) is not measure:
+        raise ValueError(f"can't import measure '{qualname(measure)}' by its name")
+
+    symbols = [m.symbol for m in measures]
+    table = list(dict.fromkeys(symbols))
+    indexes = dict(zip(table, range(len(table))))
+    symbol_column = array.array(_index_type(len(table)), map(indexes.get, symbols))
+
+    values = [m.si_value for m in measures]
+    kind = b"f" if isinstance(values[0], float) else b"d"
+    expected = float if kind == b"f" else decimal.Decimal
+    for value in values:
+        if type(value) is not expected:
+            raise TypeError(
+                f"expected SI value of type '{qualname(expected)}'"
+                f" not '{qualname(value)}'"
+            )
+    if kind == b"f":
+        value_column = array.array("d", values)
+        if sys.byteorder == "big":
+            value_column.byteswap()
+        packed_values = value_column.tobytes()
+    else:
+        packed_values = " ".join(map(str, values)).encode("ascii")
+    if sys.byteorder == "big":
+        symbol_column.byteswap()
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, kind, len(measures)),
+            _string(name),
+            _LENGTH.pack(len(table)),
+            *map(_string, table),
+            symbol_column.tobytes(),
+            packed_values,
+        ]
+    )
+
+
+def loads_many(data: bytes) -> List[AbstractMeasure]:
+    """
+    Return the list of measures packed by :func:`dumps_many`.
+
+    Raises:
+        ValueError: If the data is not a batch of measures.
+        KeyError: If the measure has no such unit.
+    """
+    try:
+        magic, version, kind, count = _HEADER.unpack_from(data)
+        if magic != MAGIC or kind not in (b"d", b"f"):
+            raise ValueError("data is not a batch of measures")
+        if version != VERSION:
+            raise ValueError(f"unsupported batch format version {version}")
+        name, offset = _read_string(data, _HEADER.size)
+        (table_size,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        table = []
+        for _ in range(table_size):
+            symbol, offset = _read_string(data, offset)
+            table.append(symbol)
+    except struct.error as e:
+        raise ValueError("data is not a batch of measures") from e
+    if not count:
+        return []
+
+    measure = _import(name)
+    if not isinstance(measure, MeasureBase):
+        raise ValueError(f"'{name}' is not a measure")
+    units = [measure._units.find(symbol)[::-1] for symbol in table]
+
+    symbol_column = array.array(_index_type(table_size))
+    end = offset + count * symbol_column.itemsize
+    symbol_column.frombytes(data[offset:end])
+    if kind == b"f":
+        value_column = array.array("d")
+        value_column.frombytes(data[end : end + count * value_column.itemsize])
+        if sys.byteorder == "big":
+            value_column.byteswap()
+        values = value_column.tolist()
+    else:
+        values = list(map(decimal.Decimal, bytes(data[end:]).decode("ascii").split()))
+    if sys.byteorder == "big":
+        symbol_column.byteswap()
+    if len(symbol_column) != count or len(values) != count:
+        raise ValueError(f"expected {count} measures, data is truncated")
+
+    from_si = measure._from_si
+    return [from_si(value, *units[i]) for i, value in zip(symbol_column, values)]
+
+
+def _index_type(table_size: int) -> str:
+    """Return the :mod:`array` type code of the indexes into the symbols."""
+    return "B" if table_size <= 256 else "H"
+
+
+def _string(string: str) -> bytes:
+    encoded = string.encode()
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _read_string(data: bytes, offset: int):
+    """Return the string at the offset and the offset after it."""
+    (length,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    return bytes(data[offset : offset + length]).decode(), offset + length
+
+
+def _import(name: str):
+    """Return the object of a ``module:qualname`` name, or ``None`` if there is none."""
+    module_name, _, qualified_name = name.partition(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for attr in qualified_name.split("."):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError):
+        return None
+    return obj
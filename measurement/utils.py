@@ -1,7 +1,22 @@
-def guess(value, unit, measures=None):
+import dataclasses
+import decimal
+import functools
+import importlib
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+def guess(value, unit, measures=None, prefer=None):
     """
     Return measurement instance based on given unit.
 
+    By default, all built-in measures are checked in the order of their
+    definition, followed by any other measure in the order of creation.
+    Measure modules are only loaded until a match is found. The matching
+    measures are looked up once per unit and cached.
+
+    If a unit is accepted by multiple measures, the first measure in
+    ``prefer`` accepting the unit wins, see :func:`ambiguities`.
+
     Raises:
         ValueError: If measurement type cannot be guessed.
 
@@ -9,11 +24,347 @@ def guess(value, unit, measures=None):
         MeasureBase: Measurement instance based on given unit.
 
     """
-    from measurement.base import AbstractMeasure
+    measure = _guess_measure(unit, measures, prefer)
+    if measure is None:
+        raise ValueError(f"can't guess measure for '{value} {unit}'")
+    return measure(value, unit)
+
+
+def guess_many(pairs, measures=None, prefer=None):
+    """
+    Return a list of measurement instances based on given value and unit pairs.
 
-    for measure in measures or AbstractMeasure.__subclasses__():
+    Like :func:`guess`, but the measure is only looked up once per unit:
+
+        >>> from measurement.utils import guess_many
+        >>> guess_many([(1, "m"), (2, "g"), (3, "m")])
+        [Distance(metre="1"), Mass(gram="2"), Distance(metre="3")]
+
+    Raises:
+        ValueError: If measurement type cannot be guessed.
+
+    """
+    guessed = {}
+    results = []
+    for value, unit in pairs:
         try:
-            return measure(**{unit: value})
+            measure = guessed[unit]
         except KeyError:
-            pass
-    raise ValueError(f"can't guess measure for '{value} {unit}'")
+            result = guess(value, unit, measures, prefer)
+            guessed[unit] = type(result)
+        else:
+            result = measure(value, unit)
+        results.append(result)
+    return results
+
+
+@dataclasses.dataclass(frozen=True)
+class Guess:
+    """Outcome of guessing the measure of a unit, see :func:`guess_report`."""
+
+    unit: str
+    """Unit as given."""
+
+    measure: Optional[Any]
+    """Measure :func:`guess` picks for the unit, or ``None`` if there is none."""
+
+    candidates: Tuple[Any, ...]
+    """All measures accepting the unit, in order of precedence."""
+
+    @property
+    def ambiguous(self) -> bool:
+        """Return whether more than one measure accepts the unit."""
+        return len(self.candidates) > 1
+
+
+def guess_report(units, measures=None, prefer=None) -> Dict[str, Guess]:
+    """
+    Return a :class:`.Guess` for each distinct unit, without raising errors.
+
+    This allows to classify a whole schema of units at once and to review
+    units that are unknown or ambiguous:
+
+        >>> from measurement.utils import guess_report
+        >>> report = guess_report(["km", "ha", "furlongs", "km"])
+        >>> [r.measure.__name__ for r in report.values() if r.measure]
+        ['Distance', 'Area']
+        >>> [unit for unit, r in report.items() if r.ambiguous]
+        ['ha']
+    """
+    report = {}
+    for unit in units:
+        if unit not in report:
+            candidates = _candidates(unit, measures, prefer)
+            report[unit] = Guess(
+                unit=unit,
+                measure=candidates[0] if candidates else None,
+                candidates=candidates,
+            )
+    return report
+
+
+def ambiguities() -> Dict[str, Tuple[Any, ...]]:
+    """
+    Return all symbols accepted by more than one measure and those measures.
+
+    The measures are ordered by precedence, :func:`guess` picks the first
+    one, unless another one is preferred:
+
+        >>> from measurement.utils import ambiguities
+        >>> [m.__name__ for m in ambiguities()["ha"]]
+        ['Area', 'Time']
+
+    See :meth:`MeasureIndex.ambiguities<measurement.base.MeasureIndex.ambiguities>`
+    for the symbols included.
+    """
+    from measurement.base import measure_index
+
+    _builtin_order()  # built-in measures need to be loaded to be found
+    return {
+        symbol: _sort_measures(measures)
+        for symbol, measures in measure_index.ambiguities().items()
+    }
+
+
+def _guess_measure(unit: str, measures: Optional[Iterable], prefer: Optional[Iterable]):
+    """Return the measure of highest precedence accepting the unit, or ``None``."""
+    measures = tuple(measures or ())
+    for measure in prefer or ():
+        if (not measures or measure in measures) and _accepts(measure, unit):
+            return measure
+    if measures:
+        return next((m for m in measures if _accepts(m, unit)), None)
+
+    from measurement import measures as builtin
+    from measurement.base import measure_index
+
+    # Measures of the same module are indexed in the order of their definition.
+    for module_name in builtin._MODULES:
+        module = importlib.import_module(f".{module_name}", builtin.__name__)
+        for measure in measure_index.find(unit):
+            if measure.__module__ == module.__name__:
+                return measure
+    found = measure_index.find(unit)  # all built-in measures are loaded by now
+    return found[0] if found else None
+
+
+def _candidates(unit: str, measures: Optional[Iterable], prefer: Optional[Iterable]):
+    """Return all measures accepting the unit, in order of precedence."""
+    if measures:
+        candidates = tuple(m for m in measures if _accepts(m, unit))
+    else:
+        candidates = _find_measures(unit)
+    if prefer and len(candidates) > 1:
+        preferred = tuple(m for m in prefer if m in candidates)
+        candidates = preferred + tuple(m for m in candidates if m not in preferred)
+    return candidates
+
+
+def _accepts(measure, unit: str) -> bool:
+    return measure._units.resolve_name(unit)[1] is not None
+
+
+def _find_measures(unit):
+    """Return all measures accepting the unit, built-in measures first."""
+    from measurement.base import measure_index
+
+    _builtin_order()  # built-in measures need to be loaded to be found
+    return _sort_measures(measure_index.find(unit))
+
+
+def _sort_measures(measures):
+    if len(measures) > 1:
+        order = _builtin_order()
+        return tuple(sorted(measures, key=lambda m: order.get(m, len(order))))
+    return measures
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_order():
+    """Return position of all built-in measures, loading them on the first call."""
+    from measurement import measures
+
+    return {m: i for i, m in enumerate(measures._iter_measures())}
+
+
+def sum(measures, unit=None, *, key=None, compensated=False):
+    """
+    Return sum of measures of the same type, in the given unit.
+
+    Unlike the built-in :func:`sum`, no intermediate measures are created,
+    the SI values are accumulated directly. Without a unit, the unit of
+    the first measure is used:
+
+        >>> from measurement import measures
+        >>> from measurement.utils import sum
+        >>> sum([measures.Distance("1 km"), measures.Distance("500 m")])
+        Distance(metre="1500")
+
+    If ``compensated`` is true, :class:`float` values are summed using
+    Neumaier's compensated summation and :class:`Decimal<decimal.Decimal>`
+    values are summed exactly and only rounded once, otherwise they are
+    rounded to the measure's context with every addition.
+
+    If ``key`` is given, the measures are grouped by their key, like
+    ``key=type``, and a dictionary of the sum of each group is returned.
+
+    Raises:
+        TypeError: If measures of a group are not of the same type.
+        ValueError: If there are no measures and no key is given.
+        KeyError: If a measure has no such unit.
+    """
+    return _reduce("sum", measures, unit, key, _Sum, compensated)
+
+
+def mean(measures, unit=None, *, key=None, compensated=False):
+    """
+    Return arithmetic mean of measures of the same type, in the given unit.
+
+    Arguments are the same as for :func:`sum`:
+
+        >>> from measurement import measures
+        >>> from measurement.utils import mean
+        >>> mean([measures.Distance("1 km"), measures.Distance("500 m")], "m")
+        Distance(metre="750")
+    """
+    return _reduce("mean", measures, unit, key, _Mean, compensated)
+
+
+def min(measures, unit=None, *, key=None):
+    """
+    Return smallest of measures of the same type.
+
+    Without a unit, the smallest measure itself is returned. Otherwise,
+    a measure of the same value in the given unit. Like :func:`sum`,
+    measures are grouped if ``key`` is given.
+    """
+    return _reduce("min", measures, unit, key, _Min)
+
+
+def max(measures, unit=None, *, key=None):
+    """
+    Return largest of measures of the same type.
+
+    See :func:`min` for the arguments.
+    """
+    return _reduce("max", measures, unit, key, _Max)
+
+
+def _reduce(name, measures, unit, key: Optional[Callable], accumulator, *args):
+    """Return result of the accumulator of all measures, or per group if key is given."""
+    groups = {}
+    for measure in measures:
+        group = None if key is None else key(measure)
+        try:
+            accumulated = groups[group]
+        except KeyError:
+            groups[group] = accumulator(measure, *args)
+        else:
+            accumulated.add(measure)
+    if key is None:
+        if not groups:
+            raise ValueError(f"{name}() arg is an empty iterable")
+        return groups[None].result(unit)
+    return {group: accumulated.result(unit) for group, accumulated in groups.items()}
+
+
+class _Accumulator:
+    __slots__ = ("measure", "first")
+
+    def __init__(self, first):
+        self.measure = type(first)
+        self.first = first
+
+    def check(self, measure):
+        if not isinstance(measure, self.measure):
+            from measurement.base import qualname
+
+            raise TypeError(
+                f"expected type '{qualname(self.measure)}' not '{qualname(measure)}'"
+            )
+
+    def to_measure(self, si_value, unit):
+        if unit is None:
+            return self.measure._from_si(si_value, self.first.unit, self.first.symbol)
+        return self.measure.from_si(si_value, unit)
+
+
+class _Sum(_Accumulator):
+    __slots__ = ("decimal", "float", "compensation", "context", "count")
+
+    def __init__(self, first, compensated):
+        super().__init__(first)
+        self.decimal = decimal.Decimal(0)
+        self.float = self.compensation = None
+        self.context = self.measure.decimal_context
+        if compensated:
+            self.context = decimal.Context(
+                prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+            )
+            self.compensation = 0.0
+        self.count = 0
+        self.add(first)
+
+    def add(self, measure):
+        self.check(measure)
+        self.count += 1
+        value = measure.si_value
+        if isinstance(value, float):
+            total = self.float
+            if total is None:
+                self.float = value
+            elif self.compensation is None:
+                self.float = total + value
+            else:
+                self.float = total + value
+                if abs(total) >= abs(value):
+                    self.compensation += (total - self.float) + value
+                else:
+                    self.compensation += (value - self.float) + total
+        elif self.context is None:
+            self.decimal += value
+        else:
+            self.decimal = self.context.add(self.decimal, value)
+
+    def total(self):
+        if self.float is None:
+            return self.measure._get_context().plus(self.decimal)
+        return float(self.decimal) + self.float + (self.compensation or 0.0)
+
+    def result(self, unit):
+        return self.to_measure(self.total(), unit)
+
+
+class _Mean(_Sum):
+    __slots__ = ()
+
+    def result(self, unit):
+        total = self.total()
+        if isinstance(total, float):
+            return self.to_measure(total / self.count, unit)
+        return self.to_measure(
+            self.measure._get_context().divide(total, self.count), unit
+        )
+
+
+class _Min(_Accumulator):
+    __slots__ = ()
+
+    def add(self, measure):
+        self.check(measure)
+        if measure.si_value < self.first.si_value:
+            self.first = measure
+
+    def result(self, unit):
+        if unit is None:
+            return self.first
+        return self.to_measure(self.first.si_value, unit)
+
+
+class _Max(_Min):
+    __slots__ = ()
+
+    def add(self, measure):
+        self.check(measure)
+        if measure.si_value > self.first.si_value:
+            self.first = measure
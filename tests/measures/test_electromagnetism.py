@@ -20,6 +20,18 @@ class TestVoltage:
     def test_mul__super(self):
         assert measures.Voltage("6 V") * 2 == measures.Voltage("12 V")
 
+    def test_truediv__current(self):
+        assert measures.Voltage("12 V") / measures.Current(
+            "4 A"
+        ) == measures.Resistance("3 Ω")
+
+
+class TestResistance:
+    def test_mul__capacitance(self):
+        assert measures.Resistance("2 kΩ") * measures.Capacitance(
+            "3 mF"
+        ) == measures.Time("6 s")
+
 
 class TestElectricPower:
     def test_truediv__voltage(self):
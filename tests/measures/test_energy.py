@@ -1,4 +1,4 @@
-from measurement.measures import Energy
+from measurement.measures import ElectricPower, Energy, Pressure, Time, Volume
 
 
 class TestEnergy:
@@ -7,3 +7,9 @@ class TestEnergy:
         kilojoules = Energy(kJ=8368)
 
         assert calories.si_value == kilojoules.si_value
+
+    def test_truediv__time(self):
+        assert Energy("1 kJ") / Time("20 s") == ElectricPower("50 W")
+
+    def test_truediv__volume(self):
+        assert Energy("6 J") / Volume("2 m³") == Pressure("3 pa")
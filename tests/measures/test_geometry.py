@@ -59,10 +59,10 @@ class TestDistance:
         with pytest.raises(TypeError):
             Distance(m=1) ** 4
 
-    def test_unit_org_name(self):
+    def test_symbol(self):
         one_mile = Distance(mi=1)
 
-        assert one_mile.unit.org_name == "mi"
+        assert one_mile.symbol == "mi"
 
     def test_base_unit_names(self):
         one_mile = Distance(mi=1)
@@ -103,6 +103,18 @@ class TestArea:
     def test_mul__super(self):
         assert Area("1 m²") * 2 == Area("2 m²")
 
+    def test_stored_units(self):
+        assert "m²" in dict.keys(Area._units)
+        assert "km²" not in dict.keys(Area._units)
+
+    def test_resolve_symbol(self):
+        assert Area._units["km²"].factor == decimal.Decimal("1E+6")
+        assert Area._units["km²"].name == "km²"
+        assert Area._units["british ft²"].name == "british_ft²"
+        assert Area.resolve_symbol("km") is None
+        assert Area.resolve_symbol("does not exist²") is None
+        assert repr(Area(sq_km=1)) == 'Area(km²="1")'
+
     def test_attr_to_unit(self):
         assert Area._attr_to_unit("sq_m") == "m²"
         assert Area._attr_to_unit("sq m") == "m²"
@@ -128,5 +140,16 @@ class TestVolume:
     def test_us_fluid_ounce(self):
         assert Volume("29.57353 mL") == Volume("1 US fl oz")
 
+    def test_resolve_symbol(self):
+        assert Volume._units["km³"].factor == decimal.Decimal("1E+9")
+        assert Volume._units["km³"].name == "km³"
+        assert Volume._units["kL"].factor == decimal.Decimal("1")
+        assert Volume._units["kL"].name == "litre"
+        assert Volume.resolve_symbol("km") is None
+        assert Volume.resolve_symbol("does not exist³") is None
+
+    def test_micro_sign(self):
+        assert Volume("1 µm³") == Volume("1 μm³")
+
     def test_imperial_flud_ounce(self):
         assert Volume("28.41306 mL") == Volume("1 imp fl oz")
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+from measurement import measures
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_lazy_import():
+    assert run(
+        "import sys; from measurement.measures import Temperature;"
+        "print(*sorted(m for m in sys.modules if m.startswith('measurement.measures.')))"
+    ) == ["measurement.measures.temperature"]
+
+
+def test_lazy_import__dependencies():
+    assert run(
+        "import sys; from measurement.measures import Speed;"
+        "print(*sorted(m for m in sys.modules if m.startswith('measurement.measures.')))"
+    ) == [
+        "measurement.measures.geometry",
+        "measurement.measures.mechanics",
+        "measurement.measures.time",
+    ]
+
+
+def test_getattr():
+    from measurement.measures.mechanics import Speed
+
+    assert measures.Speed is Speed
+    assert measures.Heat is measures.Energy
+
+
+def test_getattr__attribute_error():
+    with pytest.raises(AttributeError) as e:
+        measures.DoesNotExist
+    assert str(e.value) == (
+        "module 'measurement.measures' has no attribute 'DoesNotExist'"
+    )
+
+
+def test_all():
+    for name in measures.__all__:
+        assert getattr(measures, name).__name__ in measures.__all__
+    assert set(measures.__all__) <= set(dir(measures))
+
+
+def test_iter_measures():
+    assert [m.__name__ for m in measures._iter_measures()] == [
+        "Capacitance",
+        "Current",
+        "Resistance",
+        "Voltage",
+        "Inductance",
+        "ElectricPower",
+        "Energy",
+        "Distance",
+        "Area",
+        "Volume",
+        "Time",
+        "Frequency",
+        "VolumetricFlowRate",
+        "Speed",
+        "Mass",
+        "Pressure",
+        "Radioactivity",
+        "Temperature",
+        "TemperatureDifference",
+    ]
@@ -0,0 +1,40 @@
+import decimal
+
+from measurement.measures import Distance, Speed, Time, Volume, VolumetricFlowRate
+
+
+class TestFractionMeasureBase:
+    def test_stored_units(self):
+        assert "m/s" in dict.keys(Speed._units)
+        assert "km/h" not in dict.keys(Speed._units)
+
+    def test_resolve_symbol(self):
+        unit = Speed._units["km/h"]
+        assert unit.name == "km/h"
+        assert unit.factor == Distance._units["km"].factor / Time._units["h"].factor
+        assert Speed._units["km/h"] is unit
+
+    def test_resolve_symbol__unknown(self):
+        assert Speed.resolve_symbol("km") is None
+        assert Speed.resolve_symbol("km/does-not-exist") is None
+        assert "does-not-exist/h" not in Speed._units
+
+    def test_resolve_symbol__underscore(self):
+        unit = Speed._units["british ft/second"]
+        assert unit.name == "british_ft/second"
+
+    def test_base_unit_names(self):
+        assert "m/s" in Speed.get_base_unit_names()
+        assert "metre/second" in Speed.get_base_unit_names()
+
+
+class TestVolumetricFlowRate:
+    def test_compound_units(self):
+        assert VolumetricFlowRate("60 L/min") == VolumetricFlowRate("1 L/s")
+        assert VolumetricFlowRate(L__min=60).cms == decimal.Decimal("0.001")
+
+    def test_repr(self):
+        assert repr(VolumetricFlowRate(L__min=1)) == 'VolumetricFlowRate(L/min="1")'
+
+    def test_numerator(self):
+        assert VolumetricFlowRate.__numerator__ is Volume
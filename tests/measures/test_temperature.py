@@ -2,7 +2,7 @@ import decimal
 
 import pytest
 
-from measurement.measures import Temperature
+from measurement.measures import Temperature, TemperatureDifference
 
 
 class TestTemperature:
@@ -21,3 +21,67 @@ class TestTemperature:
     def test_ensure_that_we_always_output_float(self):
         kelvin = Temperature(kelvin=10)
         assert isinstance(kelvin.celsius, decimal.Decimal)
+
+    def test_float(self):
+        celsius = Temperature.float(celsius=20)
+        assert celsius.si_value == pytest.approx(293.15)
+        assert celsius.fahrenheit == pytest.approx(68)
+        assert celsius.celsius == pytest.approx(20)
+        assert Temperature.float(fahrenheit=68).celsius == pytest.approx(20)
+
+    def test_round_trip(self):
+        assert Temperature(fahrenheit=212).celsius == 100
+        assert Temperature(fahrenheit=212).fahrenheit == 212
+
+    def test_sub(self):
+        difference = Temperature("20 °C") - Temperature("50 °F")
+        assert isinstance(difference, TemperatureDifference)
+        assert difference == TemperatureDifference("10 ΔK")
+        assert difference.unit.name == "delta_celsius"
+        assert (Temperature("1 K") - Temperature("0 K")).unit.name == "delta_kelvin"
+        assert (Temperature("1 mK") - Temperature("0 K")).unit.name == "delta_kelvin"
+        assert str(Temperature("20 °C") - Temperature("10 °C")) == "10.00 Δ°C"
+        assert str(Temperature("50 °F") - Temperature("10 °C")) == "0.00 Δ°F"
+        assert (Temperature("1 mK") - Temperature("0 K")).symbol == "ΔK"
+
+    def test_sub__difference(self):
+        temperature = Temperature("68 °F") - TemperatureDifference("18 Δ°F")
+        assert temperature == Temperature("10 °C")
+        assert temperature.symbol == "°F"
+
+    def test_add__difference(self):
+        temperature = Temperature("20 °C") + TemperatureDifference("9 Δ°F")
+        assert temperature == Temperature("25 °C")
+        assert temperature.symbol == "°C"
+
+    def test_add__reflected(self):
+        temperature = TemperatureDifference("9 Δ°F") + Temperature("20 °C")
+        assert temperature == Temperature("25 °C")
+        assert temperature.symbol == "°C"
+        with pytest.raises(TypeError):
+            TemperatureDifference("5 ΔK") + 5
+
+    def test_add__float(self):
+        temperature = Temperature.float(20, "°C") + TemperatureDifference("5 ΔK")
+        assert temperature.celsius == pytest.approx(25)
+
+    def test_add__raise__type_error(self):
+        with pytest.raises(TypeError) as e:
+            Temperature("20 °C") + Temperature("10 °C")
+        assert str(e.value) == "can't add type 'Temperature' to 'Temperature'"
+
+    def test_sub__raise__type_error(self):
+        with pytest.raises(TypeError):
+            Temperature("20 °C") - 10
+
+
+class TestTemperatureDifference:
+    def test_add(self):
+        assert TemperatureDifference("9 Δ°F") + TemperatureDifference(
+            "5 Δ°C"
+        ) == TemperatureDifference("10 ΔK")
+
+    def test_fahrenheit(self):
+        assert TemperatureDifference("9 Δ°F").delta_celsius == 5
+        assert TemperatureDifference(delta_kelvin=5).delta_fahrenheit == 9
+        assert TemperatureDifference(delta_fahrenheit=212).delta_fahrenheit == 212
@@ -0,0 +1,234 @@
+import decimal
+import warnings
+
+import pytest
+
+from measurement import measures
+
+np = pytest.importorskip("numpy")
+
+from measurement.array import MeasureArray  # NoQA
+
+
+class TestMeasureArray:
+    def test_init(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "km")
+        assert distances.measure is measures.Distance
+        assert distances.symbol == "km"
+        assert distances.unit is measures.Distance._units["km"]
+        np.testing.assert_array_equal(distances.si_values, [1000, 2000])
+
+    def test_init__si(self):
+        distances = MeasureArray(measures.Distance, [1, 2])
+        assert distances.symbol == "metre"
+        np.testing.assert_array_equal(distances.si_values, [1, 2])
+
+    def test_init__affine(self):
+        temperatures = MeasureArray(measures.Temperature, [0, 100], "°C")
+        np.testing.assert_allclose(temperatures.si_values, [273.15, 373.15])
+        np.testing.assert_allclose(temperatures.fahrenheit, [32, 212])
+
+    def test_from_measures(self):
+        distances = MeasureArray.from_measures(
+            [measures.Distance("1 km"), measures.Distance("1 mi")]
+        )
+        assert distances.measure is measures.Distance
+        assert distances.symbol == "km"
+        np.testing.assert_allclose(distances.km, [1, 1.609344])
+
+    def test_from_measures__type_error(self):
+        with pytest.raises(TypeError) as e:
+            MeasureArray.from_measures(
+                [measures.Distance("1 km"), measures.Mass("1 kg")]
+            )
+        assert str(e.value) == "expected type 'Distance' not 'Mass'"
+
+    def test_getattr(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "km")
+        np.testing.assert_allclose(distances.mi, [0.621371192, 1.242742384])
+        np.testing.assert_allclose(
+            MeasureArray(measures.Area, [1], "km²").sq_m, [1_000_000]
+        )
+        with pytest.raises(AttributeError) as e:
+            distances.does_not_exist
+        assert str(e.value) == (
+            "MeasureArray of Distance has no attribute 'does_not_exist'"
+        )
+        with pytest.raises(AttributeError):
+            distances._private
+
+    def test_getitem(self):
+        distances = MeasureArray(measures.Distance, [1, 2, 3], "km")
+        np.testing.assert_array_equal(distances["m"], [1000, 2000, 3000])
+        assert distances[1] == measures.Distance("2 km")
+        assert distances[1].symbol == "km"
+        assert isinstance(distances[np.int64(1)].si_value, float)
+        np.testing.assert_array_equal(distances[1:].km, [2, 3])
+        np.testing.assert_array_equal(distances[distances.km > 1].km, [2, 3])
+        with pytest.raises(KeyError) as e:
+            distances["does not exist"]
+        assert "MeasureArray of Distance has no key 'does not exist'" in str(e.value)
+
+    def test_len(self):
+        assert len(MeasureArray(measures.Distance, [1, 2, 3], "km")) == 3
+
+    def test_iter(self):
+        assert list(MeasureArray(measures.Distance, [1, 2], "km")) == [
+            measures.Distance("1 km"),
+            measures.Distance("2 km"),
+        ]
+
+    def test_repr(self):
+        assert repr(MeasureArray(measures.Distance, [1, 2], "km")) == (
+            "MeasureArray(Distance, [1.0, 2.0], 'km')"
+        )
+
+    def test_add(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "km")
+        np.testing.assert_array_equal((distances + distances).km, [2, 4])
+        np.testing.assert_array_equal(
+            (distances + measures.Distance("1 km")).km, [2, 3]
+        )
+        np.testing.assert_array_equal(
+            (distances + measures.Distance.float(1, "km")).km, [2, 3]
+        )
+        with pytest.raises(TypeError):
+            distances + measures.Mass("1 kg")
+        with pytest.raises(TypeError):
+            distances + MeasureArray(measures.Mass, [1])
+
+    def test_sub(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "km")
+        np.testing.assert_array_equal(
+            (distances - measures.Distance("1 km")).km, [0, 1]
+        )
+        with pytest.raises(TypeError):
+            distances - 1
+
+    def test_add__temperature(self):
+        temperatures = MeasureArray(measures.Temperature, [20, 30], "°C")
+        warmer = temperatures + measures.TemperatureDifference("9 Δ°F")
+        assert warmer.measure is measures.Temperature
+        assert warmer.symbol == "°C"
+        np.testing.assert_allclose(warmer["°C"], [25, 35])
+        differences = MeasureArray(measures.TemperatureDifference, [5], "ΔK")
+        warmer = differences + measures.Temperature("20 °C")
+        assert warmer.measure is measures.Temperature
+        np.testing.assert_allclose(warmer["°C"], [25])
+        with pytest.raises(TypeError, match="can't add type 'Temperature'"):
+            temperatures + temperatures
+        with pytest.raises(TypeError, match="can't add type 'Temperature'"):
+            temperatures + measures.Temperature("20 °C")
+
+    def test_sub__temperature(self):
+        temperatures = MeasureArray(measures.Temperature, [20, 30], "°C")
+        differences = temperatures - MeasureArray(measures.Temperature, [15, 10], "°C")
+        assert differences.measure is measures.TemperatureDifference
+        np.testing.assert_allclose(differences["Δ°C"], [5, 20])
+        differences = temperatures - measures.Temperature("50 °F")
+        assert differences.measure is measures.TemperatureDifference
+        np.testing.assert_allclose(differences["ΔK"], [10, 20])
+        colder = temperatures - MeasureArray(measures.TemperatureDifference, [5], "ΔK")
+        assert colder.measure is measures.Temperature
+        np.testing.assert_allclose(colder["°C"], [15, 25])
+
+    def test_mul(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "km")
+        np.testing.assert_array_equal((distances * 2).km, [2, 4])
+        np.testing.assert_array_equal((2 * distances).km, [2, 4])
+        np.testing.assert_array_equal((distances * decimal.Decimal(2)).km, [2, 4])
+        np.testing.assert_array_equal((distances * np.array([1, 2])).km, [1, 4])
+        np.testing.assert_array_equal((np.array([1, 2]) * distances).km, [1, 4])
+        with pytest.raises(TypeError):
+            distances * "not-allowed"
+        with pytest.raises(TypeError):
+            "not-allowed" * distances
+
+    def test_mul__measure(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "m")
+        area = distances * distances
+        assert area.measure is measures.Area
+        np.testing.assert_array_equal(area["m²"], [1, 4])
+        volume = area * measures.Distance("2 m")
+        assert volume.measure is measures.Volume
+        np.testing.assert_array_equal(volume["m³"], [2, 8])
+        assert (distances * measures.Area("1 m²")).measure is measures.Volume
+
+        power = MeasureArray(measures.Current, [1, 2], "A") * measures.Voltage("12 V")
+        assert power.measure is measures.ElectricPower
+        np.testing.assert_array_equal(power.W, [12, 24])
+        assert (
+            MeasureArray(measures.Voltage, [1], "V") * measures.Current("1 A")
+        ).measure is (measures.ElectricPower)
+
+        np.testing.assert_array_equal(
+            MeasureArray(measures.Frequency, [1, 2], "Hz") * measures.Time("60 s"),
+            [60, 120],
+        )
+        speeds = MeasureArray(measures.Speed, [1, 2], "m/s") * measures.Time("1 min")
+        assert speeds.measure is measures.Distance
+        np.testing.assert_array_equal(speeds.m, [60, 120])
+        with pytest.raises(TypeError):
+            MeasureArray(measures.Mass, [1], "kg") * measures.Mass("1 kg")
+
+    def test_rmul__measure(self):
+        distances = MeasureArray(measures.Distance, [1, 2], "m")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            areas = measures.Distance("2 m") * distances
+            assert areas.measure is measures.Area
+            np.testing.assert_array_equal(areas["m²"], [2, 4])
+            speeds = measures.Frequency("2 Hz") * distances
+            assert speeds.measure is measures.Speed
+            np.testing.assert_array_equal(speeds["m/s"], [2, 4])
+            with pytest.raises(TypeError, match="can't multiply type 'Mass'"):
+                measures.Mass("1 kg") * MeasureArray(measures.Mass, [1], "kg")
+
+    def test_truediv(self):
+        distances = MeasureArray(measures.Distance, [2, 4], "km")
+        np.testing.assert_array_equal((distances / 2).km, [1, 2])
+        np.testing.assert_array_equal(distances / measures.Distance("2 km"), [1, 2])
+        np.testing.assert_array_equal(distances / distances, [1, 1])
+
+    def test_truediv__measure(self):
+        areas = MeasureArray(measures.Area, [2, 4], "m²")
+        assert (areas / measures.Distance("2 m")).measure is measures.Distance
+        np.testing.assert_array_equal((areas / measures.Distance("2 m")).m, [1, 2])
+        volumes = MeasureArray(measures.Volume, [8], "m³")
+        assert (volumes / measures.Distance("2 m")).measure is measures.Area
+        assert (volumes / measures.Area("2 m²")).measure is measures.Distance
+
+        power = MeasureArray(measures.ElectricPower, [24], "W")
+        np.testing.assert_array_equal((power / measures.Voltage("12 V")).A, [2])
+        np.testing.assert_array_equal((power / measures.Current("2 A")).V, [12])
+
+    def test_rtruediv__measure(self):
+        times = MeasureArray(measures.Time, [1, 2], "s")
+        speeds = measures.Distance("4 m") / times
+        assert speeds.measure is measures.Speed
+        np.testing.assert_array_equal(speeds["m/s"], [4, 2])
+        np.testing.assert_array_equal(measures.Time("4 s") / times, [4, 2])
+        with pytest.raises(
+            TypeError, match="can't divide type 'Mass' by 'MeasureArray'"
+        ):
+            measures.Mass("1 kg") / times
+        with pytest.raises(TypeError):
+            2 / times
+
+    def test_compare(self):
+        distances = MeasureArray(measures.Distance, [1, 2, 3], "km")
+        np.testing.assert_array_equal(distances == measures.Distance("2 km"), [0, 1, 0])
+        np.testing.assert_array_equal(distances != measures.Distance("2 km"), [1, 0, 1])
+        np.testing.assert_array_equal(distances < measures.Distance("2 km"), [1, 0, 0])
+        np.testing.assert_array_equal(distances <= measures.Distance("2 km"), [1, 1, 0])
+        np.testing.assert_array_equal(distances > measures.Distance("2 km"), [0, 0, 1])
+        np.testing.assert_array_equal(distances >= distances, [1, 1, 1])
+        assert (distances == "not-valid") is False
+
+    def test_reductions(self):
+        distances = MeasureArray(measures.Distance, [1, 2, 3], "km")
+        assert distances.sum() == measures.Distance("6 km")
+        assert distances.mean() == measures.Distance("2 km")
+        assert distances.min() == measures.Distance("1 km")
+        assert distances.max() == measures.Distance("3 km")
+        assert isinstance(distances.sum().si_value, float)
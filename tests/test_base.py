@@ -1,9 +1,22 @@
+import array
+import concurrent.futures
+import copy
+import dataclasses
 import decimal
+import fractions
+import gc
+import numbers
+import operator
+import pickle  # nosec
+import sys
+import warnings
+import weakref
 
 import pytest
 
-from measurement.base import ImmutableKeyDict, MetricUnit, Unit, qualname
-from measurement.measures import Distance, Mass
+from measurement import base, measures
+from measurement.base import ImmutableKeyDict, MetricUnit, Unit, UnitRegistry, qualname
+from measurement.measures import Area, Distance, Mass, Speed, Temperature, Time, Volume
 
 
 def test_qualname():
@@ -11,6 +24,38 @@ def test_qualname():
     assert qualname(Distance("1 m")) == "Distance"
 
 
+class TestParseMeasure:
+    @pytest.mark.parametrize(
+        "string, value, unit",
+        [
+            ("12.5 km", "12.5", "km"),
+            ("12km", "12", "km"),
+            ("  -.5  km  ", "-0.5", "km"),
+            ("1,234,567.8 m", "1234567.8", "m"),
+            ("1_000 m", "1000", "m"),
+            ("1.5e3 m", "1500", "m"),
+            ("1.5E+3km", "1500", "km"),
+            ("3 sq m", "3", "sq m"),
+            ("3 m^2", "3", "m²"),
+            ("3m³", "3", "m³"),
+            ("5 m / s", "5", "m/s"),
+            ("5 µm", "5", "µm"),
+            ("20°C", "20", "°C"),
+        ],
+    )
+    def test_parse_measure(self, string, value, unit):
+        assert base.parse_measure(string) == (decimal.Decimal(value), unit)
+
+    def test_parse_measure__float(self):
+        assert base.parse_measure("1,000.5km", float) == (1000.5, "km")
+
+    @pytest.mark.parametrize("string", ["km", "12", "x km", "1,2 km", ""])
+    def test_parse_measure__value_error(self, string):
+        with pytest.raises(ValueError) as e:
+            base.parse_measure(string)
+        assert str(e.value) == f"can't parse measure from '{string}'"
+
+
 class TestImmutableKeyDict:
     def test_setitem(self):
         d = ImmutableKeyDict()
@@ -22,10 +67,404 @@ class TestImmutableKeyDict:
         assert "Key 'foo' already exists with value 'bar'." in str(e.value)
 
 
+class TestUnitRegistry:
+    def test_getitem(self):
+        unit = Unit("1")
+        d = UnitRegistry({"m": unit})
+        assert d["m"] is unit
+        with pytest.raises(KeyError):
+            d["km"]
+
+    def test_getitem__resolver(self):
+        calls = []
+
+        def resolver(symbol):
+            calls.append(symbol)
+            if symbol == "km":
+                return Unit("1000")
+
+        d = UnitRegistry(resolver=resolver)
+        assert d["km"] == Unit("1000")
+        assert d["km"] is d["km"]
+        assert calls == ["km"]
+        assert "km" not in d.keys()
+
+        with pytest.raises(KeyError):
+            d["mm"]
+
+    def test_contains(self):
+        d = UnitRegistry({"m": Unit("1")}, resolver={"km": Unit("1000")}.get)
+        assert "m" in d
+        assert "km" in d
+        assert "mm" not in d
+
+    def test_get(self):
+        d = UnitRegistry(resolver={"km": Unit("1000")}.get)
+        assert d.get("km") == Unit("1000")
+        assert d.get("mm") is None
+        assert d.get("mm", "default") == "default"
+
+    def test_maxsize(self):
+        d = UnitRegistry(resolver=lambda symbol: Unit("1"), maxsize=2)
+        for symbol in ["a", "b", "c", "d"]:
+            d[symbol]
+        assert d.resolve.cache_info().currsize == 2
+
+    def test_find(self):
+        unit = Unit("1")
+        d = UnitRegistry({"m": unit})
+        assert d.find("m") == ("m", unit)
+        with pytest.raises(KeyError) as e:
+            d.find("km")
+        assert e.value.args == ("km",)
+
+    def test_find__normalizer(self):
+        unit = Unit("1")
+        d = UnitRegistry({"m²": unit}, normalizer=lambda name: f"{name[3:]}²")
+        assert d.find("sq_m") == ("m²", unit)
+        with pytest.raises(KeyError) as e:
+            d.find("sq_km")
+        assert e.value.args == ("km²",)
+
+    def test_find__cache(self):
+        d = UnitRegistry({"m": Unit("1")})
+        d.find("m")
+        d.find("m")
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                d.find("km")
+        info = d.resolve_name.cache_info()
+        assert (info.hits, info.misses) == (2, 2)
+
+    def test_find__invalidate(self):
+        d = UnitRegistry()
+        with pytest.raises(KeyError):
+            d.find("km")
+        unit = Unit("1000")
+        d["km"] = unit
+        assert d.find("km") == ("km", unit)
+
+    def test_intern(self):
+        d = UnitRegistry(resolver=lambda symbol: Unit("1000"))
+        assert d["km"] is d["kilometre"]
+        unit = Unit("1000")
+        unit.name = "metre"
+        assert d.intern(unit) is unit
+        assert d.intern(Unit("1000")) is d["km"]
+
+    def test_intern__stored(self):
+        unit = Unit("1")
+        unit.name = "metre"
+        d = UnitRegistry({"m": unit})
+        resolved = Unit("1")
+        resolved.name = "metre"
+        assert d.intern(resolved) is unit
+
+
+class TestMeasureBase:
+    def test_stored_units(self):
+        assert "m" in dict.keys(Distance._units)
+        assert "km" not in dict.keys(Distance._units)
+
+    def test_shared_units(self):
+        assert Distance._units["m"] is Distance._units["metre"]
+        assert Distance._units["km"] is Distance._units["kilometre"]
+        assert Distance._units["km"] is Distance._units["Kilometre"]
+        assert Temperature._units["°C"] is Temperature._units["celsius"]
+
+    def test_iter_symbols(self):
+        symbols = list(Distance.iter_symbols())
+        assert symbols[: len(Distance._units)] == list(Distance._units)
+        assert {"km", "Kilometre", "mi"} <= set(symbols)
+        assert "km²" not in symbols
+
+    def test_resolve_symbol(self):
+        assert Distance.resolve_symbol("km") == Unit("1E+3")
+        assert Distance.resolve_symbol("m") is None
+        assert Distance.resolve_symbol("does not exist") is None
+        assert Distance._units["km"] is Distance._units["km"]
+
+    def test_shared_unit_definition(self):
+        unit = Unit("2")
+
+        class First(base.AbstractMeasure):
+            first = unit
+
+        class Second(base.AbstractMeasure):
+            second = unit
+
+        assert First._units["first"].name == "first"
+        assert Second._units["second"].name == "second"
+        assert First._org_units["first"] is not unit
+        unit.name = "unchanged"
+
+    def test_prefixed_symbols__unique(self):
+        with pytest.raises(KeyError) as e:
+
+            class Stored(base.AbstractMeasure):
+                metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+                other = Unit("5", ["km"])
+
+        assert e.value.args == ("Key 'km' already exists with value 'other'.",)
+
+        with pytest.raises(KeyError) as e:
+
+            class Prefixed(base.AbstractMeasure):
+                metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+                other = MetricUnit("5", [], ["m"])
+
+        assert e.value.args == ("Key 'ym' already exists with value 'metre'.",)
+
+    def test_lookup(self):
+        assert base.MeasureBase.lookup(Distance, "m") == ("m", Distance._units["m"])
+        assert base.MeasureBase.lookup(Distance, "british ft") == (
+            "british_ft",
+            Distance._units["british_ft"],
+        )
+        with pytest.raises(KeyError):
+            base.MeasureBase.lookup(Distance, "does not exist")
+
+    def test_cache_info(self):
+        class Measure(base.AbstractMeasure):
+            metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+
+        m = Measure(metre=1)
+        assert Measure.cache_info().misses == 1
+        for _ in range(3):
+            assert m.km == decimal.Decimal("0.001")
+            with pytest.raises(AttributeError):
+                m.does_not_exist
+        info = Measure.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (4, 3, 3)
+
+
+class TestMeasureIndex:
+    def test_find(self):
+        index = base.MeasureIndex()
+        index.add(Distance)
+        index.add(Mass)
+        assert index.find("m") == (Distance,)
+        assert index.find("mg") == (Mass,)
+        assert index.find("sq_m") == ()
+
+    def test_find__cache(self):
+        index = base.MeasureIndex()
+        index.add(Mass)
+        assert index.find("km") == ()
+        index.add(Distance)
+        assert index.find("km") == (Distance,)
+        index.find("km")
+        assert index.cache_info().hits == 1
+
+    def test_weak_references(self):
+        index = base.MeasureIndex()
+        index.add(Distance)
+
+        class Measure(base.AbstractMeasure):
+            metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+
+        index.add(Measure)
+        assert index.find("m") == (Distance, Measure)
+        del Measure
+        gc.collect()
+        assert index.measures == [Distance]
+        assert index.find("m") == (Distance,)
+
+    def test_ambiguities(self):
+        index = base.MeasureIndex()
+        index.add(Distance)
+        index.add(Mass)
+        assert index.ambiguities() == {}
+
+        class Measure(base.AbstractMeasure):
+            metre = Unit("1", ["m"])
+
+        index.add(Measure)
+        assert index.ambiguities() == {
+            "metre": (Distance, Measure),
+            "m": (Distance, Measure),
+        }
+        del Measure
+        gc.collect()
+        assert index.ambiguities() == {}
+
+    def test_measure_index(self):
+        class Measure(base.AbstractMeasure):
+            metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+
+        assert base.measure_index.measures[-1] is Measure
+        assert Measure in base.measure_index.find("km")
+
+    def test_product(self):
+        index = base.MeasureIndex()
+        for measure in [Distance, Area, Volume, Time, measures.Frequency, Speed, Mass]:
+            index.add(measure)
+        assert index.product(Distance, Distance, operator.mul) is Area
+        assert index.product(Area, Distance, operator.mul) is Volume
+        assert index.product(Volume, Area, operator.truediv) is Distance
+        assert index.product(Distance, Time, operator.truediv) is Speed
+        assert index.product(Speed, Time, operator.mul) is Distance
+        assert index.product(measures.Frequency, Time, operator.mul) is None
+        with pytest.raises(KeyError):
+            index.product(Distance, Time, operator.mul)
+        with pytest.raises(KeyError):
+            index.product(Mass, Distance, operator.mul)
+
+    def test_product__cache(self):
+        index = base.MeasureIndex()
+        index.add(Distance)
+        with pytest.raises(KeyError):
+            index.product(Distance, Distance, operator.mul)
+        index.add(Area)
+        assert index.product(Distance, Distance, operator.mul) is Area
+
+    def test_product__ambiguous(self):
+        index = base.MeasureIndex()
+        for measure in [Distance, Speed, measures.Frequency, measures.Radioactivity]:
+            index.add(measure)
+        with pytest.raises(KeyError):
+            index.product(Speed, Distance, operator.truediv)
+
+    def test_product__subclass(self):
+        index = base.MeasureIndex()
+        index.add(Distance)
+        index.add(Area)
+
+        class Length(Distance):
+            metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+
+        index.add(Length)
+        assert index.product(Area, Distance, operator.truediv) is Distance
+        assert index.product(Length, Length, operator.mul) is Area
+        del Length
+        gc.collect()
+
+    def test_product__builtin_first(self):
+        class Span(base.AbstractMeasure):
+            __dimension__ = base.Dimension(length=1)
+
+            span_metre = Unit("1", ["spm"])
+
+        class Reach(base.AbstractMeasure):
+            __dimension__ = base.Dimension(length=1)
+
+            reach_metre = Unit("1", ["rcm"])
+
+        assert Area(sq_m=6) / Distance(m=3) == Distance(m=2)
+        assert Area(sq_m=6) / Span("3 spm") == Distance(m=2)
+
+        index = base.MeasureIndex()
+        for measure in [Span, Distance, Area, Reach]:
+            index.add(measure)
+        assert index.product(Area, Distance, operator.truediv) is Distance
+        index = base.MeasureIndex()
+        for measure in [Span, Area, Reach]:
+            index.add(measure)
+        with pytest.raises(KeyError):
+            index.product(Area, Span, operator.truediv)
+        del Span, Reach
+        gc.collect()
+
+    def test_product__no_si_unit(self):
+        class Hypervolume(base.AbstractMeasure):
+            __dimension__ = base.Dimension(length=4)
+
+            dozen = Unit("12")
+
+        index = base.MeasureIndex()
+        for measure in [Area, Hypervolume]:
+            index.add(measure)
+        with pytest.raises(KeyError):
+            index.product(Area, Area, operator.mul)
+        with pytest.raises(TypeError, match="can't multiply type 'Area' and 'Area'"):
+            Area(sq_m=2) * Area(sq_m=3)
+        del Hypervolume
+        gc.collect()
+
+    def test_product__weak_references(self):
+        index = base.MeasureIndex()
+        index.add(Area)
+
+        class AreaMoment(base.AbstractMeasure):
+            __dimension__ = base.Dimension(length=4)
+
+            metre4 = Unit("1", ["m⁴"])
+
+        index.add(AreaMoment)
+        assert index.product(Area, Area, operator.mul) is AreaMoment
+        del AreaMoment
+        gc.collect()
+        with pytest.raises(KeyError):
+            index.product(Area, Area, operator.mul)
+
+
+class TestDimension:
+    def test_mul(self):
+        assert base.Dimension(length=1) * base.Dimension(
+            length=1, time=-1
+        ) == base.Dimension(length=2, time=-1)
+
+    def test_truediv(self):
+        assert base.Dimension(length=1) / base.Dimension(time=1) == base.Dimension(
+            length=1, time=-1
+        )
+        assert base.Dimension(time=1) / base.Dimension(time=1) == base.DIMENSIONLESS
+
+    def test_pow(self):
+        assert base.Dimension(length=1, time=-1) ** 2 == base.Dimension(
+            length=2, time=-2
+        )
+
+    def test_compound_measures(self):
+        assert Area.__dimension__ == base.Dimension(length=2)
+        assert Volume.__dimension__ == base.Dimension(length=3)
+        assert Speed.__dimension__ == base.Dimension(length=1, time=-1)
+
+
+class TestUnitIndex:
+    def test_build(self):
+        index = Distance.get_index()
+        assert index.base_unit_names == ("metre", "m", "meter", "Meter", "Metre")
+
+    def test_get_index(self):
+        assert Distance.get_index() is Distance.get_index()
+        assert Distance._units.index is Distance.get_index()
+
+    def test_get_index__invalidate(self):
+        class Widgets(base.AbstractMeasure):
+            widget = Unit("1", ["wdg"])
+
+        index = Widgets.get_index()
+        assert Widgets.get_base_unit_names() == ["widget", "wdg"]
+
+        Widgets._units["gadget"] = Unit("1")
+        assert Widgets._units.index is None
+        assert Widgets.get_index() is not index
+        assert Widgets.get_base_unit_names() == ["widget", "wdg", "gadget"]
+
+    def test_no_base_units(self):
+        assert Mass.get_base_unit_names() == ["gram", "g", "Gram"]
+        assert base.AbstractMeasure.get_base_unit_names() is None
+
+    def test_affine_units(self):
+        index = Temperature.get_index()
+        assert index.base_unit_names == ("kelvin", "K", "Kelvin")
+
+
 class TestUnit:
     def test_post_init(self):
         inch = Unit("0.0254", ["in", "inches"])
         assert inch.factor == decimal.Decimal("0.0254")
+        assert inch.float_factor == 0.0254
+
+    def test_ratio(self):
+        unit = Unit(fractions.Fraction(5, 9), ["Δ°F"])
+        assert unit.factor == decimal.Decimal(5) / 9
+        assert unit.ratio == fractions.Fraction(5, 9)
+        assert unit.to_si(decimal.Decimal(9)) == 5
+        assert unit.from_si(decimal.Decimal(5)) == 9
+        assert unit.from_si(5.0) == pytest.approx(9)
+        assert Unit("0.0254").ratio is None
 
     def test_get_symbols(self):
         inch = Unit("0.0254", ["in", "inches"])
@@ -36,11 +475,35 @@ class TestUnit:
             ("inches", Unit("0.0254")),
         ]
 
+    def test_freeze(self):
+        inch = Unit("0.0254", ["in", "inches"])
+        inch.name = "inch"
+        assert inch.freeze() is inch
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            inch.name = "foot"
+        assert inch.name == "inch"
+
+    def test_freeze__registered(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Distance._units["mi"].factor = decimal.Decimal("1")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Distance._units["km"].name = "kilometre"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Distance._org_units["metre"].symbols = []
+
     def test_to_si(self):
         assert Unit("1").to_si(decimal.Decimal("10")) == decimal.Decimal("10")
         assert Unit("10").to_si(decimal.Decimal("10")) == decimal.Decimal("100")
         assert Unit("1E-3").to_si(decimal.Decimal("10")) == decimal.Decimal("1E-2")
 
+    def test_to_si__float(self):
+        assert Unit("10").to_si(10.0) == 100.0
+        assert isinstance(Unit("10").to_si(10.0), float)
+
+    def test_from_si__float(self):
+        assert Unit("10").from_si(10.0) == 1.0
+        assert isinstance(Unit("10").from_si(10.0), float)
+
     def test_from_si(self):
         assert Unit("1").from_si(decimal.Decimal("10")) == decimal.Decimal("10")
         assert Unit("10").from_si(decimal.Decimal("10")) == decimal.Decimal("1")
@@ -57,6 +520,13 @@ class TestMetricUnit:
         assert ("m", Unit("1")) in symbols
         assert ("meter", Unit("1")) in symbols
 
+        assert ("km", Unit("1E+3")) not in symbols
+
+    def test_get_prefixed_symbols(self):
+        metre = MetricUnit("1", ["m", "meter"], ["m"], ["metre", "meter"])
+        metre.name = "metre"
+        symbols = list(metre.get_prefixed_symbols())
+
         assert ("km", Unit("1E+3")) in symbols
         assert ("μm", Unit("1E-6")) in symbols
 
@@ -68,12 +538,216 @@ class TestMetricUnit:
 
         assert ("nanometer", Unit("1E-9")) in symbols
 
+    def test_iter_prefixed_symbols(self):
+        metre = MetricUnit("1", ["m", "meter"], ["m"], ["metre", "meter"])
+        assert list(metre.iter_prefixed_symbols()) == [
+            symbol for symbol, _ in metre.get_prefixed_symbols()
+        ]
+
     def test_get_symbols__unique_names(self):
         metre = MetricUnit("1", ["m", "meter"], ["m"], ["metre", "meter"])
         metre.name = "metre"
-        symbols = list(metre.get_symbols())
+        symbols = [*metre.get_symbols(), *metre.get_prefixed_symbols()]
         assert len([k for k, v in symbols]) == len({k for k, v in symbols})
 
+    def test_resolve_prefix(self):
+        metre = MetricUnit("1", ["m", "meter"], ["m"], ["metre", "meter"])
+        metre.name = "metre"
+        assert metre.resolve_prefix("km") == Unit("1E+3")
+        assert metre.resolve_prefix("km").name == "metre"
+        assert metre.resolve_prefix("dam") == Unit("1E+1")
+        assert metre.resolve_prefix("μm") == Unit("1E-6")
+        assert metre.resolve_prefix("µm") == Unit("1E-6")
+        assert metre.resolve_prefix("kilometre") == Unit("1E+3")
+        assert metre.resolve_prefix("Kilometer") == Unit("1E+3")
+        assert metre.resolve_prefix("exameter") == Unit("1E+18")
+
+        assert metre.resolve_prefix("m") is None
+        assert metre.resolve_prefix("kilom") is None
+        assert metre.resolve_prefix("KILOMETRE") is None
+        assert metre.resolve_prefix("Km") is None
+
+    def test_resolve_prefix__all_prefixed_symbols(self):
+        joule = MetricUnit("1", ["J", "Joule"], ["J"], ["joule"])
+        joule.name = "joule"
+        for symbol, unit in joule.get_prefixed_symbols():
+            assert joule.resolve_prefix(symbol) == unit, symbol
+
+
+class TestAffineUnit:
+    def test_post_init(self):
+        fahrenheit = base.AffineUnit(fractions.Fraction(5, 9), ["°F"], "459.67")
+        assert fahrenheit.offset == decimal.Decimal("459.67")
+        assert fahrenheit.float_offset == 459.67
+        assert fahrenheit.factor == decimal.Decimal(5) / 9
+        assert fahrenheit.ratio == fractions.Fraction(5, 9)
+        assert Unit("1").offset == 0
+
+    def test_to_si(self):
+        fahrenheit = base.AffineUnit(fractions.Fraction(5, 9), ["°F"], "459.67")
+        assert fahrenheit.to_si(decimal.Decimal(212)) == decimal.Decimal("373.15")
+        assert fahrenheit.to_si(212.0) == pytest.approx(373.15)
+
+    def test_from_si(self):
+        fahrenheit = base.AffineUnit(fractions.Fraction(5, 9), ["°F"], "459.67")
+        assert fahrenheit.from_si(decimal.Decimal("373.15")) == decimal.Decimal(212)
+        assert fahrenheit.from_si(373.15) == pytest.approx(212)
+
+    def test_decimal_factor(self):
+        fahrenheit = base.AffineUnit(decimal.Decimal(5) / 9, ["°F"], "459.67")
+        assert fahrenheit.ratio is None
+        assert fahrenheit.to_si(decimal.Decimal(212)) == decimal.Decimal("373.15")
+
+    def test_freeze(self):
+        celsius = base.AffineUnit("1", ["°C"], "273.15")
+        celsius.freeze(decimal.Context(prec=2))
+        assert celsius.offset == decimal.Decimal("273.15")
+        assert celsius.to_si(decimal.Decimal(1)) == decimal.Decimal("2.7E+2")
+
+    def test_get_symbols(self):
+        celsius = base.AffineUnit("1", ["°C"], "273.15")
+        celsius.name = "celsius"
+        symbols = dict(celsius.get_symbols())
+        assert symbols.keys() == {"celsius", "°C"}
+        assert symbols["°C"] == base.AffineUnit("1", offset="273.15")
+
+
+class TestConverter:
+    def test_convert(self):
+        converter = Distance.converter("mi", "km")
+        assert converter.convert(decimal.Decimal("1.5")) == Distance("1.5 mi").km
+        assert converter.convert(2) == decimal.Decimal("3.218688")
+        assert converter.convert("2") == decimal.Decimal("3.218688")
+        assert converter(2) == decimal.Decimal("3.218688")
+
+    def test_convert__same_as_measure(self):
+        converter = Distance.converter("inch", "mi")
+        for value in ["1", "3.3", "12345.678"]:
+            assert converter(decimal.Decimal(value)) == Distance(value, "inch").mi
+
+    def test_convert__float(self):
+        converter = Distance.converter("mi", "km")
+        assert isinstance(converter.convert(1.5), float)
+        assert converter.convert(1.5) == pytest.approx(2.414016)
+
+    def test_convert__affine(self):
+        converter = Temperature.converter("fahrenheit", "°C")
+        assert converter.convert(212) == decimal.Decimal("100")
+        assert converter.convert(212.0) == pytest.approx(100)
+        assert Temperature.converter("°C", "K").convert(1.0) == pytest.approx(274.15)
+        assert Temperature.converter("K", "°F").convert(300) == decimal.Decimal("80.33")
+
+    def test_convert__affine_folded(self):
+        converter = Temperature.converter("°F", "°C")
+        assert converter._float_factor == pytest.approx(5 / 9)
+        assert converter._float_offset == pytest.approx(-160 / 9)
+        assert converter.convert_many([32.0, 212.0]) == pytest.approx([0, 100])
+
+    def test_convert__type_error(self):
+        with pytest.raises(TypeError):
+            Distance.converter("mi", "km").convert(None)
+
+    def test_convert_many(self):
+        converter = Distance.converter("km", "m")
+        assert converter.convert_many([1, 2.5, decimal.Decimal("3")]) == [
+            decimal.Decimal("1000"),
+            2500.0,
+            decimal.Decimal("3000"),
+        ]
+        assert converter.convert_many(iter([])) == []
+
+    def test_convert_many__out(self):
+        converter = Distance.converter("km", "m")
+        out = array.array("d", [0, 0])
+        assert converter.convert_many([1.0, 2.0], out=out) is out
+        assert out.tolist() == [1000.0, 2000.0]
+        with pytest.raises(IndexError):
+            converter.convert_many([1.0, 2.0, 3.0], out=out)
+
+    def test_repr(self):
+        assert repr(Distance.converter("mi", "km")) == "Converter(Distance, 'mi', 'km')"
+
+
+class TestDecimalContext:
+    @pytest.fixture(autouse=True)
+    def collect(self):
+        yield
+        gc.collect()  # remove measures of the tests from the measure index
+
+    @pytest.fixture
+    def Length(self):
+        class Length(base.AbstractMeasure):
+            decimal_context = decimal.Context(prec=6)
+
+            metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+            point = Unit(decimal.Decimal("25.4e-3") / 72, ["pt"])
+
+        return Length
+
+    def test_unit_factor(self, Length):
+        assert Length._units["pt"].factor == decimal.Decimal("0.000352778")
+        assert Length._units["pt"].context is Length.decimal_context
+        assert Length._units["km"].context is Length.decimal_context
+        assert Distance._units["point"].context is None
+
+    def test_conversion(self, Length):
+        assert Length("1 m").pt == decimal.Decimal("2834.64")
+        assert Length("1 pt").m == decimal.Decimal("0.000352778")
+        assert Length("1.23456789 m").si_value == decimal.Decimal("1.23457")
+
+    def test_arithmetic(self, Length):
+        length = Length("1 m")
+        assert (length + Length("1 pt")).m == decimal.Decimal("1.00035")
+        assert (length - Length("1 pt")).m == decimal.Decimal("0.999647")
+        assert (length / 3).m == decimal.Decimal("0.333333")
+        assert (length * decimal.Decimal("1.0000001")).m == 1
+        assert length / Length("3 m") == decimal.Decimal("0.333333")
+
+    def test_converter(self, Length):
+        assert Length.converter("m", "pt")(1) == decimal.Decimal("2834.64")
+
+    def test_compound_units(self):
+        class CoarseSpeed(base.AbstractMeasure, metaclass=type(Speed)):
+            __numerator__ = Distance
+            __denominator__ = base.measure_index.find("h")[0]
+            decimal_context = decimal.Context(prec=4)
+
+        assert CoarseSpeed._units["km/h"].factor == decimal.Decimal("0.2778")
+        assert CoarseSpeed("36 km/h").si_value == decimal.Decimal("10.00")
+
+    def test_local_context(self):
+        with decimal.localcontext(decimal.Context(prec=3)):
+            assert Distance("1 mi").m == decimal.Decimal("1.61E+3")
+
+    def test_temperature(self):
+        class CoarseTemperature(base.AbstractMeasure):
+            decimal_context = decimal.Context(prec=4)
+
+            kelvin = MetricUnit("1", ["K"], ["K"], ["kelvin"])
+            celsius = measures.temperature.DegreeCelcius(["°C"])
+            fahrenheit = measures.temperature.DegreeFahrenheit(["°F"])
+
+        assert CoarseTemperature(celsius="21.12345").si_value == decimal.Decimal(
+            "294.3"
+        )
+        assert CoarseTemperature(kelvin=300).fahrenheit == decimal.Decimal("80.33")
+
+    def test_si_quantum(self):
+        class Rounded(base.AbstractMeasure):
+            decimal_context = decimal.Context(prec=9)
+            si_quantum = decimal.Decimal("1e-3")
+
+            metre = MetricUnit("1", ["m"], ["m"], ["metre"])
+            point = Unit(decimal.Decimal("25.4e-3") / 72, ["pt"])
+
+        assert Rounded("1 pt").si_value == decimal.Decimal("0.000")
+        assert Rounded("1 km").si_value == decimal.Decimal("1000.000")
+        assert (Rounded("1 m") / 3).si_value == decimal.Decimal("0.333")
+        assert Rounded.from_si(decimal.Decimal("0.12345")).si_value == decimal.Decimal(
+            "0.123"
+        )
+        assert Rounded.float(1, "pt").si_value == pytest.approx(0.000352778)
+
 
 class TestAbstractMeasure:
     measure = Distance
@@ -91,6 +765,287 @@ class TestAbstractMeasure:
         with pytest.raises(ValueError):
             f"{Distance('1 km') / 3:5.3x}"
 
+    def test_float(self):
+        distance = Distance.float(1.5, "km")
+        assert distance.si_value == 1500.0
+        assert isinstance(distance.si_value, float)
+        assert distance.symbol == "km"
+        assert distance.m == 1500.0
+        assert distance["mi"] == pytest.approx(0.932056788)
+        assert str(distance) == "1.5 km"
+        assert repr(distance) == 'Distance(metre="1500.0")'
+
+    def test_float__arguments(self):
+        assert Distance.float("1.5 km").si_value == 1500.0
+        assert Distance.float(km=1.5).si_value == 1500.0
+        assert Distance.float(1, "km").si_value == 1000.0
+
+    def test_float__no_warning(self, recwarn):
+        Distance.float(1.5, "km")
+        assert not recwarn
+
+    def test_from_si(self):
+        distance = Distance.from_si(decimal.Decimal(1500), "km")
+        assert distance.si_value == decimal.Decimal(1500)
+        assert distance.symbol == "km"
+        assert distance.km == decimal.Decimal("1.5")
+        assert Distance.from_si(decimal.Decimal(1)).symbol == "metre"
+        assert isinstance(Distance.from_si(1500.0, "km").si_value, float)
+
+    def test_from_si__no_warning(self, recwarn):
+        Distance.from_si(1500.0, "km")
+        Distance.from_value(1.5, "km")
+        assert not recwarn
+
+    def test_from_si__key_error(self):
+        with pytest.raises(KeyError):
+            Distance.from_si(decimal.Decimal(1), "does_not_exist")
+
+    def test_from_si__no_si_unit(self):
+        class Dozens(base.AbstractMeasure):
+            dozen = Unit("12")
+
+        assert Dozens.from_si(decimal.Decimal(24), "dozen").dozen == 2
+        with pytest.raises(KeyError) as e:
+            Dozens.from_si(decimal.Decimal(24))
+        assert e.value.args == (
+            f"'{qualname(Dozens)}' has no SI unit, a unit must be given",
+        )
+
+    def test_from_value(self):
+        distance = Distance.from_value(decimal.Decimal("1.5"), "km")
+        assert distance == Distance("1.5 km")
+        assert distance.symbol == "km"
+        assert Distance.from_value(1.5, "km").si_value == 1500.0
+
+    def test_arithmetic__no_init(self, monkeypatch):
+        a, b = Distance("1 km"), Distance("500 m")
+
+        def init(*args, **kwargs):
+            raise AssertionError("__init__ called")
+
+        monkeypatch.setattr(Distance, "__init__", init)
+        assert (a + b).km == decimal.Decimal("1.5")
+        assert (a - b).km == decimal.Decimal("0.5")
+        assert (a * 2).km == 2
+        assert (a / 2).km == decimal.Decimal("0.5")
+        assert (a * a).si_value == 1000000
+
+    def test_float__eq(self):
+        assert Distance.float(1, "km") == Distance("1 km")
+        assert Distance.float(1, "km") < Distance("2 km")
+
+    def test_float__add(self):
+        result = Distance.float(1, "km") + Distance.float(500, "m")
+        assert result == Distance("1.5 km")
+        assert isinstance(result.si_value, float)
+        assert result.symbol == "metre"
+        assert isinstance((Distance("1 km") + Distance.float(1, "m")).si_value, float)
+
+    def test_float__sub(self):
+        result = Distance.float(1, "km") - Distance("500 m")
+        assert result == Distance("0.5 km")
+        assert isinstance(result.si_value, float)
+
+    def test_float__mul(self):
+        result = Distance.float(1, "km") * decimal.Decimal(2)
+        assert result == Distance("2 km")
+        assert isinstance(result.si_value, float)
+        assert result.symbol == "km"
+        assert 2 * Distance.float(1, "km") == Distance("2 km")
+        with pytest.raises(TypeError) as e:
+            Distance.float(1, "km") * "not-allowed"
+        assert str(e.value) == "can't multiply type 'Distance' and 'str'"
+
+    def test_float__truediv(self):
+        result = Distance.float(1, "km") / 2
+        assert result == Distance("0.5 km")
+        assert isinstance(result.si_value, float)
+        assert Distance.float(1, "km") / Distance("2 km") == 0.5
+        with pytest.raises(TypeError) as e:
+            Distance.float(1, "km") / "not-allowed"
+        assert str(e.value) == "can't divide type 'Distance' by 'str'"
+
+    def test_init__string(self):
+        assert Distance("12km") == Distance("12 km")
+        assert Distance("1,200 m").symbol == "m"
+        assert Speed("5 km / h").symbol == "km/h"
+        assert Area("3 m^2") == Area(sq_m=3)
+
+    def test_float__string(self):
+        assert Distance.float("1,500m").si_value == 1500.0
+
+    def test_parse_many(self):
+        measures = list(Distance.parse_many(["1 km\n", "\n", "", "2.5mi"]))
+        assert measures == [Distance("1 km"), Distance("2.5 mi")]
+        assert [m.symbol for m in measures] == ["km", "mi"]
+        assert isinstance(measures[0].si_value, decimal.Decimal)
+
+    def test_parse_many__float(self):
+        (measure,) = Distance.parse_many(["1.5 km"], float=True)
+        assert measure.si_value == 1500.0
+        assert isinstance(measure.si_value, float)
+
+    def test_parse_many__lazy(self):
+        measures = Distance.parse_many(["1 km", "not a measure"])
+        assert next(measures) == Distance("1 km")
+        with pytest.raises(ValueError):
+            next(measures)
+
+    def test_converter(self):
+        converter = Distance.converter("mi", "kilometer")
+        assert converter.measure is Distance
+        assert converter.from_unit is Distance._units["mi"]
+        assert converter.to_symbol == "kilometer"
+
+    def test_converter__key_error(self):
+        with pytest.raises(KeyError) as e:
+            Distance.converter("mi", "does_not_exist")
+        assert "Distance has no unit 'does_not_exist'" in str(e.value)
+
+    def test_slots(self):
+        distance = Distance("1 km")
+        assert not hasattr(distance, "__dict__")
+        assert Distance.__slots__ == ()
+        with pytest.raises(AttributeError):
+            distance.foo = "bar"
+
+    def test_weakref(self):
+        distance = Distance("1 km")
+        assert weakref.ref(distance)() is distance
+
+    def test_immutable(self):
+        distance = Distance("1 km")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            distance.si_value = decimal.Decimal(1)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            distance.unit = Distance._units["mi"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            del distance.symbol
+        assert distance == Distance("1 km")
+
+    def test_hash(self):
+        assert hash(Distance(km=1)) == hash(Distance(m=1000))
+        assert hash(Distance(km=1)) == hash(Distance.float(1000, "m"))
+        assert len({Distance(m=1), Mass(g=1)}) == 2
+        assert len({Distance(km=1), Distance(m=1000), Distance(mi=1)}) == 2
+        assert {Distance(km=1): "a"}[Distance(m=1000)] == "a"
+
+    def test_hash__subclass(self):
+        class Length(Distance):
+            metre = Unit("1", ["m"])
+
+        assert Distance(m=1) == Length(m=1)
+        assert Length(m=1) == Distance(m=1)
+        assert hash(Distance(m=1)) == hash(Length(m=1))
+        assert len({Distance(m=1), Length(m=1)}) == 1
+
+    def test_iadd__new_object(self):
+        a = b = Distance("1 km")
+        a += Distance("1 m")
+        assert a is not b
+        assert b == Distance("1 km")
+
+    def test_copy(self):
+        distance = Distance("1.5 km")
+        for copied in [
+            copy.copy(distance),
+            copy.deepcopy(distance),
+            pickle.loads(pickle.dumps(distance)),  # nosec
+        ]:
+            assert copied == distance
+            assert copied.symbol == "km"
+            assert str(copied) == "1.5 km"
+
+    def test_pickle(self):
+        measures = [Distance("1.5 km"), Speed("3 km/h"), Distance.float(1.5, "mi")]
+        for measure in measures:
+            data = pickle.dumps(measure)
+            assert b"Unit" not in data
+            unpickled = pickle.loads(data)  # nosec
+            assert unpickled == measure
+            assert type(unpickled.si_value) is type(measure.si_value)
+            assert unpickled.symbol == measure.symbol
+            assert unpickled.unit is measure.unit
+
+    def test_pickle__dict_state(self):
+        # Pickled by the release before measures had slots.
+        distance = (
+            b"\x80\x02cmeasurement.measures.geometry\nDistance\nq\x00)\x81q\x01}q"
+            b"\x02(X\x04\x00\x00\x00unitq\x03cmeasurement.base\nUnit\nq\x04)\x81q"
+            b"\x05}q\x06(X\x06\x00\x00\x00factorq\x07cdecimal\nDecimal\nq\x08X"
+            b"\x04\x00\x00\x001E+3q\t\x85q\nRq\x0bX\x07\x00\x00\x00symbolsq\x0c]q"
+            b"\rX\x04\x00\x00\x00nameq\x0eX\x05\x00\x00\x00metreq\x0fX\x08\x00"
+            b"\x00\x00org_nameq\x10X\x02\x00\x00\x00kmq\x11ubX\x08\x00\x00\x00si_"
+            b"valueq\x12h\x08X\x06\x00\x00\x001.5E+3q\x13\x85q\x14Rq\x15X\x0f\x00"
+            b"\x00\x00base_unit_namesq\x16]q\x17(h\x0fX\x01\x00\x00\x00mq\x18X"
+            b"\x05\x00\x00\x00meterq\x19X\x05\x00\x00\x00Meterq\x1aX\x05\x00\x00"
+            b"\x00Metreq\x1beub."
+        )
+        temperature = (
+            b"\x80\x04\x95\x04\x01\x00\x00\x00\x00\x00\x00\x8c measurement.measur"
+            b"es.temperature\x94\x8c\x0bTemperature\x94\x93\x94)\x81\x94}\x94("
+            b"\x8c\x04unit\x94h\x00\x8c\x10DegreeFahrenheit\x94\x93\x94)\x81\x94}"
+            b"\x94(\x8c\x07symbols\x94]\x94\x8c\x04name\x94\x8c\nfahrenheit\x94"
+            b"\x8c\x08org_name\x94\x8c\x03\xc2\xb0F\x94ub\x8c\x08si_value\x94\x8c"
+            b"\x07decimal\x94\x8c\x07Decimal\x94\x93\x94\x8c\x1d266.4833333333333"
+            b"333333333333\x94\x85\x94R\x94\x8c\x0fbase_unit_names\x94]\x94(\x8c"
+            b"\x06kelvin\x94\x8c\x01K\x94\x8c\x06Kelvin\x94eub."
+        )
+        distance = pickle.loads(distance)  # nosec
+        assert distance == Distance("1.5 km")
+        assert distance.symbol == "km"
+        assert distance.unit is Distance._units["km"]
+        assert str(distance) == "1.5 km"
+        temperature = pickle.loads(temperature)  # nosec
+        assert temperature.symbol == "°F"
+        assert temperature.unit is Temperature._units["°F"]
+        assert temperature.si_value == Temperature("20 °F").si_value
+
+    def test_copy__custom_slots(self):
+        class Widgets(base.AbstractMeasure):
+            __slots__ = ("label", "note")
+            widget = Unit("1")
+
+        widgets = Widgets(widget=1)
+        widgets.label = "foo"
+        copied = copy.copy(widgets)
+        assert copied == widgets
+        assert copied.label == "foo"
+        assert not hasattr(copied, "note")
+
+    def test_slots__custom(self):
+        class Widgets(base.AbstractMeasure):
+            __slots__ = ("label",)
+            widget = Unit("1")
+
+        widgets = Widgets(widget=1)
+        widgets.label = "foo"
+        assert widgets.label == "foo"
+        assert widgets.widget == 1
+
+    def test_base_unit_names(self):
+        assert Distance("1 km").base_unit_names == Distance.get_index().base_unit_names
+
+    def test_threads(self):
+        symbols = ["m", "km", "mi", "ft", "metre", "Kilometre", "hectometer"]
+
+        def work(i):
+            symbol = symbols[i % len(symbols)]
+            measure = Distance(i, symbol)
+            assert measure.symbol == symbol
+            assert str(measure) == f"{i} {symbol}"
+            assert f"{measure:.1f}" == f"{i}.0 {symbol}"
+            assert str(measure * 2) == f"{i * 2} {symbol}"
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(work, range(10000)))
+        finally:
+            sys.setswitchinterval(interval)
+
     def test_getitem(self):
         assert Distance("1 km")["m"] == decimal.Decimal("1000")
         with pytest.raises(KeyError) as e:
@@ -164,11 +1119,51 @@ class TestAbstractMeasure:
             str(e.value) == f"can't multiply type '{qualname(self.measure)}' and 'str'"
         )
 
+    def test_mul__raise__non_decimal_result(self):
+        class Half(numbers.Number):
+            def __rmul__(self, other):
+                return float(other) / 2
+
+            __rtruediv__ = __rmul__
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with pytest.raises(TypeError) as e:
+                Distance("1 m") * Half()
+            assert (
+                str(e.value) == f"can't multiply type 'Distance' and '{qualname(Half)}'"
+            )
+            with pytest.raises(TypeError) as e:
+                Distance("1 m") / Half()
+            assert str(e.value) == f"can't divide type 'Distance' by '{qualname(Half)}'"
+
     def test_mul__raise_for_same_type(self):
         with pytest.raises(TypeError) as e:
             Mass("1 kg") * Mass("1 kg")
         assert str(e.value) == "can't multiply type 'Mass' and 'Mass'"
 
+    def test_mul__measure(self):
+        assert Speed("2 m/s") * Time("3 s") == Distance("6 m")
+        assert Time("3 s") * Speed("2 m/s") == Distance("6 m")
+        assert repr(Speed("2 m/s") * Time("3 min")) == 'Distance(metre="360")'
+
+    def test_mul__measure_float(self):
+        distance = Speed.float(2, "m/s") * Time("3 s")
+        assert distance.si_value == 6.0
+
+    def test_mul__measure_context(self):
+        class AreaMoment(base.AbstractMeasure):
+            __dimension__ = base.Dimension(length=4)
+            decimal_context = decimal.Context(prec=3)
+
+            metre4 = Unit("1", ["m⁴"])
+
+        try:
+            assert Area("1.2345 m²") * Area("1 m²") == AreaMoment("1.23 m⁴")
+        finally:
+            del AreaMoment
+            gc.collect()
+
     def test_imul(self):
         d = self.measure(**{self.unit: 2})
         d *= 2
@@ -190,6 +1185,15 @@ class TestAbstractMeasure:
             self.measure(**{self.unit: 2}) / "not-allowed"
         assert str(e.value) == f"can't divide type '{qualname(self.measure)}' by 'str'"
 
+    def test_truediv__measure(self):
+        assert Distance("6 m") / Time("3 s") == Speed("2 m/s")
+        assert Distance("6 m") / Speed("2 m/s") == Time("3 s")
+
+    def test_truediv__raise_for_measure(self):
+        with pytest.raises(TypeError) as e:
+            Speed("1 m/s") / Distance("1 m")
+        assert str(e.value) == "can't divide type 'Speed' by 'Distance'"
+
     def test_itruediv(self):
         d = self.measure(**{self.unit: 2})
         d /= 2
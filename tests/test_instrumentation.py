@@ -0,0 +1,132 @@
+import pytest
+
+from measurement import instrumentation
+from measurement.base import AbstractMeasure, MetricUnit, Unit, UnitRegistry
+from measurement.measures import Area, Distance, Temperature, Time
+from measurement.utils import guess, guess_report
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled():
+    init = AbstractMeasure.__init__
+    from_si = AbstractMeasure.__dict__["_from_si"]
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert AbstractMeasure.__init__ is not init
+    instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert AbstractMeasure.__init__ is init
+    assert AbstractMeasure.__dict__["_from_si"] is from_si
+    assert not hasattr(Temperature.__add__, "__wrapped__")
+    assert "__missing__" in vars(UnitRegistry)
+    Distance("1 m")
+    assert instrumentation.snapshot() == {}
+
+
+@pytest.mark.usefixtures("enabled")
+def test_snapshot():
+    distance = Distance("1 km")
+    assert distance.mi
+    assert distance["ft"]
+    distance = distance + distance * 2 - distance / 2
+    Distance.float(1, "m")
+
+    stats = instrumentation.snapshot()
+    assert stats["init", Distance].count == 1
+    assert stats["init", Distance].time > 0
+    assert stats["getattr", Distance].count == 1
+    assert stats["getitem", Distance].count == 1
+    assert stats["add", Distance].count == 1
+    assert stats["sub", Distance].count == 1
+    assert stats["mul", Distance].count == 1
+    assert stats["truediv", Distance].count == 1
+    assert stats["from_si", Distance].count == 5
+
+
+@pytest.mark.usefixtures("enabled")
+def test_snapshot__overrides():
+    temperature = Temperature("20 °C")
+    assert temperature + (temperature - Temperature("10 °C"))
+
+    stats = instrumentation.snapshot()
+    assert stats["add", Temperature].count == 1
+    assert stats["sub", Temperature].count == 1
+
+
+def test_snapshot__new_measure():
+    instrumentation.enable()
+    try:
+
+        class Length(AbstractMeasure):
+            length_unit = Unit("1", ["lu"])
+
+            def __add__(self, other):
+                return super().__add__(other)
+
+        Length("1 lu") + Length("2 lu")
+        assert instrumentation.snapshot()["add", Length].count == 1
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+    assert not hasattr(Length.__add__, "__wrapped__")
+
+
+@pytest.mark.usefixtures("enabled")
+def test_snapshot__registry_miss():
+    class Length(AbstractMeasure):
+        length_unit = MetricUnit("1", ["lu"], ["lu"])
+
+    Length("1 lu")
+    Length("1 klu")
+    Length("2 klu")
+    with pytest.raises(KeyError):
+        Length("1 does-not-exist")
+    assert instrumentation.snapshot()["registry_miss", Length].count == 2
+
+
+@pytest.mark.usefixtures("enabled")
+def test_snapshot__guess():
+    guess(1, "ha")
+    guess(2, "ha")
+    with pytest.raises(ValueError):
+        guess(1, "does-not-exist")
+
+    stats = instrumentation.snapshot()
+    assert stats["guess", Area].count == 2
+    assert ("guess", Time) not in stats
+    assert stats["guess", None].count == 1
+
+    guess_report(["ha"])
+    stats = instrumentation.snapshot()
+    assert stats["guess", Area].count == 3
+    assert stats["guess", Time].count == 1
+
+
+@pytest.mark.usefixtures("enabled")
+def test_reset():
+    Distance("1 m")
+    assert instrumentation.snapshot()
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
+
+
+def test_hook():
+    events = []
+    instrumentation.enable(lambda *args: events.append(args))
+    try:
+        Distance("1 m")
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+    [(event, measure, duration)] = events
+    assert event == "init"
+    assert measure is Distance
+    assert duration > 0
@@ -0,0 +1,88 @@
+import concurrent.futures
+import decimal
+import itertools
+
+import pytest
+
+from measurement import parallel
+from measurement.measures import Distance, Temperature
+
+
+@pytest.fixture
+def executor():
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_convert(executor):
+    values = [decimal.Decimal(i) for i in range(25)]
+    converted = parallel.convert(
+        values, Distance, "mi", "km", chunksize=4, executor=executor
+    )
+    assert list(converted) == [Distance(value, "mi").km for value in values]
+
+
+def test_convert__process_pool():
+    converted = parallel.convert([32.0, 212.0, "100"], Temperature, "°F", "°C")
+    assert list(converted) == [
+        pytest.approx(0),
+        pytest.approx(100),
+        Temperature("100 °F").celsius,
+    ]
+
+
+def test_convert__units(executor):
+    converted = parallel.convert(
+        [1, 2], Distance, "km", ["m", "mi"], chunksize=1, executor=executor
+    )
+    assert list(converted) == [
+        (Distance("1 km").m, Distance("1 km").mi),
+        (Distance("2 km").m, Distance("2 km").mi),
+    ]
+
+
+def test_convert__iterable(executor):
+    values = (float(i) for i in itertools.count())
+    converted = parallel.convert(values, Distance, "km", "m", executor=executor)
+    assert list(itertools.islice(converted, 3)) == [0.0, 1000.0, 2000.0]
+    converted.close()
+
+
+def test_convert__empty(executor):
+    assert list(parallel.convert([], Distance, "km", "m", executor=executor)) == []
+
+
+def test_convert__key_error():
+    with pytest.raises(KeyError):
+        next(parallel.convert([1], Distance, "km", "does-not-exist"))
+
+
+def test_convert_chunks(executor):
+    chunks = parallel.convert_chunks(
+        range(10), Distance, "km", "m", chunksize=4, executor=executor
+    )
+    assert list(chunks) == [
+        (0, [decimal.Decimal(i * 1000) for i in range(4)]),
+        (4, [decimal.Decimal(i * 1000) for i in range(4, 8)]),
+        (8, [decimal.Decimal(i * 1000) for i in range(8, 10)]),
+    ]
+
+
+def test_convert_chunks__unordered(executor):
+    chunks = parallel.convert_chunks(
+        list(range(100)),
+        Distance,
+        "km",
+        "m",
+        chunksize=7,
+        executor=executor,
+        ordered=False,
+    )
+    converted = dict(chunks)
+    assert sorted(converted) == list(range(0, 100, 7))
+    assert converted[98] == [98000, 99000]
+
+
+def test_convert_chunks__chunksize():
+    with pytest.raises(ValueError):
+        next(parallel.convert_chunks([1], Distance, "km", "m", chunksize=0))
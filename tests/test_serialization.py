@@ -0,0 +1,89 @@
+import decimal
+import pickle  # nosec
+
+import pytest
+
+from measurement import serialization
+from measurement.base import AbstractMeasure, Unit
+from measurement.measures import Distance, Speed, Temperature
+
+
+def test_dumps_many():
+    measures = [
+        Distance("1.50 km"),
+        Distance("2 mi"),
+        Distance("-0 km"),
+        Distance(decimal.Decimal("1E-30"), "m"),
+        Distance("NaN m"),
+    ]
+    data = serialization.dumps_many(measures)
+    assert len(data) < len(pickle.dumps(measures))
+    loaded = serialization.loads_many(data)
+    assert [str(m) for m in loaded] == [str(m) for m in measures]
+    assert [m.si_value.as_tuple() for m in loaded] == [
+        m.si_value.as_tuple() for m in measures
+    ]
+    assert loaded[0].unit is measures[0].unit
+
+
+def test_dumps_many__float():
+    measures = [Distance.float(1 / 3, "km"), Distance.float(float("inf"), "mi")]
+    loaded = serialization.loads_many(serialization.dumps_many(iter(measures)))
+    assert loaded == measures
+    assert [m.symbol for m in loaded] == ["km", "mi"]
+    assert type(loaded[0].si_value) is float
+
+
+def test_dumps_many__compound_and_affine_units():
+    for measures in [
+        [Speed("3 km/h"), Speed("1 m/s")],
+        [Temperature("20 °C"), Temperature("70 °F")],
+    ]:
+        loaded = serialization.loads_many(serialization.dumps_many(measures))
+        assert [str(m) for m in loaded] == [str(m) for m in measures]
+
+
+def test_dumps_many__many_symbols():
+    symbols = [f"{prefix}m" for prefix in ["", "k", "c", "m", "µ", "n"]]
+    measures = [Distance(i, symbols[i % len(symbols)]) for i in range(300)]
+    loaded = serialization.loads_many(serialization.dumps_many(measures))
+    assert [str(m) for m in loaded] == [str(m) for m in measures]
+
+
+def test_dumps_many__empty():
+    assert serialization.loads_many(serialization.dumps_many([])) == []
+
+
+def test_dumps_many__mixed_types():
+    with pytest.raises(TypeError, match="expected type 'Distance' not 'Speed'"):
+        serialization.dumps_many([Distance("1 m"), Speed("1 m/s")])
+    with pytest.raises(TypeError, match="expected SI value of type 'float'"):
+        serialization.dumps_many([Distance.float(1, "m"), Distance("1 m")])
+
+
+def test_dumps_many__local_measure():
+    class Widgets(AbstractMeasure):
+        widget = Unit("1")
+
+    with pytest.raises(ValueError, match="can't import measure '.*Widgets'"):
+        serialization.dumps_many([Widgets(widget=1)])
+
+
+def test_loads_many__invalid():
+    data = serialization.dumps_many([Distance("1 m"), Distance("2 m")])
+    with pytest.raises(ValueError, match="not a batch of measures"):
+        serialization.loads_many(b"MEA")
+    with pytest.raises(ValueError, match="not a batch of measures"):
+        serialization.loads_many(pickle.dumps(Distance("1 m")))
+    with pytest.raises(ValueError, match="not a batch of measures"):
+        serialization.loads_many(data[:12])
+    with pytest.raises(ValueError, match="unsupported batch format version 2"):
+        serialization.loads_many(data[:4] + b"\x02" + data[5:])
+    with pytest.raises(ValueError, match="data is truncated"):
+        serialization.loads_many(data[:-2])
+
+
+def test_loads_many__not_a_measure():
+    data = b"MEAS\x01d\x01\x00\x00\x00\x0f\x00decimal:Decimal\x01\x00\x01\x00m\x00\x01"
+    with pytest.raises(ValueError, match="'decimal:Decimal' is not a measure"):
+        serialization.loads_many(data)
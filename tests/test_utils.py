@@ -1,7 +1,14 @@
+import decimal
+import subprocess
+import sys
+
 import pytest
 
-from measurement.measures import Distance, Mass, Temperature
-from measurement.utils import guess
+import measurement
+from measurement import max, mean, min, sum
+from measurement.base import AbstractMeasure, Unit
+from measurement.measures import Area, Distance, Mass, Pressure, Temperature, Time
+from measurement.utils import ambiguities, guess, guess_many, guess_report
 
 
 def test_guess_weight():
@@ -20,3 +27,227 @@ def test_guess__raise__value_error():
     with pytest.raises(ValueError) as e:
         guess(98, "does-not-exist")
     assert str(e.value) == "can't guess measure for '98 does-not-exist'"
+
+
+def test_guess__ambiguous():
+    assert type(guess(1, "ha")) is Area
+    assert type(guess(1, "pa")) is Time
+    assert type(guess(1, "ua")) is Distance
+
+
+def test_guess__measures():
+    assert guess(1, "m", [Mass, Distance]) == Distance(m=1)
+    with pytest.raises(ValueError):
+        guess(1, "m", [Mass])
+
+
+def test_guess__lazy_import():
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from measurement.utils import guess;"
+            "print(*sorted(m for m in sys.modules if m.startswith('measurement.m')))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert modules == []
+
+
+def test_guess__lazy_modules():
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from measurement.utils import guess; guess(1, 'km');"
+            "print(*sorted(m for m in sys.modules if m.startswith('measurement.m')))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert modules == [
+        "measurement.measures",
+        "measurement.measures.electromagnetism",
+        "measurement.measures.energy",
+        "measurement.measures.geometry",
+    ]
+
+
+def test_guess__prefer_measures():
+    assert type(guess(1, "ha", [Time, Area], prefer=[Mass, Area])) is Area
+    assert type(guess(1, "ha", [Time], prefer=[Area])) is Time
+
+
+def test_guess__custom_measure():
+    class Widgets(AbstractMeasure):
+        widget = Unit("1", ["wdg"])
+
+    assert guess(3, "wdg") == Widgets(wdg=3)
+
+
+def test_guess__indirect_subclass():
+    class Widgets(AbstractMeasure):
+        widget = Unit("1", ["wdg"])
+
+    class Gadgets(Widgets):
+        gadget = Unit("1", ["gdg"])
+
+    assert guess(3, "gdg") == Gadgets(gdg=3)
+
+
+def test_guess_many():
+    measures = guess_many([(1, "km"), (2, "g"), ("3", "km"), (4, "°F")])
+    assert measures == [
+        Distance(km=1),
+        Mass(g=2),
+        Distance(km=3),
+        Temperature(fahrenheit=4),
+    ]
+    assert guess_many([]) == []
+
+
+def test_guess_many__measures():
+    assert guess_many([(1, "m")], [Mass, Distance]) == [Distance(m=1)]
+
+
+def test_guess_many__raise__value_error():
+    with pytest.raises(ValueError) as e:
+        guess_many([(1, "km"), (98, "does-not-exist")])
+    assert str(e.value) == "can't guess measure for '98 does-not-exist'"
+
+
+def test_guess__prefer():
+    assert type(guess(1, "ha", prefer=[Time])) is Time
+    assert type(guess(1, "ha", prefer=[Mass, Time, Area])) is Time
+    assert type(guess(1, "km", prefer=[Time])) is Distance
+
+
+def test_guess_many__prefer():
+    measures = guess_many([(1, "pa"), (2, "ha")], prefer=[Pressure])
+    assert [type(m) for m in measures] == [Pressure, Area]
+
+
+def test_guess_report():
+    report = guess_report(["km", "ha", "does-not-exist", "km"])
+    assert list(report) == ["km", "ha", "does-not-exist"]
+    assert report["km"].measure is Distance
+    assert report["km"].candidates == (Distance,)
+    assert not report["km"].ambiguous
+    assert report["ha"].measure is Area
+    assert report["ha"].candidates == (Area, Time)
+    assert report["ha"].ambiguous
+    assert report["does-not-exist"].measure is None
+    assert report["does-not-exist"].candidates == ()
+
+
+def test_guess_report__measures_and_prefer():
+    report = guess_report(["ha", "m"], measures=[Time, Area], prefer=[Area])
+    assert report["ha"].candidates == (Area, Time)
+    assert report["m"].candidates == ()
+
+
+def test_ambiguities():
+    table = ambiguities()
+    assert table["ha"] == (Area, Time)
+    assert table["pa"] == (Time, Pressure)
+    assert table["ua"] == (Distance, Time)
+    assert "km" not in table
+
+
+def test_ambiguities__custom_measure():
+    class Acres(AbstractMeasure):
+        hectare = Unit("1", ["ha"])
+
+    assert ambiguities()["ha"] == (Area, Time, Acres)
+
+
+class TestReductions:
+    def test_sum(self):
+        result = sum([Distance("1 km"), Distance("500 m"), Distance("1 mi")])
+        assert result == Distance("1 km") + Distance("500 m") + Distance("1 mi")
+        assert result.symbol == "km"
+        assert isinstance(result.si_value, decimal.Decimal)
+
+    def test_sum__unit(self):
+        result = sum([Distance("1 km"), Distance("500 m")], "m")
+        assert result.symbol == "m"
+        assert result.m == 1500
+
+    def test_sum__float(self):
+        result = sum([Distance.float(1, "km"), Distance("500 m")])
+        assert result.si_value == 1500.0
+        assert isinstance(result.si_value, float)
+
+    def test_sum__compensated(self):
+        distances = [Distance.float(0.1, "m")] * 10
+        assert sum(distances).m != 1.0
+        assert sum(distances, compensated=True).m == 1.0
+
+    def test_sum__compensated_decimal(self):
+        distances = [Distance("1E+30 m"), Distance("1 m"), Distance("-1E+30 m")]
+        assert sum(distances).m == 0
+        assert sum(distances, compensated=True).m == 1
+
+    def test_sum__key(self):
+        result = sum([Distance("1 m"), Mass("1 g"), Distance("2 m")], key=type)
+        assert result == {Distance: Distance("3 m"), Mass: Mass("1 g")}
+        assert sum([], key=type) == {}
+
+    def test_sum__type_error(self):
+        with pytest.raises(TypeError) as e:
+            sum([Distance("1 m"), Mass("1 g")])
+        assert str(e.value) == "expected type 'Distance' not 'Mass'"
+
+    def test_sum__value_error(self):
+        with pytest.raises(ValueError) as e:
+            sum([])
+        assert str(e.value) == "sum() arg is an empty iterable"
+
+    def test_sum__key_error(self):
+        with pytest.raises(KeyError):
+            sum([Distance("1 m")], "does_not_exist")
+
+    def test_sum__iterator(self):
+        assert sum(Distance(m=i) for i in range(5)) == Distance("10 m")
+
+    def test_mean(self):
+        result = mean([Distance("1 km"), Distance("500 m")], "m")
+        assert result.m == 750
+        assert mean([Distance.float(1, "m"), Distance.float(2, "m")]).m == 1.5
+        assert mean([Distance("1 m"), Mass("2 g"), Mass("4 g")], key=type) == {
+            Distance: Distance("1 m"),
+            Mass: Mass("3 g"),
+        }
+
+    def test_min(self):
+        distances = [Distance("1 km"), Distance("500 m"), Distance("1 mi")]
+        assert min(distances) is distances[1]
+        result = min(distances, "km")
+        assert result.symbol == "km"
+        assert result.km == decimal.Decimal("0.5")
+
+    def test_max(self):
+        distances = [Distance("1 km"), Distance("500 m"), Distance("1 mi")]
+        assert max(distances) is distances[2]
+        assert max(distances, "m").m == decimal.Decimal("1609.344")
+        assert max(distances[:2], key=type) == {Distance: Distance("1 km")}
+
+    def test_max__value_error(self):
+        with pytest.raises(ValueError) as e:
+            max([])
+        assert str(e.value) == "max() arg is an empty iterable"
+
+    def test_package(self):
+        assert measurement.sum is sum
+        assert measurement.mean is mean
+        assert measurement.min is min
+        assert measurement.max is max
+
+    def test_package__star_import(self):
+        namespace = {}
+        exec("from measurement import *", namespace)  # nosec
+        assert "mean" in namespace
+        assert not {"sum", "min", "max"} & set(namespace)